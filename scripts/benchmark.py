@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+KMS 검증 도구 벤치마크
+
+짧게 실행되는 CLI와 워커 프로세스의 비용을 측정한다.
+- import: 모듈별 import 시간 (python -X importtime)
+- resolve: 질의 → 문서 해석 처리량 (scale배 생성 그래프)
+- expand: 관련 문서 k-hop 확장 p50/p99 지연시간
+- suite: 생성/직렬화/검증/로드/질의/템플릿을 1×~1000× 규모로 측정 (시간, 처리량, peak RSS)
+- compare: 두 suite 결과 JSON 비교 (회귀 기준 초과 시 종료코드 1)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 측정 대상 (scripts/ 의 프로젝트 모듈)
+PROJECT_MODULES = [
+    "taxonomy", "ontology", "doc_templates",
+    "simulator", "simulator_ontology", "verifier", "ontology_validator",
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# import 시간
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _parse_importtime(stderr: str) -> dict:
+    """-X importtime 출력 → {모듈명: cumulative(us)}"""
+    result = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self [us] | cumulative | imported package"
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        result[name.strip()] = int(cumulative_us)
+    return result
+
+
+def measure_import_time(module: str, repeat: int = 5) -> dict:
+    """새 인터프리터에서 `import module`을 repeat회 실행하여 cumulative 시간 측정"""
+    samples = []
+    loaded = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=SCRIPTS_DIR, capture_output=True, text=True, check=True,
+        )
+        times = _parse_importtime(proc.stderr)
+        samples.append(times.get(module, 0) / 1000)
+        loaded = [m for m in PROJECT_MODULES if m in times]
+
+    return {
+        "module": module,
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "loaded_modules": loaded,
+    }
+
+
+def bench_import(modules: list, repeat: int) -> list:
+    results = []
+    for module in modules:
+        r = measure_import_time(module, repeat)
+        results.append(r)
+        print(f"  {module:<20} median {r['median_ms']:>8.2f}ms  "
+              f"(min {r['min_ms']:.2f}, max {r['max_ms']:.2f})  "
+              f"← {', '.join(r['loaded_modules'])}")
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 질의 해석 처리량
+# ═══════════════════════════════════════════════════════════════════════════════
+
+RESOLVE_QUERIES = [
+    "삼성생명 종신 수수료",
+    "한화생명 암보험 약관",
+    "DB손보 실손 심사기준",
+    "현대해상 자동차보험 상품설명서",
+    "교보 CI 보험료표",
+    "메리츠 시책",
+    "1200%룰 분급제",
+    "고지의무 청약서",
+    "신입 교육",
+    "컴플라이언스",
+]
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def bench_resolve(scale: int, repeat: int, limit: int) -> dict:
+    from simulator import generate_graph_data
+    from query_resolver import QueryResolver
+
+    t0 = time.perf_counter()
+    graph = generate_graph_data(scale=scale)
+    gen_s = time.perf_counter() - t0
+    doc_count = graph["stats"]["documents"]
+    print(f"  그래프 생성: 문서 {doc_count:,}건 ({gen_s:.2f}s)")
+
+    t0 = time.perf_counter()
+    resolver = QueryResolver.from_graph(graph)
+    index_s = time.perf_counter() - t0
+    print(f"  색인 구축: 문서 {len(resolver.index):,}건, "
+          f"ACTIVE 경로 {resolver.index.active_path_count:,}개 ({index_s:.2f}s)")
+
+    for q in RESOLVE_QUERIES:  # 매처 컴파일 + 워밍업
+        resolver.resolve(q, limit=limit)
+
+    latencies = []
+    hits = 0
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for q in RESOLVE_QUERIES:
+            q0 = time.perf_counter()
+            hits += len(resolver.resolve(q, limit=limit).doc_ids)
+            latencies.append(time.perf_counter() - q0)
+    total_s = time.perf_counter() - t0
+
+    latencies.sort()
+    result = {
+        "scale": scale,
+        "documents": doc_count,
+        "queries": len(latencies),
+        "qps": round(len(latencies) / total_s, 1) if total_s else 0,
+        "p50_us": round(_percentile(latencies, 50) * 1e6, 1),
+        "p99_us": round(_percentile(latencies, 99) * 1e6, 1),
+        "avg_hits": round(hits / len(latencies), 1) if latencies else 0,
+        "index_build_s": round(index_s, 3),
+    }
+    print(f"  처리량: {result['qps']:,} queries/s "
+          f"(p50 {result['p50_us']}us, p99 {result['p99_us']}us, 평균 {result['avg_hits']}건)")
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# k-hop 확장 지연시간
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def bench_expand(scale: int, queries: int, depth: int, fanout: int, seed: int) -> dict:
+    import random
+    from simulator import generate_graph_data
+    from graph_traversal import CompactGraph, expand
+
+    t0 = time.perf_counter()
+    graph_data = generate_graph_data(scale=scale)
+    gen_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    graph = CompactGraph.from_graph_data(graph_data)
+    build_s = time.perf_counter() - t0
+    print(f"  그래프 생성: 노드 {len(graph):,}개, 엣지 {graph.edge_count:,}개 ({gen_s:.2f}s)")
+    print(f"  CSR 구축: {build_s:.2f}s")
+
+    doc_ids = [n["id"] for n in graph_data["graph_data"]["nodes"] if "Document" in n.get("labels", [])]
+    del graph_data
+    seeds = random.Random(seed).choices(doc_ids, k=queries)
+    limit = fanout or None
+
+    latencies = []
+    reached = 0
+    for doc_id in seeds:
+        q0 = time.perf_counter()
+        reached += len(expand(graph, [doc_id], depth=depth, fanout=limit))
+        latencies.append(time.perf_counter() - q0)
+
+    latencies.sort()
+    result = {
+        "scale": scale,
+        "nodes": len(graph),
+        "edges": graph.edge_count,
+        "depth": depth,
+        "fanout": limit,
+        "queries": len(latencies),
+        "p50_us": round(_percentile(latencies, 50) * 1e6, 1),
+        "p99_us": round(_percentile(latencies, 99) * 1e6, 1),
+        "avg_reached": round(reached / len(latencies), 1) if latencies else 0,
+        "csr_build_s": round(build_s, 3),
+    }
+    print(f"  {depth}-hop 확장: p50 {result['p50_us']}us, p99 {result['p99_us']}us "
+          f"(평균 {result['avg_reached']}개 노드)")
+    return result
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 규모별 스위트 (1× / 10× / 100× / 1000×)
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# 항목마다 새 프로세스에서 실행하여 peak RSS가 항목별로 분리되도록 한다.
+# 각 _setup_* 은 준비(측정 제외)를 마치고 측정할 0-인자 함수를 반환하며,
+# 그 함수는 처리 항목 수(노드+엣지, 호출 수 등)를 반환한다.
+
+SUITE_SCALES = [1, 10, 100, 1000]
+DEFAULT_THRESHOLD = 0.20  # 20% 이상 느려지거나 커지면 회귀
+
+
+def _quiet(func):
+    """측정 대상의 진행 출력은 버림"""
+    def run():
+        import contextlib
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            return func()
+    return run
+
+
+def _write_json(path: str, data: dict) -> None:
+    from serialization import dump_json
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    dump_json(data, path)
+
+
+def _graph_size(graph: dict) -> int:
+    gd = graph["graph_data"]
+    return len(gd["nodes"]) + len(gd["edges"])
+
+
+def _setup_generate_graph(scale: int, workdir: str):
+    from simulator import generate_graph_data
+    return lambda: _graph_size(generate_graph_data(scale=scale))
+
+
+def _setup_generate_ontology(scale: int, workdir: str):
+    from simulator_ontology import generate_ontology_graph
+    return lambda: _graph_size(generate_ontology_graph(scale=scale))
+
+
+def _setup_sample_files(scale: int, workdir: str):
+    from simulator import generate_sample_files
+    return lambda: generate_sample_files(workdir, scale=scale)
+
+
+def _setup_graph_dump(scale: int, workdir: str):
+    from simulator import generate_graph_data
+
+    graph = generate_graph_data(scale=scale)
+    size = _graph_size(graph)
+    path = os.path.join(workdir, "data", "knowledge-graph.json")
+
+    def run():
+        _write_json(path, graph)
+        return size
+    return run
+
+
+def _setup_graph_load(scale: int, workdir: str):
+    from simulator import generate_graph_data
+    from serialization import load_json
+
+    graph = generate_graph_data(scale=scale)
+    size = _graph_size(graph)
+    path = os.path.join(workdir, "data", "knowledge-graph.json")
+    _write_json(path, graph)
+    del graph
+
+    def run():
+        load_json(path)
+        return size
+    return run
+
+
+def _setup_verifier(scale: int, workdir: str):
+    from simulator import generate_graph_data
+    from verifier import FrameworkVerifier
+
+    graph = generate_graph_data(scale=scale)
+    size = _graph_size(graph)
+    _write_json(os.path.join(workdir, "data", "knowledge-graph.json"), graph)
+    del graph
+
+    def run():
+        FrameworkVerifier(workdir, trace_memory=False).run_all()
+        return size
+    return _quiet(run)
+
+
+def _write_ontology(scale: int, workdir: str) -> str:
+    from simulator_ontology import generate_ontology_graph
+
+    path = os.path.join(workdir, "data", "knowledge-graph-ontology.json")
+    _write_json(path, generate_ontology_graph(scale=scale))
+    return path
+
+
+def _setup_ontology_load(scale: int, workdir: str):
+    from ontology_validator import OntologyGraph
+
+    path = _write_ontology(scale, workdir)
+
+    def run():
+        g = OntologyGraph(path)
+        return len(g.nodes) + len(g.edges)
+    return _quiet(run)
+
+
+def _setup_ontology_queries(scale: int, workdir: str):
+    from ontology_validator import OntologyGraph
+
+    path = _write_ontology(scale, workdir)
+    g = _quiet(lambda: OntologyGraph(path))()
+    labels = ["Document", "Concept", "Process", "Regulation", "Carrier", "Product"]
+    classes = ["ga:DocumentType", "ga:Carrier", "ga:Product", "ga:Concept"]
+
+    def run():
+        calls = 0
+        for label in labels:
+            g.nodes_by_label(label)
+            g.count_by_label(label)
+            calls += 2
+        for cls in classes:
+            g.nodes_by_type_hierarchy(cls)
+            calls += 1
+        for doc in g.documents():
+            g.outgoing(doc.id, "USED_IN")
+            g.incoming(doc.id)
+            calls += 2
+        return calls
+    return run
+
+
+def _setup_templates(scale: int, workdir: str):
+    from taxonomy import DOC_TYPES
+    from doc_templates import get_template
+
+    def run():
+        calls = 0
+        for _ in range(scale):
+            for doc_type_id in DOC_TYPES:
+                get_template(doc_type_id, "삼성생명", "종신보험")
+                calls += 1
+        return calls
+    return run
+
+
+SUITE_CASES = {
+    "generate_graph_data": _setup_generate_graph,
+    "generate_ontology_graph": _setup_generate_ontology,
+    "generate_sample_files": _setup_sample_files,
+    "graph_dump": _setup_graph_dump,
+    "graph_load": _setup_graph_load,
+    "verifier_run_all": _setup_verifier,
+    "ontology_load": _setup_ontology_load,
+    "ontology_queries": _setup_ontology_queries,
+    "get_template": _setup_templates,
+}
+
+
+def _peak_rss_kb() -> int:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # macOS는 bytes
+
+
+def run_case(case: str, scale: int) -> dict:
+    """(자식 프로세스에서) 항목 하나 측정"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="kms-bench-") as workdir:
+        func = SUITE_CASES[case](scale, workdir)
+        setup_rss = _peak_rss_kb()
+        t0 = time.perf_counter()
+        items = func()
+        wall = time.perf_counter() - t0
+    return {
+        "case": case,
+        "scale": scale,
+        "wall_s": round(wall, 4),
+        "items": items,
+        "items_per_s": round(items / wall, 1) if wall > 0 else 0,
+        "peak_rss_kb": _peak_rss_kb(),
+        "setup_rss_kb": setup_rss,
+    }
+
+
+def bench_suite(cases: list, scales: list, timeout: int) -> list:
+    results = []
+    for scale in scales:
+        for case in cases:
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "_case", case, "--scale", str(scale)],
+                cwd=SCRIPTS_DIR, capture_output=True, text=True, timeout=timeout,
+            )
+            if proc.returncode != 0:
+                err = (proc.stderr.strip().splitlines() or ["?"])[-1]
+                print(f"  ×{scale:<5} {case:<24} 실패: {err}")
+                results.append({"case": case, "scale": scale, "error": err})
+                continue
+            r = json.loads(proc.stdout.strip().splitlines()[-1])
+            results.append(r)
+            print(f"  ×{scale:<5} {case:<24} {r['wall_s']:>9.3f}s  {r['items_per_s']:>12,.0f} items/s  "
+                  f"peak RSS {r['peak_rss_kb'] / 1024:>8.1f}MB")
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _json_backend() -> str:
+    from serialization import BACKEND
+    return BACKEND
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list:
+    """같은 (case, scale)끼리 wall_s / peak_rss_kb 비교 → threshold 초과 증가 목록"""
+    before = {(r["case"], r["scale"]): r for r in baseline.get("results", []) if "error" not in r}
+    regressions = []
+    for r in current.get("results", []):
+        old = before.get((r["case"], r["scale"]))
+        if old is None or "error" in r:
+            continue
+        for metric in ("wall_s", "peak_rss_kb"):
+            if old[metric] and r[metric] / old[metric] - 1 > threshold:
+                regressions.append({
+                    "case": r["case"], "scale": r["scale"], "metric": metric,
+                    "baseline": old[metric], "current": r[metric],
+                    "change": round(r[metric] / old[metric] - 1, 3),
+                })
+    return regressions
+
+
+def print_regressions(regressions: list, threshold: float) -> None:
+    if not regressions:
+        print(f"\n  회귀 없음 (기준 +{threshold:.0%})")
+        return
+    print(f"\n  회귀 {len(regressions)}건 (기준 +{threshold:.0%}):")
+    for r in regressions:
+        print(f"    ×{r['scale']:<5} {r['case']:<24} {r['metric']:<12} "
+              f"{r['baseline']} → {r['current']} ({r['change']:+.0%})")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 메인
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="KMS 검증 도구 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="모듈 import 시간 (python -X importtime)")
+    p_import.add_argument("modules", nargs="*", default=PROJECT_MODULES)
+    p_import.add_argument("--repeat", type=int, default=5)
+    p_import.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+
+    p_resolve = sub.add_parser("resolve", help="질의 → 문서 해석 처리량")
+    p_resolve.add_argument("--scale", type=int, default=10)
+    p_resolve.add_argument("--repeat", type=int, default=200)
+    p_resolve.add_argument("--limit", type=int, default=50)
+    p_resolve.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+
+    p_expand = sub.add_parser("expand", help="k-hop 관련 문서 확장 지연시간 (기본 ×40 ≈ 엣지 100만)")
+    p_expand.add_argument("--scale", type=int, default=40)
+    p_expand.add_argument("--queries", type=int, default=2000)
+    p_expand.add_argument("--depth", type=int, default=2)
+    p_expand.add_argument("--fanout", type=int, default=0, help="노드당 hop별 최대 이웃 수 (0=무제한)")
+    p_expand.add_argument("--seed", type=int, default=42)
+    p_expand.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+
+    p_suite = sub.add_parser("suite", help="규모별 벤치마크 스위트")
+    p_suite.add_argument("--scales", default=",".join(map(str, SUITE_SCALES)),
+                         help="쉼표 구분 규모 (기본 1,10,100,1000)")
+    p_suite.add_argument("--cases", default=",".join(SUITE_CASES), help="쉼표 구분 측정 항목")
+    p_suite.add_argument("--timeout", type=int, default=3600, help="항목별 제한 시간(초)")
+    p_suite.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    p_suite.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    p_suite.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+
+    p_compare = sub.add_parser("compare", help="suite 결과 JSON 두 개 비교")
+    p_compare.add_argument("baseline")
+    p_compare.add_argument("current")
+    p_compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    p_case = sub.add_parser("_case")  # suite 내부용: 항목 하나를 측정하고 JSON 한 줄 출력
+    p_case.add_argument("case", choices=list(SUITE_CASES))
+    p_case.add_argument("--scale", type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.command == "_case":
+        print(json.dumps(run_case(args.case, args.scale)))
+        return 0
+
+    if args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold)
+        print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+
+    print("=" * 60)
+    print("KMS 벤치마크")
+    print("=" * 60)
+
+    if args.command == "import":
+        print(f"\n[import] python -X importtime × {args.repeat}")
+        results = bench_import(args.modules, args.repeat)
+    elif args.command == "resolve":
+        print(f"\n[resolve] scale ×{args.scale}, {len(RESOLVE_QUERIES)}개 질의 × {args.repeat}회")
+        results = bench_resolve(args.scale, args.repeat, args.limit)
+    elif args.command == "expand":
+        print(f"\n[expand] scale ×{args.scale}, {args.depth}-hop × {args.queries}회")
+        results = bench_expand(args.scale, args.queries, args.depth, args.fanout, args.seed)
+    elif args.command == "suite":
+        scales = [int(x) for x in args.scales.split(",") if x]
+        cases = [c for c in args.cases.split(",") if c]
+        print(f"\n[suite] scale {scales}, 항목 {len(cases)}개")
+        results = bench_suite(cases, scales, args.timeout)
+
+    output = {"command": args.command, "results": results}
+    if args.command == "suite":
+        output["meta"] = {
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "json_backend": _json_backend(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n  결과 저장: {args.json_path}")
+
+    if args.command == "suite" and args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, output, args.threshold)
+        print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,268 @@
+"""
+facet 비트맵 인덱스
+
+문서마다 행 번호를 부여하고, facet 값별로 "이 값을 가진 행" 비트맵을 만든다.
+비트맵은 Python int (임의 길이 정수)라서 AND/OR/NOT 이 C 레벨의 워드 단위 연산이다.
+
+    idx = BitmapIndex.from_documents(doc_nodes)
+    q = idx.eq("carrier", "INS-SAMSUNG") & idx.any_of("docType", ["DOC-TERMS", "DOC-GUIDE"]) & ~idx.eq("lifecycle", "ACTIVE")
+    q.count()      # 건수
+    q.ids()        # 문서 ID (행 순서 = 등록 순서)
+
+다중 facet 조건을 문서마다 dict로 확인하는 대신 비트 연산 몇 번으로 끝낸다.
+
+색인 저장은 값의 밀도에 따라 나뉜다 (질의 결과는 모두 Bitmap):
+- 전체 행의 1/SPARSE_RATIO 이상인 값 (lifecycle, domain 등): 비트맵 (행 수/8 바이트)
+- 그보다 드문 값 (carrier, product 등 고카디널리티 facet): 정렬 행 배열 (건당 4바이트)
+  → 색인 메모리는 값 개수 × 행 수가 아니라 O(행 수 × facet 수)
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+# 바이트 값 → 켜진 비트 위치 (ids() 디코딩용)
+_BYTE_BITS = [tuple(b for b in range(8) if v >> b & 1) for v in range(256)]
+
+SPARSE_RATIO = 32  # 비트맵 (행 수/8 바이트) 과 행 배열 (4바이트 × 건수) 의 손익분기
+ROW_TYPECODE = "I"
+
+Posting = Union[int, array]  # 비트맵 또는 정렬 행 배열
+
+
+def popcount(x: int) -> int:
+    try:
+        return x.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(x).count("1")
+
+
+def _bits_from_rows(rows: List[int], size: int) -> int:
+    """행 번호 목록 → 비트맵 (O(행 수 + size/8))"""
+    buf = bytearray((size + 7) // 8)
+    for r in rows:
+        buf[r >> 3] |= 1 << (r & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _posting(rows: List[int], size: int) -> Posting:
+    """정렬·중복 없는 행 목록 → 밀도가 1/SPARSE_RATIO 이상이면 비트맵, 아니면 행 배열"""
+    if len(rows) * SPARSE_RATIO >= size:
+        return _bits_from_rows(rows, size)
+    return array(ROW_TYPECODE, rows)
+
+
+def _bits(posting: Posting, size: int) -> int:
+    return posting if isinstance(posting, int) else _bits_from_rows(posting, size)
+
+
+def _count(posting: Posting) -> int:
+    return popcount(posting) if isinstance(posting, int) else len(posting)
+
+
+class Bitmap:
+    """행 집합. &, |, ^, ~ (전체 행 기준 여집합), - (차집합) 지원"""
+
+    __slots__ = ("bits", "index")
+
+    def __init__(self, bits: int, index: "BitmapIndex"):
+        self.bits = bits
+        self.index = index
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits & other.bits, self.index)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits | other.bits, self.index)
+
+    def __xor__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits ^ other.bits, self.index)
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits & ~other.bits, self.index)
+
+    def __invert__(self) -> "Bitmap":
+        return Bitmap(self.index.universe ^ self.bits, self.index)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def count(self) -> int:
+        return popcount(self.bits)
+
+    def rows(self) -> Iterator[int]:
+        """켜진 행 번호 (오름차순)"""
+        x = self.bits
+        if not x:
+            return
+        data = x.to_bytes((x.bit_length() + 7) // 8, "little")
+        for byte_no, byte in enumerate(data):
+            if byte:
+                base = byte_no << 3
+                for b in _BYTE_BITS[byte]:
+                    yield base + b
+
+    def ids(self) -> List[str]:
+        keys = self.index.keys
+        return [keys[r] for r in self.rows()]
+
+
+class BitmapIndex:
+    """facet 값별 비트맵 (드문 값은 정렬 행 배열). facet 값은 문자열 또는 (다중값이면) 리스트"""
+
+    def __init__(self):
+        self.keys: List[str] = []                 # 행 번호 → ID
+        self.row_of: Dict[str, int] = {}          # ID → 행 번호
+        self._postings: Dict[Tuple[str, str], Posting] = {}
+
+    @classmethod
+    def build(cls, records: Iterable[Tuple[str, dict]]) -> "BitmapIndex":
+        """(ID, {facet: 값}) 목록으로 일괄 구축 — 값별 행 목록을 모은 뒤 밀도에 맞는 형태로 한 번에 생성"""
+        index = cls()
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        for key, facets in records:
+            row = len(index.keys)
+            index.keys.append(key)
+            index.row_of[key] = row
+            for facet, value in facets.items():
+                for v in _values(value):
+                    rows = pending.setdefault((facet, v), [])
+                    if not rows or rows[-1] != row:  # 다중값 안의 중복
+                        rows.append(row)
+        size = len(index.keys)
+        for fv, rows in pending.items():
+            index._postings[fv] = _posting(rows, size)
+        return index
+
+    @classmethod
+    def from_documents(cls, doc_nodes: Iterable[dict]) -> "BitmapIndex":
+        """simulator 그래프 문서 노드 → carrier/product/docType/tier/lifecycle/domain 비트맵"""
+        return cls.build((n.get("id"), document_facets(n)) for n in doc_nodes)
+
+    def add(self, key: str, facets: dict) -> int:
+        """문서 1건 추가 (증분). 반환: 행 번호"""
+        row = len(self.keys)
+        self.keys.append(key)
+        self.row_of[key] = row
+        for facet, value in facets.items():
+            for v in _values(value):
+                self._set(facet, v, row, True)
+        return row
+
+    def set_value(self, key: str, facet: str, old_value: str, new_value: str) -> None:
+        """단일값 facet 변경 (예: lifecycle 전이)"""
+        row = self.row_of[key]
+        self._set(facet, old_value, row, False)
+        self._set(facet, new_value, row, True)
+
+    def _set(self, facet: str, value: str, row: int, on: bool) -> None:
+        """행 하나 켜기/끄기. 행 배열이 밀도 1/SPARSE_RATIO에 이르면 비트맵으로 바꾼다"""
+        fv = (facet, value)
+        posting = self._postings.get(fv)
+        if posting is None:
+            if on:
+                self._postings[fv] = array(ROW_TYPECODE, [row])
+        elif isinstance(posting, int):
+            self._postings[fv] = posting | (1 << row) if on else posting & ~(1 << row)
+        else:
+            i = bisect_left(posting, row)
+            present = i < len(posting) and posting[i] == row
+            if on and not present:
+                posting.insert(i, row)
+                if len(posting) * SPARSE_RATIO >= len(self.keys):
+                    self._postings[fv] = _bits_from_rows(posting, len(self.keys))
+            elif not on and present:
+                del posting[i]
+
+    # ── 질의 ──
+
+    @property
+    def universe(self) -> int:
+        return (1 << len(self.keys)) - 1
+
+    def all(self) -> Bitmap:
+        return Bitmap(self.universe, self)
+
+    def none(self) -> Bitmap:
+        return Bitmap(0, self)
+
+    def eq(self, facet: str, value: str) -> Bitmap:
+        posting = self._postings.get((facet, value))
+        return Bitmap(0 if posting is None else _bits(posting, len(self.keys)), self)
+
+    def any_of(self, facet: str, values: Iterable[str]) -> Bitmap:
+        bits, rows = 0, []
+        for v in values:
+            posting = self._postings.get((facet, v))
+            if isinstance(posting, int):
+                bits |= posting
+            elif posting is not None:
+                rows.extend(posting)
+        if rows:  # 드문 값들은 행을 모아 비트맵 한 번으로
+            bits |= _bits_from_rows(rows, len(self.keys))
+        return Bitmap(bits, self)
+
+    def where(self, **conditions) -> Bitmap:
+        """facet=값 (또는 값 목록) 조건의 AND"""
+        result = self.all()
+        for facet, value in conditions.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                result &= self.any_of(facet, value)
+            else:
+                result &= self.eq(facet, value)
+        return result
+
+    def values(self, facet: str) -> List[str]:
+        """facet의 값 목록 (처음 등장한 순서)"""
+        return [v for f, v in self._postings if f == facet]
+
+    def value_counts(self, facet: str, within: Bitmap = None) -> Dict[str, int]:
+        """facet 값별 건수 (within이 있으면 그 집합 안에서)"""
+        mask = within.bits if within is not None else None
+        inside = None  # within의 행 집합 (행 배열 값이 있을 때 한 번만 디코딩)
+        counts = {}
+        for (f, v), posting in self._postings.items():
+            if f != facet:
+                continue
+            if mask is None:
+                c = _count(posting)
+            elif isinstance(posting, int):
+                c = popcount(posting & mask)
+            else:
+                if inside is None:
+                    inside = set(within.rows())
+                c = sum(1 for r in posting if r in inside)
+            if c:
+                counts[v] = c
+        return counts
+
+    def memory_bytes(self) -> int:
+        """색인 본체 크기 (비트맵 + 행 배열 바이트, 키 목록 제외)"""
+        return sum((p.bit_length() + 7) // 8 if isinstance(p, int) else p.itemsize * len(p)
+                   for p in self._postings.values())
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def _values(value) -> Iterable[str]:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value
+    return (value,)
+
+
+def document_facets(node: dict) -> dict:
+    """simulator 문서 노드 → 비트맵 facet (누락 값은 "")"""
+    props = node.get("properties", {})
+    cls = props.get("classification", {})
+    return {
+        "domain": props.get("domain", ""),
+        "lifecycle": props.get("lifecycle", ""),
+        "tier": props.get("tier", ""),
+        "docType": cls.get("docType", ""),
+        "carrier": cls.get("carrier", ""),
+        "product": cls.get("product", ""),
+    }
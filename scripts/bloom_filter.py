@@ -0,0 +1,82 @@
+"""
+Bloom 필터 (문자열 멤버십, 고정 메모리)
+
+n개 원소와 목표 오탐률 p로 비트 수 m = -n·ln p / (ln 2)², 해시 수 k = (m/n)·ln 2 를 정한다.
+"없다"는 답은 항상 맞고, "있다"는 답은 확률 p로 틀린다 (없는 원소를 있다고 함).
+
+- 해시는 str 객체에 캐시되는 hash()를 h1, 그 splitmix64 혼합을 h2로 쓰는 이중 해싱 (h1 + i·h2)
+  (hash()는 프로세스마다 달라지므로 필터는 한 프로세스 안에서만 쓴다)
+- m은 2의 거듭제곱으로 올려 나머지 대신 비트 마스크
+- 1억 개 × p=0.01 → 약 114MB(2의 거듭제곱으로 128MB), p=0.001 → 약 171MB(256MB)
+
+    bloom = BloomFilter.for_capacity(len(ids), fp_rate=0.001)
+    bloom.add("DOC-..."); "DOC-..." in bloom
+"""
+
+import math
+from typing import Iterable
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(h: int) -> int:
+    """splitmix64 finalizer"""
+    h = (h + 0x9E3779B97F4A7C15) & _MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+class BloomFilter:
+    """bytearray 비트 배열 위의 Bloom 필터"""
+
+    __slots__ = ("bits", "hashes", "count", "_mask", "_array")
+
+    def __init__(self, bits: int, hashes: int):
+        self.bits = 1 << max(6, (bits - 1).bit_length())
+        self.hashes = max(1, hashes)
+        self.count = 0
+        self._mask = self.bits - 1
+        self._array = bytearray(self.bits >> 3)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float = 0.01) -> "BloomFilter":
+        """capacity개를 넣었을 때 오탐률이 fp_rate 이하가 되는 크기"""
+        if not 0 < fp_rate < 1:
+            raise ValueError(f"오탐률은 0과 1 사이여야 합니다: {fp_rate}")
+        capacity = max(1, capacity)
+        bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+        return cls(bits, round(bits / capacity * math.log(2)))
+
+    def add(self, item: str) -> None:
+        h1 = hash(item) & _MASK64
+        h2 = _mix(h1) | 1
+        array, mask = self._array, self._mask
+        for _ in range(self.hashes):
+            pos = h1 & mask
+            array[pos >> 3] |= 1 << (pos & 7)
+            h1 += h2
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        h1 = hash(item) & _MASK64
+        h2 = _mix(h1) | 1
+        array, mask = self._array, self._mask
+        for _ in range(self.hashes):
+            pos = h1 & mask
+            if not array[pos >> 3] & (1 << (pos & 7)):
+                return False
+            h1 += h2
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._array)
+
+    def expected_fp_rate(self) -> float:
+        """현재 원소 수 기준 이론 오탐률 (1 - e^(-k·n/m))^k"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
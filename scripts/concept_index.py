@@ -0,0 +1,203 @@
+"""
+개념 도달성 인덱스 (BROADER/NARROWER 폐포 + RELATED_TO 이웃)
+
+개념마다 행 번호를 부여하고 다음을 비트셋(Python int)으로 미리 계산한다.
+- 하위 개념 전체 (NARROWER 추이 폐포), 상위 개념 전체 (BROADER 추이 폐포)
+- 1-hop 이웃 (RELATED_TO + BROADER/NARROWER, 방향 무시) → k-hop은 요청 시 계산 후 캐시
+- 개념 → 설명 문서유형/문서 (related_docs / EXPLAINS), 하위 개념까지 합친 확장 결과도 캐시
+
+    idx = ConceptIndex.from_concepts()
+    idx.narrower("CONCEPT-GROSS-PREMIUM").ids()       # 모든 하위 개념
+    idx.is_narrower("CONCEPT-RISK-PREMIUM", "CONCEPT-GROSS-PREMIUM")
+    idx.related_within("CONCEPT-1200-RULE", "CONCEPT-CLAWBACK", hops=2)
+    idx.doc_types("CONCEPT-GROSS-PREMIUM")           # 질의 확장용 (O(1))
+
+개념 그래프는 CONCEPTS 정의(from_concepts) 또는 simulator_ontology 출력(from_graph_data)에서 만든다.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from ontology import CONCEPTS
+from bitmap_index import Bitmap, popcount
+
+NEIGHBOR_TYPES = ("RELATED_TO", "BROADER", "NARROWER")
+
+
+class ConceptIndex:
+    """개념 행 번호 + 폐포/이웃 비트셋 (Bitmap의 index로도 쓰인다)"""
+
+    def __init__(self, concept_ids: Iterable[str], edges: Iterable[Tuple[str, str, str]],
+                 explains: Dict[str, List[str]] = None, doc_types: Dict[str, List[str]] = None):
+        self.keys: List[str] = list(dict.fromkeys(concept_ids))
+        self.row_of: Dict[str, int] = {cid: i for i, cid in enumerate(self.keys)}
+        n = len(self.keys)
+
+        narrower_direct = [0] * n
+        neighbors = [0] * n
+        for src, tgt, rel_type in edges:
+            s, t = self.row_of.get(src), self.row_of.get(tgt)
+            if s is None or t is None or s == t:
+                continue
+            if rel_type == "NARROWER":
+                narrower_direct[s] |= 1 << t
+            elif rel_type == "BROADER":
+                narrower_direct[t] |= 1 << s
+            if rel_type in NEIGHBOR_TYPES:
+                neighbors[s] |= 1 << t
+                neighbors[t] |= 1 << s
+
+        self._narrower = _closure(narrower_direct)
+        self._broader = [0] * n
+        for i, bits in enumerate(self._narrower):
+            for j in _rows(bits):
+                self._broader[j] |= 1 << i
+        # k-hop 이내 (자기 자신 포함): 1-hop도 자기 비트를 넣어 모든 k에서 같은 규칙
+        self._hops: Dict[int, List[int]] = {0: [1 << i for i in range(n)],
+                                            1: [bits | 1 << i for i, bits in enumerate(neighbors)]}
+
+        self._explains = {cid: tuple(explains.get(cid, ())) for cid in self.keys} if explains else {}
+        self._doc_types = {cid: tuple(doc_types.get(cid, ())) for cid in self.keys} if doc_types else {}
+        self._expanded: Dict[Tuple[str, str], tuple] = {}
+
+    @classmethod
+    def from_concepts(cls, concepts: dict = None) -> "ConceptIndex":
+        """ontology.CONCEPTS 정의로 구성 (broader/narrower/related_concepts/related_docs)"""
+        concepts = CONCEPTS if concepts is None else concepts
+        edges = []
+        for cid, c in concepts.items():
+            if "broader" in c:
+                edges.append((cid, c["broader"], "BROADER"))
+            for nid in c.get("narrower", []):
+                edges.append((cid, nid, "NARROWER"))
+            for rid in c.get("related_concepts", []):
+                edges.append((cid, rid, "RELATED_TO"))
+        doc_types = {cid: c.get("related_docs", []) for cid, c in concepts.items()}
+        return cls(concepts, edges, doc_types=doc_types)
+
+    @classmethod
+    def from_graph_data(cls, graph_data: dict) -> "ConceptIndex":
+        """simulator_ontology 출력으로 구성 (Concept 노드, 개념 간 엣지, EXPLAINS)"""
+        gd = graph_data.get("graph_data", {})
+        concept_ids = [n["id"] for n in gd.get("nodes", []) if "Concept" in n.get("labels", [])]
+        known = set(concept_ids)
+        edges, explains = [], {}
+        for e in gd.get("edges", []):
+            if e["source"] not in known:
+                continue
+            if e["type"] == "EXPLAINS":
+                explains.setdefault(e["source"], []).append(e["target"])
+            elif e["type"] in NEIGHBOR_TYPES:
+                edges.append((e["source"], e["target"], e["type"]))
+        doc_types = {cid: CONCEPTS.get(cid, {}).get("related_docs", []) for cid in concept_ids}
+        return cls(concept_ids, edges, explains, doc_types)
+
+    # ── 계층 ──
+
+    @property
+    def universe(self) -> int:
+        return (1 << len(self.keys)) - 1
+
+    def narrower(self, concept_id: str) -> Bitmap:
+        """모든 하위 개념 (자기 자신 제외)"""
+        return Bitmap(self._narrower[self.row_of[concept_id]], self)
+
+    def broader(self, concept_id: str) -> Bitmap:
+        """모든 상위 개념 (자기 자신 제외)"""
+        return Bitmap(self._broader[self.row_of[concept_id]], self)
+
+    def is_narrower(self, concept_id: str, ancestor_id: str) -> bool:
+        """concept_id가 ancestor_id의 (추이적) 하위 개념인지 — O(1)"""
+        return bool(self._narrower[self.row_of[ancestor_id]] >> self.row_of[concept_id] & 1)
+
+    # ── 이웃 ──
+
+    def neighborhood(self, concept_id: str, hops: int = 1) -> Bitmap:
+        """hops 이내 개념 (자기 자신 포함, RELATED_TO/BROADER/NARROWER 방향 무시)"""
+        return Bitmap(self._within(hops)[self.row_of[concept_id]], self)
+
+    def related_within(self, a: str, b: str, hops: int = 2) -> bool:
+        """b가 a의 hops 이내 개념인지 (a == b면 True)"""
+        return bool(self._within(hops)[self.row_of[a]] >> self.row_of[b] & 1)
+
+    def _within(self, hops: int) -> List[int]:
+        """k-hop 이내 비트셋 전체 (캐시된 가장 큰 k에서 한 단계씩 확장하며 캐시)"""
+        if not isinstance(hops, int) or hops < 1:
+            raise ValueError(f"hops는 1 이상의 정수: {hops!r}")
+        cached = self._hops.get(hops)
+        if cached is not None:
+            return cached
+        k = max(h for h in self._hops if h < hops)
+        prev, step = self._hops[k], self._hops[1]
+        for k in range(k + 1, hops + 1):
+            result = []
+            for i, bits in enumerate(prev):
+                reach = bits | step[i]
+                for j in _rows(bits):
+                    reach |= step[j]
+                result.append(reach)
+            self._hops[k] = prev = result
+        return prev
+
+    # ── 문서 확장 ──
+
+    def doc_types(self, concept_id: str, include_narrower: bool = False) -> tuple:
+        """개념이 설명하는 문서유형 (related_docs)"""
+        return self._expand("doc_types", self._doc_types, concept_id, include_narrower)
+
+    def explained_docs(self, concept_id: str, include_narrower: bool = False) -> tuple:
+        """개념이 EXPLAINS 하는 문서 ID (from_graph_data로 만든 경우)"""
+        return self._expand("explains", self._explains, concept_id, include_narrower)
+
+    def _expand(self, kind: str, table: Dict[str, tuple], concept_id: str, include_narrower: bool) -> tuple:
+        if not include_narrower:
+            return table.get(concept_id, ())
+        key = (kind, concept_id)
+        cached = self._expanded.get(key)
+        if cached is None:
+            merged = dict.fromkeys(table.get(concept_id, ()))
+            for cid in self.narrower(concept_id).ids():
+                merged.update(dict.fromkeys(table.get(cid, ())))
+            cached = self._expanded[key] = tuple(merged)
+        return cached
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def _rows(bits: int):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _closure(direct: List[int]) -> List[int]:
+    """직접 관계 비트셋 → 추이 폐포 (변화가 없을 때까지 반복, 순환이 있어도 수렴)"""
+    closure = list(direct)
+    changed = True
+    while changed:
+        changed = False
+        for i, bits in enumerate(closure):
+            reach = bits
+            for j in _rows(bits):
+                reach |= closure[j]
+            reach &= ~(1 << i)
+            if reach != bits:
+                closure[i] = reach
+                changed = True
+    return closure
+
+
+if __name__ == "__main__":
+    idx = ConceptIndex.from_concepts()
+    print("=" * 60)
+    print("개념 도달성 인덱스")
+    print("=" * 60)
+    pairs = sum(popcount(b) for b in idx._broader)
+    print(f"  개념 {len(idx)}개, 상하위 쌍 {pairs}개")
+    for cid in ["CONCEPT-GROSS-PREMIUM", "CONCEPT-RISK-PREMIUM"]:
+        print(f"\n  {cid} ({CONCEPTS[cid]['name']})")
+        print(f"    하위: {idx.narrower(cid).ids()}")
+        print(f"    상위: {idx.broader(cid).ids()}")
+        print(f"    2-hop 이웃: {idx.neighborhood(cid, 2).count()}개")
+        print(f"    문서유형(하위 포함): {list(idx.doc_types(cid, include_narrower=True))}")
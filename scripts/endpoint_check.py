@@ -0,0 +1,287 @@
+"""
+엣지 끝점 검증 (대용량)
+
+수천만 엣지 그래프에서 "엣지 양 끝 노드가 존재하는가"를 메모리 일정하게 검사한다.
+
+- 노드 ID는 한 번만 해시(int64)로 바꿔 정렬 배열로 보관
+- 엣지는 batch_size 단위로 끝점 해시 배열을 만들어 정렬 배열에서 일괄 이진 탐색 (np.searchsorted)
+- numpy가 없으면 같은 batch 루프를 set 조회로 수행 (stdlib 폴백)
+- 오류는 (끝점, 관계 타입)별 건수 + 최대 max_samples 건의 예시만 보관
+
+    report = check_endpoints(node_ids, edges)
+    report.failed, report.missing, report.samples
+
+numpy 경로는 Python str 해시(64비트)를 비교하므로 서로 다른 ID의 해시가 충돌하면
+누락 끝점을 놓칠 수 있다 (엣지 1천만 × 노드 1천만에서 확률 ~1e-5).
+중복 노드는 해시가 같은 후보만 원래 ID로 다시 확인하므로 정확하다.
+
+노드 ID 집합(또는 해시 배열)조차 메모리에 두기 어려우면 스트리밍 모드:
+
+    report = check_endpoints_streaming(node_ids, edges, fp_rate=0.001)
+
+- 노드 ID를 외부 정렬해 디스크의 정렬 ID 파일로 쓰고 (중복 노드는 이때 정확히 검출),
+  같은 순회에서 노드 수에 맞춘 Bloom 필터를 채운다
+- 엣지 끝점은 Bloom 필터로 먼저 거른다. Bloom이 "없다"고 하면 확실한 누락
+- Bloom이 "있다"고 하면 기본은 그대로 통과 → 누락 끝점을 놓칠 확률 ≤ fp_rate (report.fp_rate)
+- confirm=True면 "있다"는 답도 정렬 ID 파일에서 확인해 정확한 결과 (블록 읽기 비용)
+- 메모리 = 외부 정렬 예산 + Bloom 비트 배열 + ID 파일 희소 색인 (INDEX_EVERY 개당 1항목)
+"""
+
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+DEFAULT_BATCH_SIZE = 65536
+DEFAULT_MAX_SAMPLES = 20
+DEFAULT_FP_RATE = 0.001
+INDEX_EVERY = 1024      # 정렬 ID 파일 희소 색인 간격 (줄)
+BLOCK_CACHE = 64        # confirm 조회 시 메모리에 둘 블록 수
+
+
+@dataclass
+class EndpointReport:
+    backend: str
+    nodes: int = 0
+    edges: int = 0
+    duplicate_nodes: int = 0
+    missing: Dict[Tuple[str, str], int] = field(default_factory=dict)  # (source|target, 관계) → 건수
+    samples: List[Tuple[str, str]] = field(default_factory=list)       # (종류, ID) 예시
+    fp_rate: float = 0.0  # 누락 끝점을 놓쳤을 확률 상한 (Bloom 스트리밍, confirm=False)
+
+    @property
+    def missing_edges(self) -> int:
+        return sum(self.missing.values())
+
+    @property
+    def failed(self) -> int:
+        return self.duplicate_nodes + self.missing_edges
+
+    @property
+    def passed(self) -> int:
+        return (self.nodes - self.duplicate_nodes) + (self.edges - self.missing_edges)
+
+
+def check_endpoints(node_ids: Iterable[str], edges: Iterable[dict],
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    max_samples: int = DEFAULT_MAX_SAMPLES,
+                    use_numpy: Optional[bool] = None) -> EndpointReport:
+    """노드 중복 + 엣지 끝점 존재 검사. 엣지 하나는 소스가 없으면 source, 아니면 target으로 한 번만 집계"""
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("numpy가 설치되어 있지 않습니다")
+
+    report = EndpointReport(backend="numpy" if use_numpy else "stdlib")
+    node_ids = node_ids if isinstance(node_ids, list) else list(node_ids)
+    report.nodes = len(node_ids)
+    if use_numpy:
+        contains, dup_ids = _numpy_membership(node_ids)
+    else:
+        contains, dup_ids = _set_membership(node_ids)
+
+    for node_id in dup_ids:
+        report.duplicate_nodes += 1
+        _sample(report, max_samples, "duplicate", node_id)
+
+    it = iter(edges)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            break
+        report.edges += len(batch)
+        src_ok = contains([e.get("source") for e in batch])
+        tgt_ok = contains([e.get("target") for e in batch])
+        for i in _bad_positions(src_ok, tgt_ok):
+            edge = batch[i]
+            end = "source" if not src_ok[i] else "target"
+            key = (end, edge.get("type", ""))
+            report.missing[key] = report.missing.get(key, 0) + 1
+            _sample(report, max_samples, end, edge.get(end))
+
+    return report
+
+
+def _sample(report: EndpointReport, max_samples: int, kind: str, value: str) -> None:
+    if len(report.samples) < max_samples:
+        report.samples.append((kind, value))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 멤버십 백엔드
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _set_membership(node_ids: List[str]):
+    seen = set()
+    dups = []
+    for node_id in node_ids:
+        if node_id in seen:
+            dups.append(node_id)
+        else:
+            seen.add(node_id)
+    return (lambda ids: [i in seen for i in ids]), dups
+
+
+def _hashes(ids: List[str]):
+    return np.fromiter(map(hash, ids), dtype=np.int64, count=len(ids))
+
+
+def _numpy_membership(node_ids: List[str]):
+    hashed = np.sort(_hashes(node_ids))
+    # 해시가 같은 후보만 원래 ID로 중복 확인
+    collided = set(hashed[1:][hashed[1:] == hashed[:-1]].tolist())
+    dups = []
+    if collided:
+        seen = set()
+        for node_id in node_ids:
+            if hash(node_id) in collided:
+                if node_id in seen:
+                    dups.append(node_id)
+                seen.add(node_id)
+    unique = np.unique(hashed)
+    last = len(unique) - 1
+
+    def contains(ids):
+        # 정렬된 노드 해시에서 이진 탐색 (np.isin 과 같은 결과, batch마다 재정렬하지 않음)
+        probe = _hashes(ids)
+        if last < 0:
+            return np.zeros(len(probe), dtype=bool)
+        pos = np.minimum(np.searchsorted(unique, probe), last)
+        return unique[pos] == probe
+
+    return contains, dups
+
+
+def _bad_positions(src_ok, tgt_ok) -> Iterable[int]:
+    if np is not None and isinstance(src_ok, np.ndarray):
+        return np.flatnonzero(~(src_ok & tgt_ok)).tolist()
+    return [i for i, (s, t) in enumerate(zip(src_ok, tgt_ok)) if not (s and t)]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 스트리밍 (Bloom 필터 + 디스크 정렬 ID 파일)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SortedIdFile:
+    """정렬된 ID 파일 (한 줄에 하나, 중복 없음) + 메모리의 희소 색인 (INDEX_EVERY 줄마다 첫 ID와 오프셋)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._keys: List[str] = []
+        self._offsets: List[int] = []
+        self._size = 0
+        self._writer = open(path, "wb")
+        self._reader = None
+        self._block = lru_cache(maxsize=BLOCK_CACHE)(self._read_block)
+
+    def append(self, item: str) -> None:
+        """정렬 순서로 추가 (호출자가 순서와 중복 제거를 보장)"""
+        data = item.encode("utf-8")
+        if b"\n" in data:
+            raise ValueError(f"줄바꿈이 들어간 ID는 저장할 수 없습니다: {item!r}")
+        if self.count % INDEX_EVERY == 0:
+            self._keys.append(item)
+            self._offsets.append(self._size)
+        self._writer.write(data + b"\n")
+        self._size += len(data) + 1
+        self.count += 1
+
+    def finish(self) -> "SortedIdFile":
+        self._writer.close()
+        self._offsets.append(self._size)
+        self._reader = open(self.path, "rb")
+        return self
+
+    def _read_block(self, i: int) -> List[str]:
+        start, end = self._offsets[i], self._offsets[i + 1]
+        self._reader.seek(start)
+        return self._reader.read(end - start).decode("utf-8").split("\n")[:-1]
+
+    def __contains__(self, item: str) -> bool:
+        i = bisect_right(self._keys, item) - 1
+        if i < 0:
+            return False
+        block = self._block(i)
+        j = bisect_left(block, item)
+        return j < len(block) and block[j] == item
+
+    def close(self) -> None:
+        self._block.cache_clear()
+        for f in (self._writer, self._reader):
+            if f is not None:
+                f.close()
+
+
+def check_endpoints_streaming(node_ids: Iterable[str], edges: Iterable[dict],
+                              fp_rate: float = DEFAULT_FP_RATE,
+                              confirm: bool = False,
+                              memory_mb: Optional[float] = None,
+                              tmp_dir: Optional[str] = None,
+                              max_samples: int = DEFAULT_MAX_SAMPLES) -> EndpointReport:
+    """check_endpoints와 같은 집계를 고정 메모리로. 노드와 엣지를 각각 한 번씩 순회
+
+    memory_mb: 노드 ID 외부 정렬 예산 (None이면 external_sort.DEFAULT_MEMORY_MB)
+    """
+    import shutil
+    import tempfile
+    from bloom_filter import BloomFilter
+    from external_sort import DEFAULT_MEMORY_MB, ExternalSorter
+
+    if memory_mb is None:
+        memory_mb = DEFAULT_MEMORY_MB
+    report = EndpointReport(backend="bloom+confirm" if confirm else "bloom")
+    work_dir = tempfile.mkdtemp(prefix="kms-endpoints-", dir=tmp_dir)
+    ids = None
+    try:
+        with ExternalSorter(memory_mb, tmp_dir) as sorter:
+            for node_id in node_ids:
+                if node_id is not None:
+                    sorter.add((node_id,))
+            report.nodes = sorter.records
+            bloom = BloomFilter.for_capacity(sorter.records, fp_rate)
+            ids = SortedIdFile(os.path.join(work_dir, "node-ids.txt"))
+            prev = None
+            for (node_id,) in sorter.sorted():
+                if node_id == prev:
+                    report.duplicate_nodes += 1
+                    _sample(report, max_samples, "duplicate", node_id)
+                    continue
+                ids.append(node_id)
+                bloom.add(node_id)
+                prev = node_id
+            ids.finish()
+
+        if confirm:
+            def present(node_id):
+                return node_id in bloom and node_id in ids
+        else:
+            def present(node_id):
+                return node_id in bloom
+
+        for edge in edges:
+            report.edges += 1
+            source, target = edge.get("source"), edge.get("target")
+            if source is None or not present(source):
+                end = "source"
+            elif target is None or not present(target):
+                end = "target"
+            else:
+                continue
+            key = (end, edge.get("type", ""))
+            report.missing[key] = report.missing.get(key, 0) + 1
+            _sample(report, max_samples, end, edge.get(end))
+
+        report.fp_rate = 0.0 if confirm else bloom.expected_fp_rate()
+    finally:
+        if ids is not None:
+            ids.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return report
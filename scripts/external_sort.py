@@ -0,0 +1,120 @@
+"""
+외부 정렬 (메모리 예산 안에서 정렬)
+
+메모리에 다 들어가지 않는 튜플 스트림을 정렬한다.
+
+- 메모리 예산만큼 버퍼에 모아 정렬한 뒤 임시 파일(run)로 흘려 쓴다
+- 다 모으면 run들을 heapq.merge로 k-way 병합하며 순서대로 내준다
+- run이 하나도 생기지 않았으면(예산 안에 다 들어가면) 파일 없이 버퍼를 그대로 정렬
+- run 파일은 pickle 블록(BLOCK_SIZE 건) 연속이라 병합 중 run마다 블록 하나만 메모리에 둔다
+- 레코드당 메모리는 첫 레코드 크기로 추정 (tuple + 원소 getsizeof)
+
+    sorter = ExternalSorter(memory_mb=256)
+    for record in records:
+        sorter.add(record)
+    for record in sorter.sorted():
+        ...
+    sorter.runs, sorter.records
+
+레코드는 서로 비교 가능한 튜플이어야 한다 (None과 str이 같은 위치에 섞이면 TypeError).
+"""
+
+import heapq
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional
+
+DEFAULT_MEMORY_MB = 256
+BLOCK_SIZE = 4096
+MIN_RUN_RECORDS = 1024
+
+
+def estimate_record_bytes(record: tuple) -> int:
+    """레코드 하나의 대략적인 메모리 (리스트 슬롯 포함, 중첩 튜플은 한 단계까지)"""
+    size = sys.getsizeof(record) + 8
+    for value in record:
+        size += sys.getsizeof(value)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(v) for v in value)
+    return size
+
+
+class ExternalSorter:
+    """add()로 받은 튜플을 메모리 예산 단위 정렬 run으로 흘려 쓰고 sorted()에서 병합"""
+
+    def __init__(self, memory_mb: float = DEFAULT_MEMORY_MB, tmp_dir: Optional[str] = None):
+        self.memory_bytes = int(memory_mb * 1024 * 1024)
+        self.tmp_dir = tmp_dir
+        self.records = 0
+        self.runs = 0
+        self._buffer: List[tuple] = []
+        self._run_records: Optional[int] = None
+        self._dir: Optional[str] = None
+        self._paths: List[str] = []
+
+    def add(self, record: tuple) -> None:
+        if self._run_records is None:
+            self._run_records = max(MIN_RUN_RECORDS, self.memory_bytes // estimate_record_bytes(record))
+        self._buffer.append(record)
+        self.records += 1
+        if len(self._buffer) >= self._run_records:
+            self._spill()
+
+    def extend(self, records: Iterable[tuple]) -> "ExternalSorter":
+        for record in records:
+            self.add(record)
+        return self
+
+    def _spill(self) -> None:
+        self._buffer.sort()
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix="kms-sort-", dir=self.tmp_dir)
+        path = os.path.join(self._dir, f"run-{len(self._paths):05d}.pkl")
+        buffer = self._buffer
+        with open(path, "wb") as f:
+            for i in range(0, len(buffer), BLOCK_SIZE):
+                pickle.dump(buffer[i:i + BLOCK_SIZE], f, pickle.HIGHEST_PROTOCOL)
+        self._paths.append(path)
+        self.runs += 1
+        self._buffer = []
+
+    def sorted(self) -> Iterator[tuple]:
+        """정렬 순서대로 한 번 순회 (끝까지 돌거나 close()하면 run 파일 삭제)"""
+        if not self._paths:
+            self._buffer.sort()
+            buffer, self._buffer = self._buffer, []
+            yield from buffer
+            return
+        if self._buffer:
+            self._spill()
+        try:
+            yield from heapq.merge(*(_read_run(p) for p in self._paths))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """run 파일 정리"""
+        self._buffer = []
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+        self._paths = []
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_run(path: str) -> Iterator[tuple]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
@@ -0,0 +1,215 @@
+"""
+문서 facet 인덱스 (SSOT 조회용)
+
+DOMAINS[*].ssotKey 로 구성한 분류 경로 (domain, key_tuple) → 문서 ID 역색인.
+생성기(simulator), 검증기(verifier), 질의 경로(query_resolver)가 같은 인덱스를 쓴다.
+
+- ACTIVE / 비ACTIVE 문서를 분리해 보관
+- "carrier X, product Y, docType Z 의 SSOT 문서는?" → O(1)
+- 라이프사이클 변경은 set_lifecycle()로 해당 문서의 posting만 옮긴다
+- 같은 경로에 ACTIVE가 2건 이상인 경로(SSOT 위반)를 갱신 시점에 추적
+- 같은 문서 ID를 다시 등록하면 별도 등록으로 센다 (중복 ID 노드도 ACTIVE 1건씩 → SSOT 위반)
+
+ssotKey 일부 facet을 모르는 질의("삼성생명 수수료" → product 미지정)도
+O(1)로 답할 수 있게, ACTIVE 문서는 wildcard(None) 조합 키에도 함께 등록한다.
+ssotKey는 최대 3개 facet이라 문서당 키는 최대 8개.
+정확한 경로만 필요한 생성기/검증기는 wildcards=False로 만들어 메모리를 아낀다.
+"""
+
+from itertools import product as cartesian
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from taxonomy import DOMAINS, DOC_TYPE_DOMAIN_MAP
+
+# facet 값을 모를 때 사용하는 wildcard
+ANY = None
+
+SsotPath = Tuple[str, tuple]  # (domain, key_tuple)
+Entry = Tuple[str, tuple, str]  # (domain, key_tuple, lifecycle)
+
+
+def ssot_key(domain_id: str, classification: dict) -> Optional[tuple]:
+    """도메인의 ssotKey 순서대로 classification 값을 뽑은 튜플 (도메인 미등록이면 None)"""
+    domain_def = DOMAINS.get(domain_id)
+    if not domain_def:
+        return None
+    return tuple(classification.get(k, "") for k in domain_def.get("ssotKey", []))
+
+
+def _wildcard_keys(key: tuple):
+    """key의 각 위치를 그대로 두거나 ANY로 바꾼 모든 조합 (key 자신 포함)"""
+    return cartesian(*[(v, ANY) for v in key])
+
+
+class FacetIndex:
+    """(domain, ssotKey 튜플) → 문서 ID posting
+
+    posting은 문서 ID → 등록 수 dict (처음 등록된 순서를 유지하는 multiset, 추가/삭제 O(1)).
+    """
+
+    def __init__(self, wildcards: bool = True):
+        self.wildcards = wildcards
+        self._active: Dict[SsotPath, Dict[str, int]] = {}     # 정확한 키 (+ wildcard 키)
+        self._inactive: Dict[SsotPath, Dict[str, int]] = {}   # 정확한 키만
+        self._sizes: Dict[SsotPath, int] = {}                  # 정확한 키 → ACTIVE 등록 수
+        self._docs: Dict[str, Entry] = {}                      # doc_id → 첫 등록 (domain, key, lifecycle)
+        self._repeats: Dict[str, List[Entry]] = {}             # doc_id → 두 번째 이후 등록 (중복 ID)
+        self._conflicts: Dict[SsotPath, None] = {}             # ACTIVE 2건 이상인 정확한 경로
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[dict], wildcards: bool = True) -> "FacetIndex":
+        """simulator 그래프 노드 목록에서 문서 노드만 색인"""
+        index = cls(wildcards)
+        for node in nodes:
+            if "Document" not in node.get("labels", []):
+                continue
+            props = node.get("properties", {})
+            index.add(node["id"], props.get("domain", ""),
+                      props.get("classification", {}), props.get("lifecycle", ""))
+        return index
+
+    # ── 갱신 ──
+
+    def add(self, doc_id: str, domain_id: str, classification: dict, lifecycle: str) -> bool:
+        """문서 등록 (도메인 미등록 문서는 무시하고 False)
+
+        이미 등록된 doc_id면 이전 등록을 지우지 않고 한 건 더 등록한다.
+        """
+        key = ssot_key(domain_id, classification)
+        if key is None:
+            return False
+        entry = (domain_id, key, lifecycle)
+        if doc_id in self._docs:
+            self._repeats.setdefault(doc_id, []).append(entry)
+        else:
+            self._docs[doc_id] = entry
+        self._post(doc_id, *entry)
+        return True
+
+    def remove(self, doc_id: str) -> None:
+        """doc_id의 모든 등록 삭제"""
+        for entry in self._entries(doc_id):
+            self._unpost(doc_id, *entry)
+        self._docs.pop(doc_id, None)
+        self._repeats.pop(doc_id, None)
+
+    def set_lifecycle(self, doc_id: str, lifecycle: str) -> None:
+        """라이프사이클 변경 → 해당 문서(중복 등록 포함)의 posting만 ACTIVE/비ACTIVE 간 이동"""
+        entries = self._entries(doc_id)
+        if not entries:
+            raise KeyError(doc_id)
+        for domain_id, key, old in entries:
+            if old != lifecycle:
+                self._unpost(doc_id, domain_id, key, old)
+                self._post(doc_id, domain_id, key, lifecycle)
+        moved = [(domain_id, key, lifecycle) for domain_id, key, _ in entries]
+        self._docs[doc_id] = moved[0]
+        if len(moved) > 1:
+            self._repeats[doc_id] = moved[1:]
+
+    def _entries(self, doc_id: str) -> List[Entry]:
+        first = self._docs.get(doc_id)
+        if first is None:
+            return []
+        return [first, *self._repeats.get(doc_id, ())]
+
+    def _keys(self, key: tuple):
+        return _wildcard_keys(key) if self.wildcards else (key,)
+
+    def _post(self, doc_id: str, domain_id: str, key: tuple, lifecycle: str) -> None:
+        path = (domain_id, key)
+        if lifecycle != "ACTIVE":
+            _increment(self._inactive, path, doc_id)
+            return
+        for masked in self._keys(key):
+            _increment(self._active, (domain_id, masked), doc_id)
+        size = self._sizes.get(path, 0) + 1
+        self._sizes[path] = size
+        if size == 2:
+            self._conflicts[path] = None
+
+    def _unpost(self, doc_id: str, domain_id: str, key: tuple, lifecycle: str) -> None:
+        path = (domain_id, key)
+        if lifecycle != "ACTIVE":
+            _decrement(self._inactive, path, doc_id)
+            return
+        for masked in self._keys(key):
+            _decrement(self._active, (domain_id, masked), doc_id)
+        size = self._sizes[path] - 1
+        if size:
+            self._sizes[path] = size
+        else:
+            del self._sizes[path]
+        if size == 1:
+            self._conflicts.pop(path, None)
+
+    # ── 조회 ──
+
+    def lookup(self, domain_id: str, key: tuple) -> List[str]:
+        """분류 경로의 ACTIVE 문서 (wildcards=True면 key에 ANY 사용 가능)"""
+        return list(self._active.get((domain_id, tuple(key)), ()))
+
+    def inactive(self, domain_id: str, key: tuple) -> List[str]:
+        """분류 경로의 비ACTIVE 문서 (정확한 키만)"""
+        return list(self._inactive.get((domain_id, tuple(key)), ()))
+
+    def has_path(self, domain_id: str, key: tuple) -> bool:
+        """라이프사이클과 무관하게 경로에 문서가 하나라도 있는지"""
+        path = (domain_id, tuple(key))
+        return bool(self._active.get(path)) or bool(self._inactive.get(path))
+
+    def ssot_for(self, domain_id: str, key: tuple) -> Optional[str]:
+        """경로의 SSOT(ACTIVE) 문서. 없거나 위반 상태(2건 이상)면 None"""
+        path = (domain_id, tuple(key))
+        if self._sizes.get(path) == 1:
+            return next(iter(self._active[path]))
+        return None
+
+    def ssot_for_doc_type(self, doc_type_id: str, carrier: str = None, product: str = None) -> Optional[str]:
+        """문서유형 기본 도메인의 ssotKey로 경로를 만들어 SSOT 문서 조회"""
+        domain_id = DOC_TYPE_DOMAIN_MAP.get(doc_type_id, "")
+        cls = {"docType": doc_type_id}
+        if carrier:
+            cls["carrier"] = carrier
+        if product:
+            cls["product"] = product
+        key = ssot_key(domain_id, cls)
+        return self.ssot_for(domain_id, key) if key is not None else None
+
+    def lifecycle_of(self, doc_id: str) -> Optional[str]:
+        """첫 등록의 라이프사이클"""
+        entry = self._docs.get(doc_id)
+        return entry[2] if entry else None
+
+    def conflicts(self) -> Dict[SsotPath, List[str]]:
+        """SSOT 위반 경로 → ACTIVE 문서 목록 (처음 등록된 순서, 중복 등록된 ID는 등록 수만큼 반복)"""
+        return {path: occurrences(self._active[path]) for path in self._conflicts}
+
+    @property
+    def active_path_count(self) -> int:
+        """ACTIVE 문서가 있는 정확한 경로 수"""
+        return len(self._sizes)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+def occurrences(posting: Dict[str, int]) -> List[str]:
+    """문서 ID → 등록 수 posting을 등록 수만큼 반복한 ID 목록"""
+    return [doc_id for doc_id, count in posting.items() for _ in range(count)]
+
+
+def _increment(postings: dict, path: SsotPath, doc_id: str) -> None:
+    docs = postings.setdefault(path, {})
+    docs[doc_id] = docs.get(doc_id, 0) + 1
+
+
+def _decrement(postings: dict, path: SsotPath, doc_id: str) -> None:
+    docs = postings[path]
+    count = docs[doc_id] - 1
+    if count:
+        docs[doc_id] = count
+        return
+    del docs[doc_id]
+    if not docs:
+        del postings[path]
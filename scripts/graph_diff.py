@@ -0,0 +1,191 @@
+"""
+그래프 스냅샷 diff (Merkle 서브트리 해시로 위에서부터)
+
+두 knowledge-graph.json의 "merkle" 키(simulator.py가 기록)를 비교한다.
+그래프 해시가 같으면 바로 끝나고, 다르면 최상위부터 서브트리 해시가 다른 자식으로만 내려간다.
+해시가 같은 가지는 열어보지 않으므로 비교량은 바뀐 노드 수 × 트리 깊이 정도다.
+
+- changed: 양쪽에 있고 자기 해시(속성, 레이블, 계층 외 나가는 엣지)가 다른 노드
+- added / removed: 한쪽에만 있는 노드 (추가·삭제된 서브트리 전체)
+- moved: 양쪽에 있지만 계층 부모가 바뀐 노드
+- "merkle" 키가 없거나 graph_data와 맞지 않는 (노드·엣지 수 또는 지문이 다른) 스냅샷은
+  불러올 때 해시를 다시 계산 (merkle.py)
+
+    python scripts/graph_diff.py old.json data/knowledge-graph.json
+    python scripts/graph_diff.py old.json new.json --limit 50 --json docs/results/graph-diff.json
+
+종료 코드: 0 = 같음, 1 = 다름
+"""
+
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from merkle import MerkleTree
+from profiling import phase, profiled
+from serialization import dump_json, load_json
+
+
+@dataclass
+class TreeDiff:
+    changed: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    moved: List[str] = field(default_factory=list)
+    extra_changed: bool = False  # 트리 밖 항목 (중복 id 노드, 소스 없는 엣지)
+    descended: int = 0           # 열어본 서브트리 수
+    compared: int = 0            # 비교한 서브트리 해시 수
+    total: int = 0               # 새 스냅샷 노드 수
+    parents: Dict[str, Optional[str]] = field(default_factory=dict)  # 보고 노드 → 내려온 부모
+
+    @property
+    def identical(self) -> bool:
+        return not (self.changed or self.added or self.removed or self.moved or self.extra_changed)
+
+    def path(self, node_id: str) -> List[str]:
+        """최상위부터 node_id까지 내려온 경로"""
+        path = [node_id]
+        while self.parents.get(path[-1]) is not None:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+
+class _Walker:
+    def __init__(self, old: MerkleTree, new: MerkleTree):
+        self.old, self.new = old, new
+        self.diff = TreeDiff(total=len(new.hashes))
+        self.stack: List[tuple] = []  # (노드, 부모): 양쪽에 있고 서브트리 해시가 다른 노드
+
+    def run(self) -> TreeDiff:
+        diff = self.diff
+        diff.compared = 1
+        if self.old.root == self.new.root:
+            return diff
+        diff.extra_changed = self.old.extra != self.new.extra
+        self._children(None, self.old.tops, self.new.tops)
+        seen = set()
+        while self.stack:
+            node_id, parent = self.stack.pop()
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            diff.descended += 1
+            diff.parents.setdefault(node_id, parent)
+            if self.old.own_hash(node_id) != self.new.own_hash(node_id):
+                diff.changed.append(node_id)
+            self._children(node_id, self.old.children.get(node_id, ()), self.new.children.get(node_id, ()))
+        return diff
+
+    def _children(self, parent: Optional[str], old_children: Sequence[str], new_children: Sequence[str]) -> None:
+        old_set, new_set = set(old_children), set(new_children)
+        for child in sorted(old_set & new_set, reverse=True):
+            self.diff.compared += 1
+            if self.old.hashes[child] != self.new.hashes[child]:
+                self.stack.append((child, parent))
+        for child in sorted(new_set - old_set):
+            self._enter(child, parent, self.new, self.old, self.diff.added)
+        for child in sorted(old_set - new_set):
+            self._enter(child, parent, self.old, self.new, None)
+
+    def _enter(self, start: str, parent: Optional[str], side: MerkleTree, other: MerkleTree,
+               bucket: Optional[List[str]]) -> None:
+        """한쪽 자식 목록에만 있는 서브트리: 다른 쪽에도 있는 노드는 이동, 없으면 추가/삭제"""
+        stack = [(start, parent)]
+        while stack:
+            node_id, up = stack.pop()
+            if node_id in other.hashes:
+                if bucket is not None:  # 새 쪽에서 찾은 이동만 기록 (옛 쪽은 같은 노드를 다시 만남)
+                    self.diff.moved.append(node_id)
+                    self.diff.parents.setdefault(node_id, up)
+                    self.diff.compared += 1
+                    if other.hashes[node_id] != side.hashes[node_id]:
+                        self.stack.append((node_id, up))
+                continue
+            (bucket if bucket is not None else self.diff.removed).append(node_id)
+            self.diff.parents.setdefault(node_id, up)
+            for child in reversed(side.children.get(node_id, ())):
+                stack.append((child, node_id))
+
+
+def diff_trees(old: MerkleTree, new: MerkleTree) -> TreeDiff:
+    """두 Merkle 트리를 위에서부터 비교 (해시가 다른 가지로만 내려감)"""
+    return _Walker(old, new).run()
+
+
+def load_tree(path: str) -> MerkleTree:
+    """스냅샷 → Merkle 트리 (저장된 "merkle" 키는 graph_data와 맞을 때만 사용)"""
+    return MerkleTree.from_graph(load_json(path))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 메인 실행
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _origin(tree: MerkleTree) -> str:
+    return "저장된 해시" if tree.stored else "해시 다시 계산"
+
+
+def _print_ids(title: str, ids: List[str], diff: TreeDiff, limit: int) -> None:
+    if not ids:
+        return
+    print(f"\n  {title} ({len(ids):,}개)")
+    for node_id in ids[:limit]:
+        print(f"    - {' › '.join(diff.path(node_id))}")
+    if len(ids) > limit:
+        print(f"    … 외 {len(ids) - limit:,}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="그래프 스냅샷 Merkle diff")
+    parser.add_argument("old", help="이전 스냅샷 (knowledge-graph.json)")
+    parser.add_argument("new", help="새 스냅샷")
+    parser.add_argument("--limit", type=int, default=20, help="분류별로 출력할 노드 수")
+    parser.add_argument("--json", metavar="PATH", help="diff 결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("그래프 스냅샷 Merkle diff")
+    print("=" * 60)
+
+    with phase("load"):
+        old, new = load_tree(args.old), load_tree(args.new)
+    print(f"\n  이전: {args.old} (루트 {old.root}, 노드 {len(old.hashes):,}개, {_origin(old)})")
+    print(f"  이후: {args.new} (루트 {new.root}, 노드 {len(new.hashes):,}개, {_origin(new)})")
+
+    with phase("diff"):
+        diff = diff_trees(old, new)
+
+    if diff.identical:
+        print("\n  ✓ 동일 (그래프 해시 일치)")
+    else:
+        _print_ids("변경", diff.changed, diff, args.limit)
+        _print_ids("추가", diff.added, diff, args.limit)
+        _print_ids("삭제", diff.removed, diff, args.limit)
+        _print_ids("이동", diff.moved, diff, args.limit)
+        if diff.extra_changed:
+            print("\n  트리 밖 항목 변경 (중복 id 노드 또는 소스 노드가 없는 엣지)")
+    print(f"\n  비교한 서브트리 해시: {diff.compared:,}개, 열어본 서브트리: {diff.descended:,}개 "
+          f"(새 스냅샷 노드 {diff.total:,}개)")
+
+    if args.json:
+        dump_json({
+            "old": {"path": args.old, "root": old.root, "nodes": len(old.hashes), "stored": old.stored},
+            "new": {"path": args.new, "root": new.root, "nodes": len(new.hashes), "stored": new.stored},
+            "identical": diff.identical,
+            "changed": diff.changed,
+            "added": diff.added,
+            "removed": diff.removed,
+            "moved": diff.moved,
+            "extra_changed": diff.extra_changed,
+            "compared": diff.compared,
+            "descended": diff.descended,
+        }, args.json, pretty=True)
+        print(f"  저장: {args.json}")
+
+    return 0 if diff.identical else 1
+
+
+if __name__ == "__main__":
+    with profiled("graph_diff"):
+        status = main()
+    exit(status)
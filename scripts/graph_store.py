@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+SQLite 그래프 저장소 (대용량 검증용)
+
+simulator.generate_graph_data() 결과를 로컬 SQLite 파일에 적재하고,
+FrameworkVerifier의 집합 단위 규칙을 SQL 질의로 실행한다.
+그래프를 Python dict로 들고 있지 않으므로 검증 메모리는 노드 수가 아니라
+SQLite 페이지 캐시(cache_mb) 크기로 묶인다.
+
+    nodes      id, label(labels[0]), data(노드 JSON)
+    documents  문서 노드 투영: domain, lifecycle, carrier, product, docType, ssotKey 열(k1..k3)
+    edges      source, target, type
+    meta       원본 경로/크기/내용 sha256, 스키마 버전
+
+색인 (모두 해당 질의를 테이블 접근 없이 처리하는 covering index)
+
+    ix_documents_domain_lifecycle  (domain, lifecycle)              라이프사이클 분포/위반
+    ix_documents_ssot              (domain, k1, k2, k3, id)         SSOT 충돌 (ACTIVE 부분 색인)
+    ix_documents_scope             (id, carrier, product, domain)   관계 scope 조인
+    ix_edges_type_source           (type, source, target)
+    ix_edges_type_target           (type, target, source)
+    ix_nodes_id                    (id)                              끝점 존재/중복
+
+적재 시에는 저널/동기화를 끄고 행을 모두 넣은 뒤 색인을 만들고 ANALYZE 한다.
+적재는 그래프 JSON을 한 번 읽어야 하지만, 이후 검증은 저장소 파일만 읽는다.
+
+    python graph_store.py --scale 100 --db /tmp/kms-graph.sqlite
+    python verifier.py --store /tmp/kms-graph.sqlite
+"""
+
+import argparse
+import os
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from endpoint_check import DEFAULT_MAX_SAMPLES, EndpointReport
+from facet_index import SsotPath, occurrences, ssot_key
+from profiling import phase, profiled
+from result_cache import file_digest
+from serialization import dumps, load_json, loads
+
+SCHEMA_VERSION = 1
+SSOT_KEY_COLUMNS = 3  # DOMAINS[*].ssotKey 최대 facet 수
+DEFAULT_CACHE_MB = 64
+BATCH_SIZE = 50000
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE nodes (
+    id    TEXT NOT NULL,
+    label TEXT NOT NULL,
+    data  BLOB NOT NULL
+);
+CREATE TABLE documents (
+    node_rowid  INTEGER PRIMARY KEY,
+    id          TEXT NOT NULL,
+    domain      TEXT NOT NULL,
+    lifecycle   TEXT NOT NULL,
+    carrier     TEXT NOT NULL,
+    product     TEXT NOT NULL,
+    doc_type    TEXT NOT NULL,
+    ssot_arity  INTEGER,
+    k1 TEXT, k2 TEXT, k3 TEXT
+);
+CREATE TABLE edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    type   TEXT NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE INDEX ix_nodes_id ON nodes (id);
+CREATE INDEX ix_documents_domain_lifecycle ON documents (domain, lifecycle);
+CREATE INDEX ix_documents_ssot ON documents (domain, k1, k2, k3, id)
+    WHERE lifecycle = 'ACTIVE' AND ssot_arity IS NOT NULL;
+CREATE INDEX ix_documents_scope ON documents (id, carrier, product, domain);
+CREATE INDEX ix_edges_type_source ON edges (type, source, target);
+CREATE INDEX ix_edges_type_target ON edges (type, target, source);
+"""
+
+
+class StoreRows:
+    """저장소 행을 dict로 흘려 읽는 읽기 전용 뷰 (len은 COUNT, 순회할 때마다 새 커서)"""
+
+    def __init__(self, conn: sqlite3.Connection, count_sql: str, select_sql: str, decode):
+        self._conn = conn
+        self._count_sql = count_sql
+        self._select_sql = select_sql
+        self._decode = decode
+        self._len: Optional[int] = None
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = self._conn.execute(self._count_sql).fetchone()[0]
+        return self._len
+
+    def __iter__(self) -> Iterator[dict]:
+        decode = self._decode
+        for row in self._conn.execute(self._select_sql):
+            yield decode(row)
+
+
+class GraphStore:
+    """SQLite 그래프 저장소"""
+
+    def __init__(self, path: str, cache_mb: int = DEFAULT_CACHE_MB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(f"PRAGMA cache_size = {-cache_mb * 1024}")
+        self.conn.execute("PRAGMA temp_store = FILE")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ── 적재 ──
+
+    @classmethod
+    def build(cls, path: str, graph_data: dict, source: str = "", cache_mb: int = DEFAULT_CACHE_MB) -> "GraphStore":
+        """기존 파일을 지우고 그래프 적재 → 색인 생성 → ANALYZE"""
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        store = cls(path, cache_mb)
+        conn = store.conn
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(_SCHEMA)
+
+        gd = graph_data.get("graph_data", {})
+        with conn:
+            with phase("store.nodes"):
+                store._insert_nodes(gd.get("nodes", []))
+            with phase("store.edges"):
+                conn.executemany(
+                    "INSERT INTO edges VALUES (?, ?, ?)",
+                    ((e.get("source"), e.get("target"), e.get("type", "")) for e in gd.get("edges", [])),
+                )
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("source", os.path.abspath(source) if source else ""),
+                *_source_meta(source).items(),
+            ])
+        with phase("store.index"):
+            conn.executescript(_INDEXES)
+            conn.execute("ANALYZE")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return store
+
+    def _insert_nodes(self, nodes: Iterable[dict]) -> None:
+        conn = self.conn
+        node_rows: List[tuple] = []
+        doc_rows: List[tuple] = []
+        rowid = 0
+        for node in nodes:
+            rowid += 1
+            labels = node.get("labels") or [""]
+            node_rows.append((rowid, node.get("id"), labels[0], dumps(node)))
+            if "Document" in labels:
+                doc_rows.append(_document_row(rowid, node))
+            if len(node_rows) >= BATCH_SIZE:
+                self._flush_nodes(node_rows, doc_rows)
+        self._flush_nodes(node_rows, doc_rows)
+
+    def _flush_nodes(self, node_rows: List[tuple], doc_rows: List[tuple]) -> None:
+        self.conn.executemany("INSERT INTO nodes (rowid, id, label, data) VALUES (?, ?, ?, ?)", node_rows)
+        self.conn.executemany(f"INSERT INTO documents VALUES ({', '.join('?' * 11)})", doc_rows)
+        node_rows.clear()
+        doc_rows.clear()
+
+    @classmethod
+    def open_or_build(cls, path: str, graph_path: str, cache_mb: int = DEFAULT_CACHE_MB) -> "GraphStore":
+        """저장소가 graph_path의 현재 내용으로 적재된 것이면 열고, 아니면 다시 적재
+
+        크기가 같을 때만 내용 sha256을 비교한다 (mtime은 cp -p, rsync, checkout에서 그대로 남으므로 보지 않음).
+        """
+        if os.path.exists(path):
+            store = cls(path, cache_mb)
+            meta = store.meta()
+            if meta.get("schema_version") == str(SCHEMA_VERSION) \
+                    and meta.get("source_size") == str(os.path.getsize(graph_path)) \
+                    and meta.get("source_sha256") == file_digest(graph_path):
+                return store
+            store.close()
+        return cls.build(path, load_json(graph_path), source=graph_path, cache_mb=cache_mb)
+
+    def meta(self) -> Dict[str, str]:
+        try:
+            return dict(self.conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            return {}
+
+    # ── 행 뷰 ──
+
+    def nodes(self, label: str = None) -> StoreRows:
+        """노드 dict 뷰 (적재 순서). label="Document"면 문서 노드만"""
+        if label == "Document":
+            return StoreRows(
+                self.conn, "SELECT COUNT(*) FROM documents",
+                "SELECT n.data FROM documents d JOIN nodes n ON n.rowid = d.node_rowid ORDER BY d.node_rowid",
+                _decode_node,
+            )
+        if label is not None:
+            quoted = label.replace("'", "''")
+            return StoreRows(
+                self.conn, f"SELECT COUNT(*) FROM nodes WHERE label = '{quoted}'",
+                f"SELECT data FROM nodes WHERE label = '{quoted}' ORDER BY rowid", _decode_node,
+            )
+        return StoreRows(self.conn, "SELECT COUNT(*) FROM nodes", "SELECT data FROM nodes ORDER BY rowid", _decode_node)
+
+    def fetch_nodes(self, ids: Iterable[str]) -> Dict[str, dict]:
+        """ID → 노드 dict (ix_nodes_id 조회, 없는 ID는 결과에 없음)"""
+        ids = list(dict.fromkeys(ids))
+        found: Dict[str, dict] = {}
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            sql = f"SELECT id, data FROM nodes WHERE id IN ({', '.join('?' * len(chunk))}) ORDER BY rowid"
+            for node_id, data in self.conn.execute(sql, chunk):
+                found[node_id] = loads(data)
+        return found
+
+    def edges(self) -> StoreRows:
+        return StoreRows(
+            self.conn, "SELECT COUNT(*) FROM edges", "SELECT source, target, type FROM edges ORDER BY rowid",
+            lambda row: {"source": row[0], "target": row[1], "type": row[2]},
+        )
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # 검증 질의
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def check_endpoints(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> EndpointReport:
+        """endpoint_check.check_endpoints와 같은 집계 (엣지 하나는 source 누락 우선으로 한 번만)"""
+        report = EndpointReport(backend="sqlite")
+        conn = self.conn
+        report.nodes = conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+        report.edges = conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+
+        for node_id, extra in self.duplicate_nodes():
+            report.duplicate_nodes += extra
+            for _ in range(extra):
+                if len(report.samples) < max_samples:
+                    report.samples.append(("duplicate", node_id))
+
+        missing = """
+            SELECT type,
+                   CASE WHEN NOT EXISTS (SELECT 1 FROM nodes WHERE id = e.source) THEN 'source'
+                        WHEN NOT EXISTS (SELECT 1 FROM nodes WHERE id = e.target) THEN 'target' END AS end_kind,
+                   source, target
+            FROM edges e
+        """
+        for end, rel_type, count in conn.execute(
+                f"SELECT end_kind, type, COUNT(*) FROM ({missing}) WHERE end_kind IS NOT NULL GROUP BY 1, 2"):
+            report.missing[(end, rel_type)] = count
+        room = max_samples - len(report.samples)
+        if report.missing and room > 0:
+            for end, source, target in conn.execute(
+                    f"SELECT end_kind, source, target FROM ({missing}) WHERE end_kind IS NOT NULL LIMIT ?", (room,)):
+                report.samples.append((end, source if end == "source" else target))
+        return report
+
+    def duplicate_nodes(self) -> Iterator[Tuple[str, int]]:
+        """ID가 두 번 이상 나오는 노드 → (ID, 추가 등장 수)"""
+        return self.conn.execute("SELECT id, COUNT(*) - 1 FROM nodes GROUP BY id HAVING COUNT(*) > 1")
+
+    def lifecycle_counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT lifecycle, COUNT(*) FROM documents GROUP BY lifecycle"))
+
+    def invalid_lifecycle(self, valid_states: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+        """허용 상태가 아닌 문서 (id, lifecycle, domain)"""
+        states = sorted(set(valid_states))
+        sql = (f"SELECT id, lifecycle, domain FROM documents "
+               f"WHERE lifecycle NOT IN ({', '.join('?' * len(states))}) ORDER BY node_rowid")
+        return self.conn.execute(sql, states)
+
+    def ssot_conflicts(self) -> Dict[SsotPath, List[str]]:
+        """FacetIndex.conflicts()와 같은 결과: (domain, key 튜플) → ACTIVE 문서 ID
+
+        ACTIVE 행마다 한 건 (같은 ID가 여러 행이면 각각 센다). ID는 처음 나온 순서로 나온 수만큼,
+        경로는 두 번째 ACTIVE 행의 적재 순서
+        """
+        found = []
+        groups = self.conn.execute("""
+            SELECT domain, ssot_arity, k1, k2, k3 FROM documents
+            WHERE lifecycle = 'ACTIVE' AND ssot_arity IS NOT NULL
+            GROUP BY domain, k1, k2, k3 HAVING COUNT(*) > 1
+        """).fetchall()
+        for domain, arity, *keys in groups:
+            rows = self.conn.execute("""
+                SELECT id, node_rowid FROM documents
+                WHERE lifecycle = 'ACTIVE' AND ssot_arity IS NOT NULL
+                  AND domain = ? AND k1 IS ? AND k2 IS ? AND k3 IS ?
+                ORDER BY node_rowid
+            """, (domain, *keys)).fetchall()
+            posting: Dict[str, int] = {}
+            for doc_id, _ in rows:
+                posting[doc_id] = posting.get(doc_id, 0) + 1
+            found.append((rows[1][1], (domain, tuple(keys[:arity])), occurrences(posting)))
+        found.sort(key=lambda item: item[0])
+        return {path: ids for _, path, ids in found}
+
+    def ssot_active_path_count(self) -> int:
+        """FacetIndex.active_path_count: ACTIVE 문서가 있는 정확한 경로 수"""
+        return self.conn.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT 1 FROM documents WHERE lifecycle = 'ACTIVE' AND ssot_arity IS NOT NULL
+                GROUP BY domain, k1, k2, k3
+            )
+        """).fetchone()[0]
+
+    def scope_violations(self, rel_types: Iterable[str]) -> Iterator[tuple]:
+        """same_domain 관계 중 양 끝 문서의 (carrier, product)가 다른 엣지
+        → (type, source, target, (carrier, product), (carrier, product), source domain)"""
+        types = sorted(set(rel_types))
+        if not types:
+            return iter(())
+        cursor = self.conn.execute(f"""
+            SELECT e.type, e.source, e.target, s.carrier, s.product, t.carrier, t.product, s.domain
+            FROM edges e
+            JOIN documents s ON s.id = e.source
+            JOIN documents t ON t.id = e.target
+            WHERE e.type IN ({', '.join('?' * len(types))})
+              AND s.carrier <> '' AND t.carrier <> ''
+              AND (s.carrier <> t.carrier OR s.product <> t.product)
+            ORDER BY e.rowid
+        """, types)
+        return ((t, src, tgt, (sc, sp), (tc, tp), domain) for t, src, tgt, sc, sp, tc, tp, domain in cursor)
+
+    def edge_type_counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT type, COUNT(*) FROM edges GROUP BY type"))
+
+
+def _source_meta(source: str) -> Dict[str, str]:
+    """적재한 그래프 파일의 크기와 내용 sha256 (파일이 없으면 빈 값)"""
+    if not source or not os.path.exists(source):
+        return {"source_size": "", "source_sha256": ""}
+    return {"source_size": str(os.path.getsize(source)), "source_sha256": file_digest(source)}
+
+
+def _document_row(rowid: int, node: dict) -> tuple:
+    props = node.get("properties", {})
+    cls = props.get("classification", {}) or {}
+    domain = props.get("domain", "") or ""
+    key = ssot_key(domain, cls)
+    if key is not None and len(key) > SSOT_KEY_COLUMNS:
+        raise ValueError(f"ssotKey가 {SSOT_KEY_COLUMNS}개를 넘는 도메인: {domain}")
+    padded = (list(key) if key is not None else []) + [None] * SSOT_KEY_COLUMNS
+    return (
+        rowid, node.get("id"), domain, props.get("lifecycle", "") or "",
+        cls.get("carrier", "") or "", cls.get("product", "") or "", cls.get("docType", "") or "",
+        len(key) if key is not None else None, *padded[:SSOT_KEY_COLUMNS],
+    )
+
+
+def _decode_node(row) -> dict:
+    return loads(row[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성 그래프 → SQLite 그래프 저장소")
+    parser.add_argument("--scale", type=int, default=1, help="보험사 복제 배수 (simulator scaled_carriers)")
+    parser.add_argument("--graph", help="생성 대신 읽을 knowledge-graph.json 경로")
+    parser.add_argument("--db", default="data/knowledge-graph.sqlite", help="저장소 파일 경로")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("SQLite 그래프 저장소 적재")
+    print("=" * 60)
+
+    with phase("generation"):
+        if args.graph:
+            graph_data = load_json(args.graph)
+        else:
+            from simulator import generate_graph_data
+            graph_data = generate_graph_data(scale=args.scale)
+
+    store = GraphStore.build(args.db, graph_data, source=args.graph or "")
+    print(f"  ✓ 노드: {len(store.nodes()):,}개 (문서 {len(store.nodes('Document')):,}개)")
+    print(f"  ✓ 엣지: {len(store.edges()):,}개")
+    store.close()
+    print(f"\n  저장: {args.db} ({os.path.getsize(args.db) / 1024 / 1024:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    with profiled("graph_store"):
+        status = main()
+    exit(status)
@@ -0,0 +1,194 @@
+"""
+그래프 탐색 엔진 (관련 문서 확장)
+
+RAG 호출자가 "문서 + REFERENCES/CHILD_OF/SIBLINGS 이웃 (깊이 k)"을 얻기 위한 API.
+노드 ID를 정수로 한 번 매핑하고, 엣지를 CSR(offsets/targets/types) 정수 배열로
+보관하여 탐색 중에는 dict/객체 생성 없이 배열 슬라이스만 훑는다.
+
+    g = CompactGraph.from_graph_data(graph_data)
+    expand(g, ["DOC-GUIDE-INS-SAMSUNG-PRD-LIFE-WHOLE-001"], depth=2, fanout=20)
+
+- 엣지 타입 필터 (기본: taxonomy.DEFAULT_RELATIONS 의 문서 간 관계)
+- 방향: out / in / both
+- hop별 fan-out 제한, 전체 노드 수 제한
+- 방문 노드 중복 제거 (BFS이므로 각 노드는 최단 hop으로 한 번만 반환)
+"""
+
+from array import array
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from taxonomy import DEFAULT_RELATIONS
+
+# 문서 간 관계 타입 (DEFAULT_RELATIONS에 등장하는 것 + 버전 관계)
+DOCUMENT_RELATION_TYPES = sorted(
+    {rel for rels in DEFAULT_RELATIONS.values() for rel in rels} | {"SUPERSEDES"}
+)
+
+# 탐색 결과 1건: 도달 노드, hop 수, 직전 노드, 경유 관계 타입
+Reached = namedtuple("Reached", ["node_id", "hop", "via", "rel_type"])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 정수 인접 배열 (CSR)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class CompactGraph:
+    """노드 ID ↔ 정수 매핑 + 정/역방향 CSR 인접 배열"""
+
+    def __init__(self, node_ids: List[str], sources: array, targets: array, types: array,
+                 type_names: List[str]):
+        self.node_ids = node_ids
+        self.index: Dict[str, int] = {nid: i for i, nid in enumerate(node_ids)}
+        self.type_names = type_names
+        self.type_codes = {name: i for i, name in enumerate(type_names)}
+        self.edge_count = len(sources)
+        self.out_offsets, self.out_targets, self.out_types = _csr(len(node_ids), sources, targets, types)
+        self.in_offsets, self.in_targets, self.in_types = _csr(len(node_ids), targets, sources, types)
+
+    @classmethod
+    def from_edges(cls, node_ids: Iterable[str], edges: Iterable[tuple]) -> "CompactGraph":
+        """노드 ID 목록 + (source, target, type) 목록으로 구성. 끝점이 없는 엣지는 건너뜀"""
+        node_ids = list(dict.fromkeys(node_ids))
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        type_codes: Dict[str, int] = {}
+        sources, targets, types = array("i"), array("i"), array("H")
+        for src, tgt, rel_type in edges:
+            s, t = index.get(src), index.get(tgt)
+            if s is None or t is None:
+                continue
+            code = type_codes.get(rel_type)
+            if code is None:
+                code = type_codes[rel_type] = len(type_codes)
+            sources.append(s)
+            targets.append(t)
+            types.append(code)
+        return cls(node_ids, sources, targets, types, list(type_codes))
+
+    @classmethod
+    def from_graph_data(cls, graph_data: dict) -> "CompactGraph":
+        """simulator / simulator_ontology 출력(dict)으로 구성"""
+        gd = graph_data.get("graph_data", {})
+        return cls.from_edges(
+            (n["id"] for n in gd.get("nodes", [])),
+            ((e["source"], e["target"], e["type"]) for e in gd.get("edges", [])),
+        )
+
+    def type_mask(self, rel_types: Optional[Iterable[str]]) -> int:
+        """관계 타입 목록 → 비트마스크 (None이면 전체)"""
+        if rel_types is None:
+            return (1 << len(self.type_names)) - 1
+        mask = 0
+        for name in rel_types:
+            code = self.type_codes.get(name)
+            if code is not None:
+                mask |= 1 << code
+        return mask
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+
+def _csr(n: int, sources: array, targets: array, types: array):
+    """counting sort로 source 기준 CSR 구성 (O(V + E))"""
+    offsets = array("q", bytes(8 * (n + 1)))
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    cursor = array("q", offsets[:-1]) if n else array("q")
+    out_targets = array("i", bytes(4 * len(sources)))
+    out_types = array("H", bytes(2 * len(sources)))
+    for s, t, ty in zip(sources, targets, types):
+        pos = cursor[s]
+        out_targets[pos] = t
+        out_types[pos] = ty
+        cursor[s] = pos + 1
+    return offsets, out_targets, out_types
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# k-hop 확장
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def expand(graph: CompactGraph, seeds: Sequence[str], depth: int = 2,
+           rel_types: Optional[Iterable[str]] = DOCUMENT_RELATION_TYPES,
+           direction: str = "both",
+           fanout: Union[int, Sequence[int], None] = None,
+           max_nodes: Optional[int] = None) -> List[Reached]:
+    """seed 문서에서 depth hop까지 BFS 확장
+
+    rel_types: 따라갈 관계 타입 (None이면 전체)
+    direction: "out" | "in" | "both"
+    fanout: 노드 하나가 hop마다 새로 펼칠 최대 이웃 수 (정수 또는 hop별 목록)
+    max_nodes: 반환할 최대 노드 수 (seed 포함)
+    """
+    if direction not in ("out", "in", "both"):
+        raise ValueError(f"direction은 out/in/both 중 하나: {direction}")
+    mask = graph.type_mask(rel_types)
+    adjacency = []
+    if direction in ("out", "both"):
+        adjacency.append((graph.out_offsets, graph.out_targets, graph.out_types))
+    if direction in ("in", "both"):
+        adjacency.append((graph.in_offsets, graph.in_targets, graph.in_types))
+
+    node_ids, type_names = graph.node_ids, graph.type_names
+    visited = set()
+    result: List[Reached] = []
+    frontier = []
+    for seed in seeds:
+        if max_nodes is not None and len(result) >= max_nodes:
+            return result
+        i = graph.index.get(seed)
+        if i is None or i in visited:
+            continue
+        visited.add(i)
+        frontier.append(i)
+        result.append(Reached(seed, 0, None, None))
+
+    for hop in range(1, depth + 1):
+        limit = _hop_limit(fanout, hop)
+        next_frontier = []
+        for u in frontier:
+            taken = 0
+            for offsets, targets, types in adjacency:
+                for k in range(offsets[u], offsets[u + 1]):
+                    if limit is not None and taken >= limit:
+                        break
+                    if not (mask >> types[k]) & 1:
+                        continue
+                    v = targets[k]
+                    if v in visited:
+                        continue
+                    if max_nodes is not None and len(result) >= max_nodes:
+                        return result
+                    visited.add(v)
+                    next_frontier.append(v)
+                    result.append(Reached(node_ids[v], hop, node_ids[u], type_names[types[k]]))
+                    taken += 1
+                if limit is not None and taken >= limit:
+                    break
+        if not next_frontier:
+            break
+        frontier = next_frontier
+
+    return result
+
+
+def _hop_limit(fanout, hop: int) -> Optional[int]:
+    if fanout is None or isinstance(fanout, int):
+        return fanout
+    return fanout[hop - 1] if hop - 1 < len(fanout) else fanout[-1]
+
+
+if __name__ == "__main__":
+    from simulator import generate_graph_data
+
+    graph = CompactGraph.from_graph_data(generate_graph_data())
+    print("=" * 60)
+    print("관련 문서 확장 (2-hop)")
+    print("=" * 60)
+    print(f"  노드 {len(graph):,}개, 엣지 {graph.edge_count:,}개, 관계 타입 {len(graph.type_names)}개")
+    seed = "DOC-GUIDE-INS-SAMSUNG-PRD-LIFE-WHOLE-001"
+    for r in expand(graph, [seed], depth=2, fanout=5):
+        print(f"  {'  ' * r.hop}[{r.hop}] {r.node_id}" + (f"  ← {r.rel_type}" if r.rel_type else ""))
@@ -0,0 +1,213 @@
+"""
+Merkle 서브트리 해시 (그래프 스냅샷 비교용)
+
+생성 그래프의 계층 엣지(ROOT → 보험사 → 보험사-상품 → 문서)를 트리로 보고
+노드마다 아래 서브트리 전체를 요약하는 해시를 만든다.
+두 스냅샷의 해시가 같은 서브트리는 내용도 같으므로 diff는 해시가 다른 가지로만 내려간다.
+
+- 자기 해시(own): 노드 (id, labels, properties) + 계층 엣지가 아닌 나가는 엣지 (키 정렬 JSON)
+- 서브트리 해시: 자식이 없으면 own, 있으면 H(own, (자식 id, 자식 서브트리 해시)… id 순)
+- 그래프 해시: 계층 부모가 없는 최상위 노드들의 (id, 서브트리 해시) 목록 + 트리 밖 항목 해시
+  (ROOT 아래에 없는 노드도 최상위로 포함되어 모든 노드·엣지 변경이 루트까지 전파된다.
+  트리 밖 항목 = 중복 id 노드, 소스 노드가 없는 엣지)
+- 해시는 blake2b-128, 직렬화는 백엔드와 무관하게 표준 json (스냅샷 간 비교 가능)
+- source: 해시를 계산한 graph_data의 노드·엣지 수와 지문(노드·엣지 목록 전체의 키 정렬 JSON 해시).
+  from_graph는 저장된 "merkle" 키를 현재 graph_data와 맞춰 보고, 다르거나 없으면 다시 계산한다
+  (graph_data만 고치고 "merkle" 키는 그대로 둔 스냅샷이 같은 그래프로 보이지 않도록)
+
+출력 형식 (그래프 JSON의 "merkle" 키):
+    {"algorithm": "blake2b-128", "tree_edges": [...], "root": 그래프 해시, "tops": [최상위 id], "extra": 트리 밖 항목 해시,
+     "source": {"nodes": 노드 수, "edges": 엣지 수, "digest": graph_data 지문},
+     "nodes": {id: 서브트리 해시 (잎) | [서브트리 해시, own, [자식 id]] (내부 노드)}}
+
+    tree = build_merkle(nodes, edges)
+    graph["merkle"] = tree.to_dict()
+    tree = MerkleTree.from_graph(graph)   # "merkle" 키가 없거나 graph_data와 다르면 다시 계산
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ALGORITHM = "blake2b-128"
+TREE_EDGES = ("HAS_CARRIER", "OFFERS", "HAS_DOCUMENT", "HAS_COMMON_DOC", "HAS_REGULATION")
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+_PLAIN_EDGE_KEYS = frozenset(("source", "target", "type"))
+
+
+def _canonical(obj) -> bytes:
+    return _ENCODER.encode(obj).encode()
+
+
+def _edge_key(edge: dict) -> bytes:
+    """소스를 뺀 엣지 직렬화 (속성 없는 엣지는 JSON 대신 "type\\x1ftarget")"""
+    if edge.keys() <= _PLAIN_EDGE_KEYS:
+        return f"{edge.get('type')}\x1f{edge.get('target')}".encode()
+    return _canonical({k: v for k, v in edge.items() if k != "source"})
+
+
+def node_hash(node: dict, out_edges: Iterable[dict] = ()) -> str:
+    """노드 자체 + 나가는 (계층 외) 엣지의 해시"""
+    edges = sorted(_edge_key(e) for e in out_edges)
+    return _digest(_canonical([node.get("id"), node.get("labels", []), node.get("properties", {})])
+                   + b"\0" + b"\0".join(edges))
+
+
+def graph_digest(nodes: List[dict], edges: List[dict]) -> str:
+    """graph_data 지문: 노드·엣지 목록 전체 (목록 순서 포함)"""
+    return _digest(_canonical([nodes, edges]))
+
+
+def subtree_hash(own: str, children: List[Tuple[str, str]]) -> str:
+    """children: (자식 id, 자식 서브트리 해시) id 순"""
+    if not children:
+        return own
+    return _digest(_canonical([own, children]))
+
+
+@dataclass
+class MerkleTree:
+    root: str = ""
+    tops: List[str] = field(default_factory=list)
+    hashes: Dict[str, str] = field(default_factory=dict)           # id → 서브트리 해시
+    own: Dict[str, str] = field(default_factory=dict)              # 내부 노드 id → 자기 해시
+    children: Dict[str, List[str]] = field(default_factory=dict)   # 내부 노드 id → 자식 id (정렬)
+    extra: str = ""  # 트리 밖 항목 해시
+    tree_edges: Tuple[str, ...] = TREE_EDGES
+    cycles: int = 0  # 순환이라 트리에서 뺀 계층 엣지 수
+    source: Dict[str, object] = field(default_factory=dict)  # {"nodes", "edges", "digest"}: 계산한 graph_data
+    stored: bool = False  # from_graph가 저장된 "merkle" 키를 그대로 썼는지
+
+    def own_hash(self, node_id: str) -> Optional[str]:
+        """자기 해시 (잎은 서브트리 해시와 같음)"""
+        return self.own.get(node_id, self.hashes.get(node_id))
+
+    def subtree(self, node_id: str) -> Iterable[str]:
+        """node_id와 그 아래 모든 노드 id (전위 순회)"""
+        stack = [node_id]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            yield current
+            stack.extend(reversed(self.children.get(current, [])))
+
+    def to_dict(self) -> dict:
+        nodes = {}
+        for node_id, h in self.hashes.items():
+            kids = self.children.get(node_id)
+            nodes[node_id] = [h, self.own[node_id], kids] if kids else h
+        return {"algorithm": ALGORITHM, "tree_edges": list(self.tree_edges), "root": self.root,
+                "tops": self.tops, "extra": self.extra, "source": self.source, "nodes": nodes}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MerkleTree":
+        if data.get("algorithm") != ALGORITHM:
+            raise ValueError(f"지원하지 않는 Merkle 해시: {data.get('algorithm')}")
+        tree = cls(root=data["root"], tops=list(data["tops"]), extra=data.get("extra", ""),
+                   tree_edges=tuple(data["tree_edges"]), source=dict(data.get("source") or {}))
+        for node_id, entry in data["nodes"].items():
+            if isinstance(entry, str):
+                tree.hashes[node_id] = entry
+            else:
+                tree.hashes[node_id], tree.own[node_id], tree.children[node_id] = entry
+        return tree
+
+    @classmethod
+    def from_graph(cls, graph: dict) -> "MerkleTree":
+        """그래프 JSON의 "merkle" 키 (없거나 graph_data와 맞지 않으면 graph_data로 다시 계산)
+
+        저장된 키는 tree_edges와 source(노드·엣지 수, 지문)가 현재 graph_data와 같을 때만 쓴다.
+        수부터 비교하므로 노드·엣지가 늘거나 준 스냅샷은 지문을 계산하지 않고 바로 다시 계산한다.
+        """
+        data = graph.get("graph_data", {})
+        nodes, edges = data.get("nodes", []), data.get("edges", [])
+        stored = graph.get("merkle")
+        digest = None
+        if (isinstance(stored, dict) and stored.get("algorithm") == ALGORITHM
+                and tuple(stored.get("tree_edges", ())) == TREE_EDGES):
+            source = stored.get("source") or {}
+            if source.get("nodes") == len(nodes) and source.get("edges") == len(edges):
+                digest = graph_digest(nodes, edges)
+                if source.get("digest") == digest:
+                    tree = cls.from_dict(stored)
+                    tree.stored = True
+                    return tree
+        return build_merkle(nodes, edges, digest=digest)
+
+
+def build_merkle(nodes: List[dict], edges: List[dict], tree_edges: Iterable[str] = TREE_EDGES,
+                 digest: Optional[str] = None) -> MerkleTree:
+    """노드·엣지 목록 → Merkle 트리 (자식부터 후위 순회, 재귀 없음)
+
+    digest: 이미 계산한 graph_digest(nodes, edges) (None이면 여기서 계산)
+    """
+    tree_types = frozenset(tree_edges)
+    by_id = {}
+    extra = []  # 중복 id 노드(첫 노드만 트리에), 소스 노드가 없는 엣지
+    for node in nodes:
+        if by_id.setdefault(node["id"], node) is not node:
+            extra.append(_canonical(node))
+
+    kids: Dict[str, set] = {}
+    out_edges: Dict[str, List[dict]] = {}
+    has_parent = set()
+    for edge in edges:
+        source, target = edge.get("source"), edge.get("target")
+        if edge.get("type") in tree_types and source in by_id and target in by_id and source != target:
+            kids.setdefault(source, set()).add(target)
+            has_parent.add(target)
+        else:
+            out_edges.setdefault(source, []).append(edge)
+
+    tree = MerkleTree(tree_edges=tuple(tree_edges), source={
+        "nodes": len(nodes), "edges": len(edges),
+        "digest": digest if digest is not None else graph_digest(nodes, edges)})
+    # 모든 노드가 부모를 가지는 순환 덩어리는 첫 노드를 최상위로 삼는다
+    tops = [node_id for node_id in by_id if node_id not in has_parent]
+    pending = list(by_id)
+
+    in_progress = set()
+    for start in tops + pending:
+        if start in tree.hashes:
+            continue
+        if start not in tops:
+            tops.append(start)
+        stack = [(start, False)]
+        while stack:
+            node_id, expanded = stack.pop()
+            if expanded:
+                in_progress.discard(node_id)
+                own = node_hash(by_id[node_id], out_edges.get(node_id, ()))
+                children = sorted(c for c in kids.get(node_id, ()) if c in tree.hashes and c not in in_progress)
+                tree.hashes[node_id] = subtree_hash(own, [(c, tree.hashes[c]) for c in children])
+                if children:
+                    tree.own[node_id] = own
+                    tree.children[node_id] = children
+                continue
+            if node_id in tree.hashes or node_id in in_progress:
+                continue
+            in_progress.add(node_id)
+            stack.append((node_id, True))
+            for child in sorted(kids.get(node_id, ()), reverse=True):
+                if child in in_progress:
+                    tree.cycles += 1
+                elif child not in tree.hashes:
+                    stack.append((child, False))
+
+    for source, dangling in out_edges.items():
+        if source not in by_id:
+            extra.extend(_canonical(e) for e in dangling)
+    tree.extra = _digest(b"\0".join(sorted(extra)))
+    tree.tops = sorted(tops)
+    tree.root = _digest(_canonical([[(t, tree.hashes[t]) for t in tree.tops], tree.extra]))
+    return tree
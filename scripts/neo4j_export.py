@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Neo4j 일괄 적재(neo4j-admin import) CSV 내보내기
+
+simulator_ontology.generate_ontology_graph() 결과를 속성 그래프 CSV로 흘려 쓴다.
+JSON 한 파일 대신 레이블/관계 타입별로 나눈 CSV를 neo4j-admin으로 적재하면
+큰 온톨로지 그래프도 로컬 그래프 DB에 일괄 속도로 넣어 질의 벤치마크를 할 수 있다.
+
+    nodes_<주 레이블>.csv   id:ID, 속성..., ontology_types:string[], :LABEL
+    rels_<관계 타입>.csv    :START_ID, :END_ID, :TYPE
+    import.sh              neo4j-admin database import full 명령
+
+- 주 레이블은 labels[0] (Document, Carrier, Product, ...), 나머지 레이블은 :LABEL 열에 함께
+- @type 목록은 ontology_types 배열 속성
+- 속성 열과 타입(string/long/double/boolean/배열)은 레이블별로 한 번 훑어 결정하고,
+  한 키에 타입이 섞이면 string으로 내린다
+- 노드가 없는 끝점을 가리키는 엣지는 건너뛰고 건수만 센다 (neo4j-admin은 그런 엣지에서 실패)
+
+    python neo4j_export.py --scale 10 --out /tmp/kms-neo4j
+    cd /tmp/kms-neo4j && sh import.sh
+"""
+
+import argparse
+import csv
+import os
+from typing import Dict, List, Optional, Sequence
+
+from profiling import phase, profiled
+
+ARRAY_DELIMITER = ";"
+TYPES_PROPERTY = "ontology_types"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 속성 스키마
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _kind(value) -> Optional[str]:
+    """값 → neo4j-admin 헤더 타입 (None / 빈 배열은 판단 보류)"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, (list, tuple)):
+        kinds = {_kind(v) for v in value} - {None}
+        if not kinds:
+            return None
+        if len(kinds) == 1 and not next(iter(kinds)).endswith("[]"):
+            return next(iter(kinds)) + "[]"
+        return "string[]"
+    return "string"
+
+
+def _merge(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+    if {a, b} == {"long", "double"}:
+        return "double"
+    return "string[]" if a.endswith("[]") or b.endswith("[]") else "string"
+
+
+def property_schema(nodes: Sequence[dict]) -> Dict[str, Dict[str, str]]:
+    """주 레이블 → {속성 키: 타입} (처음 등장한 순서)"""
+    schema: Dict[str, Dict[str, Optional[str]]] = {}
+    for node in nodes:
+        columns = schema.setdefault(_primary_label(node), {})
+        for key, value in node.get("properties", {}).items():
+            columns[key] = _merge(columns.get(key), _kind(value))
+    return {label: {k: t or "string" for k, t in cols.items()} for label, cols in schema.items()}
+
+
+def _primary_label(node: dict) -> str:
+    labels = node.get("labels") or ["Node"]
+    return labels[0]
+
+
+def _cell(value, kind: str) -> str:
+    """헤더 타입에 맞춘 셀 값 (빈 문자열 = 속성 없음)"""
+    if value is None:
+        return ""
+    if kind.endswith("[]"):
+        items = value if isinstance(value, (list, tuple)) else [value]
+        return ARRAY_DELIMITER.join(_scalar(v) for v in items if v is not None)
+    if isinstance(value, (list, tuple)):  # 스칼라 열에 배열이 섞인 경우
+        return ARRAY_DELIMITER.join(_scalar(v) for v in value)
+    return _scalar(value)
+
+
+def _scalar(value) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 내보내기
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def export_neo4j(graph_data: dict, out_dir: str, database: str = "neo4j") -> Dict[str, int]:
+    """레이블/관계 타입별 CSV + import.sh 생성. 파일별 행 수 반환 (건너뛴 엣지는 "skipped_edges")"""
+    os.makedirs(out_dir, exist_ok=True)
+    gd = graph_data.get("graph_data", {})
+    nodes = gd.get("nodes", [])
+    schema = property_schema(nodes)
+
+    counts: Dict[str, int] = {}
+    node_files: Dict[str, str] = {}
+    rel_files: Dict[str, str] = {}
+    handles = []
+    multiline = False
+    try:
+        with phase("nodes"):
+            writers = {}
+            for label, columns in schema.items():
+                name = f"nodes_{_safe_name(label)}.csv"
+                f = open(os.path.join(out_dir, name), "w", encoding="utf-8", newline="")
+                handles.append(f)
+                w = csv.writer(f)
+                w.writerow(["id:ID"] + [f"{k}:{t}" for k, t in columns.items()] + [f"{TYPES_PROPERTY}:string[]", ":LABEL"])
+                writers[label] = (w, list(columns.items()))
+                node_files[label] = name
+                counts[name] = 0
+
+            node_ids = set()
+            for node in nodes:
+                label = _primary_label(node)
+                w, columns = writers[label]
+                props = node.get("properties", {})
+                row = [node["id"]]
+                row += [_cell(props.get(k), t) for k, t in columns]
+                row.append(ARRAY_DELIMITER.join(node.get("@type", [])))
+                row.append(ARRAY_DELIMITER.join(node.get("labels") or [label]))
+                if not multiline and any("\n" in c for c in row):
+                    multiline = True
+                w.writerow(row)
+                node_ids.add(node["id"])
+                counts[node_files[label]] += 1
+
+        with phase("relationships"):
+            rel_writers = {}
+            skipped = 0
+            for edge in gd.get("edges", []):
+                src, tgt, rel_type = edge["source"], edge["target"], edge["type"]
+                if src not in node_ids or tgt not in node_ids:
+                    skipped += 1
+                    continue
+                w = rel_writers.get(rel_type)
+                if w is None:
+                    name = f"rels_{_safe_name(rel_type)}.csv"
+                    f = open(os.path.join(out_dir, name), "w", encoding="utf-8", newline="")
+                    handles.append(f)
+                    w = rel_writers[rel_type] = csv.writer(f)
+                    w.writerow([":START_ID", ":END_ID", ":TYPE"])
+                    rel_files[rel_type] = name
+                    counts[name] = 0
+                w.writerow((src, tgt, rel_type))
+                counts[rel_files[rel_type]] += 1
+            counts["skipped_edges"] = skipped
+    finally:
+        for f in handles:
+            f.close()
+
+    _write_import_script(out_dir, node_files, rel_files, database, multiline)
+    return counts
+
+
+def _write_import_script(out_dir: str, node_files: Dict[str, str], rel_files: Dict[str, str],
+                         database: str, multiline: bool) -> str:
+    args: List[str] = [f"--nodes={label}={name}" for label, name in node_files.items()]
+    args += [f"--relationships={rel_type}={name}" for rel_type, name in rel_files.items()]
+    args += [f'--array-delimiter="{ARRAY_DELIMITER}"', "--overwrite-destination=true"]
+    if multiline:
+        args.append("--multiline-fields=true")
+    lines = [
+        "#!/bin/sh",
+        "# neo4j_export.py 생성: 출력 디렉토리에서 실행 (DB는 정지 상태여야 함)",
+        'cd "$(dirname "$0")"',
+        "neo4j-admin database import full \\",
+        *[f"  {a} \\" for a in args],
+        f"  {database}",
+        "",
+    ]
+    path = os.path.join(out_dir, "import.sh")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.chmod(path, 0o755)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="온톨로지 그래프 → neo4j-admin import CSV")
+    parser.add_argument("--scale", type=int, default=1, help="보험사 복제 배수 (simulator scaled_carriers)")
+    parser.add_argument("--graph", help="생성 대신 읽을 knowledge-graph-ontology.json 경로")
+    parser.add_argument("--out", default="data/neo4j-import", help="출력 디렉토리")
+    parser.add_argument("--database", default="neo4j", help="적재할 데이터베이스 이름")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Neo4j import CSV 내보내기")
+    print("=" * 60)
+
+    with phase("generation"):
+        if args.graph:
+            from serialization import load_json
+            graph_data = load_json(args.graph)
+        else:
+            from simulator_ontology import generate_ontology_graph
+            graph_data = generate_ontology_graph(scale=args.scale)
+
+    counts = export_neo4j(graph_data, args.out, args.database)
+    skipped = counts.pop("skipped_edges")
+    for name, rows in counts.items():
+        print(f"  ✓ {name}: {rows:,}행")
+    if skipped:
+        print(f"  ⚠ 끝점 노드가 없어 건너뛴 엣지: {skipped:,}건")
+    print(f"\n  저장: {args.out} (import.sh)")
+    return 0
+
+
+if __name__ == "__main__":
+    with profiled("neo4j_export"):
+        status = main()
+    exit(status)
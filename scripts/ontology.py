@@ -7,13 +7,6 @@ GA 지식체계 온톨로지 정의
 설계→시뮬레이션→검증 사이클의 '설계' 단계 산출물.
 """
 
-from taxonomy import (
-    CARRIERS, PRODUCTS, PRODUCT_CATEGORIES, DOC_TYPES,
-    PROCESSES, AUDIENCES, CERTIFICATIONS, DEFAULT_RELATIONS,
-    DATA_TIERS, REGULATION_TIMELINE, COMMISSION_TYPES,
-    CHARGEBACK_RULES, KPI_METRICS
-)
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # 1. 클래스 계층 (Class Hierarchy)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -705,20 +698,23 @@ def get_ontology_stats():
 
 if __name__ == "__main__":
     import json
-    stats = get_ontology_stats()
-    print("=" * 60)
-    print("GA 지식체계 온톨로지 통계")
-    print("=" * 60)
-    print(json.dumps(stats, indent=2, ensure_ascii=False))
-
-    print("\n예시: DOC-COMMISSION 클래스 계층")
-    for cls in DOC_TYPE_CLASS_MAP.get("DOC-COMMISSION", []):
-        hierarchy = get_class_hierarchy(cls)
-        print(f"  {cls}: {' > '.join(hierarchy)}")
-
-    print("\n예시: '수수료' 동의어 해석")
-    print(f"  {resolve_synonyms('수수료')}")
-
-    print("\n예시: '수수료' 관련 개념")
-    for c in get_related_concepts("수수료"):
-        print(f"  {c}: {CONCEPTS[c]['name']}")
+    from profiling import profiled
+
+    with profiled("ontology"):
+        stats = get_ontology_stats()
+        print("=" * 60)
+        print("GA 지식체계 온톨로지 통계")
+        print("=" * 60)
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+
+        print("\n예시: DOC-COMMISSION 클래스 계층")
+        for cls in DOC_TYPE_CLASS_MAP.get("DOC-COMMISSION", []):
+            hierarchy = get_class_hierarchy(cls)
+            print(f"  {cls}: {' > '.join(hierarchy)}")
+
+        print("\n예시: '수수료' 동의어 해석")
+        print(f"  {resolve_synonyms('수수료')}")
+
+        print("\n예시: '수수료' 관련 개념")
+        for c in get_related_concepts("수수료"):
+            print(f"  {c}: {CONCEPTS[c]['name']}")
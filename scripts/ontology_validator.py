@@ -6,15 +6,24 @@
 그래프 구조(노드 타입, 필수 속성, 프로세스 순서, 규제 관계 등)를 검증한다.
 """
 
-import json
+import argparse
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
 
+import ontology
+import taxonomy
 from ontology import (
     get_all_subclasses,
 )
+from bitmap_index import BitmapIndex
+from process_dag import ProcessDAG
+from result_cache import GRAPH, ResultCache, table_fingerprints
+from rule_timing import RuleTimer
+from taxonomy import DOC_TYPE_DOMAIN_MAP
+from profiling import profiled
+from serialization import dump_json, load_json
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -42,6 +51,7 @@ class ValidationResult:
     details: str
     found_count: int = 0
     expected_count: int = 0
+    interval: Optional[Tuple[float, float]] = None  # 표본 근사 시 score의 신뢰구간
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -57,11 +67,12 @@ class OntologyGraph:
         self.adj: Dict[str, List[Edge]] = {}       # source → edges
         self.rev_adj: Dict[str, List[Edge]] = {}    # target → edges
         self.taxonomy = {}
+        self.label_index = BitmapIndex()  # 레이블/@type 비트맵
+        self._process_dag: Optional[ProcessDAG] = None
         self.load(path)
 
     def load(self, path: str):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(path)
 
         self.taxonomy = data.get("taxonomy", {})
 
@@ -84,17 +95,21 @@ class OntologyGraph:
             self.adj.setdefault(edge.source, []).append(edge)
             self.rev_adj.setdefault(edge.target, []).append(edge)
 
+        self.label_index = BitmapIndex.build(
+            (n.id, {"label": n.labels, "type": n.types}) for n in self.nodes.values()
+        )
+
         print(f"  로드: {len(self.nodes)}개 노드, {len(self.edges)}개 엣지")
 
     # ── 질의 메서드 ──
 
     def nodes_by_label(self, label: str) -> List[Node]:
         """특정 레이블을 가진 노드 반환"""
-        return [n for n in self.nodes.values() if label in n.labels]
+        return self._select(self.label_index.eq("label", label))
 
     def nodes_by_type(self, ontology_class: str) -> List[Node]:
         """특정 온톨로지 클래스(@type)를 가진 노드 반환"""
-        return [n for n in self.nodes.values() if ontology_class in n.types]
+        return self._select(self.label_index.eq("type", ontology_class))
 
     def nodes_by_type_hierarchy(self, ontology_class: str) -> List[Node]:
         """온톨로지 클래스 + 모든 하위 클래스에 해당하는 노드 반환"""
@@ -102,10 +117,14 @@ class OntologyGraph:
         subclasses = get_all_subclasses(ontology_class)
         target_classes.update(subclasses)
 
-        return [
-            n for n in self.nodes.values()
-            if any(t in target_classes for t in n.types)
-        ]
+        return self._select(self.label_index.any_of("type", target_classes))
+
+    def count_by_label(self, label: str) -> int:
+        """레이블별 노드 수 (노드 목록을 만들지 않음)"""
+        return self.label_index.eq("label", label).count()
+
+    def _select(self, bitmap) -> List[Node]:
+        return [self.nodes[node_id] for node_id in bitmap.ids()]
 
     def outgoing(self, node_id: str, rel_type: str = None) -> List[Edge]:
         """나가는 엣지 (필터 가능)"""
@@ -121,6 +140,16 @@ class OntologyGraph:
             return [e for e in edges if e.rel_type == rel_type]
         return edges
 
+    def process_dag(self) -> ProcessDAG:
+        """PRECEDES/USED_IN 기반 프로세스 DAG (처음 요청 시 구성 후 캐시)"""
+        if self._process_dag is None:
+            self._process_dag = ProcessDAG(
+                [n.id for n in self.processes()],
+                ((e.source, e.target) for e in self.edges if e.rel_type == "PRECEDES"),
+                ((e.source, e.target) for e in self.edges if e.rel_type == "USED_IN"),
+            )
+        return self._process_dag
+
     def documents(self) -> List[Node]:
         """문서 노드만 반환"""
         return self.nodes_by_label("Document")
@@ -142,85 +171,202 @@ class OntologyGraph:
 # 검증 시나리오
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def validate_graph_structure(g: OntologyGraph) -> List[ValidationResult]:
-    """그래프 구조 기본 검증"""
-    results = []
-
-    # 1. 노드에 @type 존재 확인
+def _sampled_ratio(items: Iterable[Node], stratum_of: Callable[[Node], tuple], ok: Callable[[Node], bool],
+                   per_stratum: int, confidence: float, seed: int):
+    """층화 표본으로 ok 비율 추정 → (비율, (하한, 상한), 표본 수, 모집단 수)"""
+    from sampling import RateTally, StratifiedSample
+
+    sample = StratifiedSample(per_stratum, seed)
+    for node in items:
+        sample.add(stratum_of(node), node)
+    tally = RateTally(sample)
+    for stratum, node in sample.items():
+        tally.record("ok", stratum, not ok(node))
+    estimates = tally.estimates(confidence)
+    if not estimates:
+        return 0, (0.0, 0.0), 0, 0
+    est = estimates[0]
+    return 1 - est.rate, (1 - est.high, 1 - est.low), est.sampled, est.population
+
+
+def _document_stratum(node: Node) -> tuple:
+    """문서 층: (docType 기본 도메인, tier)"""
+    return DOC_TYPE_DOMAIN_MAP.get(node.properties.get("doc_type", ""), ""), node.properties.get("tier", "")
+
+
+DOC_REQUIRED_PROPERTIES = ["name", "carrier", "doc_type", "tier"]
+
+
+def _check_type_coverage(g: OntologyGraph, sample_per_stratum: Optional[int], confidence: float,
+                         seed: int) -> Tuple[ValidationResult, int]:
+    """1. 노드에 @type 존재 확인"""
+    if sample_per_stratum is not None:
+        ratio, interval, sampled, total = _sampled_ratio(
+            g.nodes.values(), lambda n: (n.labels[0] if n.labels else "",), lambda n: bool(n.types),
+            sample_per_stratum, confidence, seed)
+        return ValidationResult(
+            name="노드 @type 커버리지",
+            passed=ratio >= 0.9,
+            score=ratio,
+            details=f"표본 {sampled}/{total} 노드, @type 존재 추정 {ratio:.1%} "
+                    f"({confidence:.0%} 구간 {interval[0]:.1%}~{interval[1]:.1%})",
+            found_count=round(ratio * total),
+            expected_count=total,
+            interval=interval,
+        ), sampled
     typed_nodes = sum(1 for n in g.nodes.values() if n.types)
     total = len(g.nodes)
     ratio = typed_nodes / total if total > 0 else 0
-    results.append(ValidationResult(
+    return ValidationResult(
         name="노드 @type 커버리지",
         passed=ratio >= 0.9,
         score=ratio,
         details=f"{typed_nodes}/{total} 노드에 @type 존재",
         found_count=typed_nodes,
         expected_count=total,
-    ))
+    ), total
 
-    # 2. 문서 노드에 필수 속성 존재
+
+def _check_document_properties(g: OntologyGraph, sample_per_stratum: Optional[int], confidence: float,
+                               seed: int) -> Tuple[ValidationResult, int]:
+    """2. 문서 노드에 필수 속성 존재"""
     docs = g.documents()
+    if sample_per_stratum is not None:
+        ratio, interval, sampled, total = _sampled_ratio(
+            docs, _document_stratum, lambda d: all(d.properties.get(k) for k in DOC_REQUIRED_PROPERTIES),
+            sample_per_stratum, confidence, seed + 1)
+        return ValidationResult(
+            name="문서 필수 속성 완전성",
+            passed=ratio >= 0.95,
+            score=ratio,
+            details=f"표본 {sampled}/{total} 문서, 필수 속성 존재 추정 {ratio:.1%} "
+                    f"({confidence:.0%} 구간 {interval[0]:.1%}~{interval[1]:.1%})",
+            found_count=round(ratio * total),
+            expected_count=total,
+            interval=interval,
+        ), sampled
     complete = sum(1 for d in docs if all(
-        d.properties.get(k) for k in ["name", "carrier", "doc_type", "tier"]
+        d.properties.get(k) for k in DOC_REQUIRED_PROPERTIES
     ))
     ratio = complete / len(docs) if docs else 0
-    results.append(ValidationResult(
+    return ValidationResult(
         name="문서 필수 속성 완전성",
         passed=ratio >= 0.95,
         score=ratio,
         details=f"{complete}/{len(docs)} 문서에 필수 속성 존재",
         found_count=complete,
         expected_count=len(docs),
-    ))
+    ), len(docs)
 
-    # 3. 프로세스 순서(PRECEDES) 체인 존재
+
+def _check_process_order(g: OntologyGraph, *_) -> Tuple[ValidationResult, int]:
+    """3. 프로세스 순서(PRECEDES) 체인 존재"""
     process_edges = [e for e in g.edges if e.rel_type == "PRECEDES"]
-    results.append(ValidationResult(
+    return ValidationResult(
         name="프로세스 순서 관계",
         passed=len(process_edges) >= 6,
         score=min(len(process_edges) / 7, 1.0),
         details=f"{len(process_edges)}개 PRECEDES 엣지",
         found_count=len(process_edges),
         expected_count=7,
-    ))
+    ), len(g.edges)
+
+
+def _check_process_dag(g: OntologyGraph, *_) -> Tuple[ValidationResult, int]:
+    """3-1. PRECEDES 체인이 순환 없는 DAG인지 (끝점이 모두 프로세스)"""
+    dag = g.process_dag()
+    return ValidationResult(
+        name="프로세스 순서 DAG",
+        passed=dag.is_acyclic and not dag.unknown_edges,
+        score=len(dag.order) / len(dag.keys) if dag.keys else 0,
+        details=f"위상 정렬 {len(dag.order)}/{len(dag.keys)}개, 순환 {len(dag.cycles)}개, "
+                f"프로세스 외 끝점 {len(dag.unknown_edges)}개",
+        found_count=len(dag.order),
+        expected_count=len(dag.keys),
+    ), len(dag.keys) + dag.edge_count()
+
 
-    # 4. 규제 노드 존재 + GOVERNS/RESTRICTS 엣지
+def _check_regulations(g: OntologyGraph, *_) -> Tuple[ValidationResult, int]:
+    """4. 규제 노드 존재 + GOVERNS/RESTRICTS 엣지"""
     regs = g.regulations()
     governs = sum(1 for e in g.edges if e.rel_type == "GOVERNS")
     restricts = sum(1 for e in g.edges if e.rel_type == "RESTRICTS")
-    results.append(ValidationResult(
+    return ValidationResult(
         name="규제 관계 존재",
         passed=len(regs) > 0 and governs > 0 and restricts > 0,
         score=min((governs + restricts) / 4, 1.0),
         details=f"규제 {len(regs)}개, GOVERNS {governs}개, RESTRICTS {restricts}개",
         found_count=governs + restricts,
         expected_count=4,
-    ))
+    ), 2 * len(g.edges)
+
 
-    # 5. 개념 노드 + 관계 존재
+def _check_concepts(g: OntologyGraph, *_) -> Tuple[ValidationResult, int]:
+    """5. 개념 노드 + 관계 존재"""
     concepts = g.concepts()
     concept_edges = sum(1 for e in g.edges if e.rel_type in ("BROADER", "NARROWER", "EXPLAINS", "RELATED_TO", "ANTONYM_OF"))
-    results.append(ValidationResult(
+    return ValidationResult(
         name="개념 그래프 존재",
         passed=len(concepts) >= 10 and concept_edges >= 10,
         score=min(len(concepts) / 20, 1.0),
         details=f"개념 {len(concepts)}개, 개념관계 {concept_edges}개",
         found_count=len(concepts),
         expected_count=20,
-    ))
+    ), len(g.edges)
+
 
-    # 6. USED_IN 엣지 (문서→프로세스)
+def _check_used_in(g: OntologyGraph, *_) -> Tuple[ValidationResult, int]:
+    """6. USED_IN 엣지 (문서→프로세스)"""
     used_in = sum(1 for e in g.edges if e.rel_type == "USED_IN")
-    results.append(ValidationResult(
+    return ValidationResult(
         name="문서-프로세스 연결",
         passed=used_in >= 50,
         score=min(used_in / 100, 1.0),
         details=f"{used_in}개 USED_IN 엣지",
         found_count=used_in,
         expected_count=100,
-    ))
-
+    ), len(g.edges)
+
+
+# (항목 이름, 검사 함수 → (결과, 처리 항목 수), 캐시 의존: 그래프 파일 + taxonomy/ontology 테이블 이름)
+STRUCTURE_RULES: List[Tuple[str, Callable, Tuple[str, ...]]] = [
+    ("노드 @type 커버리지", _check_type_coverage, (GRAPH,)),
+    ("문서 필수 속성 완전성", _check_document_properties, (GRAPH, "DOC_TYPE_DOMAIN_MAP")),  # 표본 층
+    ("프로세스 순서 관계", _check_process_order, (GRAPH,)),
+    ("프로세스 순서 DAG", _check_process_dag, (GRAPH,)),
+    ("규제 관계 존재", _check_regulations, (GRAPH,)),
+    ("개념 그래프 존재", _check_concepts, (GRAPH,)),
+    ("문서-프로세스 연결", _check_used_in, (GRAPH,)),
+]
+
+
+def validate_graph_structure(g: Optional[OntologyGraph], timer: Optional[RuleTimer] = None,
+                             sample_per_stratum: Optional[int] = None,
+                             confidence: Optional[float] = None, seed: int = 0,
+                             cache: Optional[ResultCache] = None) -> List[ValidationResult]:
+    """그래프 구조 기본 검증 (timer가 있으면 항목별 소요시간/처리량/메모리 기록)
+
+    sample_per_stratum을 주면 노드/문서 단위 항목(1, 2)은 층화 표본으로 비율과 신뢰구간을 추정하고,
+    엣지 타입 집계 항목(3~6)은 그대로 전수 검사한다. confidence가 None이면 sampling.DEFAULT_CONFIDENCE.
+    cache가 있으면 입력이 같은 항목은 저장된 결과를 쓴다 (모든 항목이 캐시에 있으면 g는 None이어도 된다).
+    """
+    timer = timer if timer is not None else RuleTimer()
+    if sample_per_stratum is not None and confidence is None:
+        from sampling import DEFAULT_CONFIDENCE
+        confidence = DEFAULT_CONFIDENCE
+    results = []
+    for name, check, deps in STRUCTURE_RULES:
+        with timer.rule(name) as probe:
+            hit = cache.get(name, deps) if cache is not None else None
+            if hit is not None:
+                fields, probe.items = hit
+                probe.cached = True
+                result = ValidationResult(**fields)
+            else:
+                result, probe.items = check(g, sample_per_stratum, confidence, seed)
+                if cache is not None:
+                    cache.put(name, deps, (asdict(result), probe.items))
+        results.append(result)
     return results
 
 
@@ -229,25 +375,66 @@ def validate_graph_structure(g: OntologyGraph) -> List[ValidationResult]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def main():
+    parser = argparse.ArgumentParser(description="온톨로지 구조 검증")
+    parser.add_argument("--approx", type=int, metavar="N",
+                        help="근사 모드: 노드/문서 단위 항목을 층별 최대 N건 표본으로 추정")
+    parser.add_argument("--confidence", type=float, help="--approx 신뢰수준 (기본 0.95)")
+    parser.add_argument("--seed", type=int, default=0, help="--approx 표본 추출 시드")
+    parser.add_argument("--cache", action="store_true",
+                        help="항목 결과 캐시(data/.cache/ontology_validator.pkl, pickle)를 읽고 씀. 믿을 수 있는 data 디렉터리에서만 사용")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="항목별 최대 메모리 증가량도 계측 (tracemalloc, 실행이 몇 배 느려짐)")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("온톨로지 구조 검증기 v1.1")
     print("=" * 70)
 
     start_time = time.time()
-
-    # 그래프 로드
+    timer = RuleTimer(trace_memory=args.trace_memory)
+    graph_path = "data/knowledge-graph-ontology.json"
+    # --cache: 항목별 결과를 (그래프 해시, 의존 테이블 지문, 옵션) 키로 재사용
+    cache = None if not args.cache else ResultCache(
+        "data/.cache/ontology_validator.pkl",
+        files={GRAPH: graph_path},
+        tables=table_fingerprints(taxonomy, ontology),
+        options={"approx": args.approx, "confidence": args.confidence, "seed": args.seed},
+    )
+
+    # 그래프 로드 (모든 항목이 캐시에 있으면 파일 해시만 확인하고 건너뜀)
     print("\n[1/2] 온톨로지 그래프 로드")
-    try:
-        g = OntologyGraph("data/knowledge-graph-ontology.json")
-    except FileNotFoundError:
-        print("  data/knowledge-graph-ontology.json을 찾을 수 없습니다.")
-        print("  먼저 simulator_ontology.py를 실행하세요.")
-        return 1
+    graph_stats = cache.get("그래프 로드", (GRAPH,)) if cache is not None else None
+    if graph_stats is not None and all(cache.has(name, deps) for name, _, deps in STRUCTURE_RULES):
+        g = None
+        print(f"  로드: {graph_stats['nodes']}개 노드, {graph_stats['edges']}개 엣지")
+    else:
+        try:
+            with timer.rule("그래프 로드") as probe:
+                g = OntologyGraph(graph_path)
+                probe.items = len(g.nodes) + len(g.edges)
+        except FileNotFoundError:
+            timer.close()
+            print("  data/knowledge-graph-ontology.json을 찾을 수 없습니다.")
+            print("  먼저 simulator_ontology.py를 실행하세요.")
+            return 1
+        graph_stats = {
+            "nodes": len(g.nodes),
+            "edges": len(g.edges),
+            "documents": g.count_by_label("Document"),
+            "concepts": g.count_by_label("Concept"),
+            "processes": g.count_by_label("Process"),
+            "regulations": g.count_by_label("Regulation"),
+        }
+        if cache is not None:
+            cache.put("그래프 로드", (GRAPH,), graph_stats)
 
     # 구조 검증
     print("\n[2/2] 그래프 구조 검증")
     print("-" * 70)
-    all_results = validate_graph_structure(g)
+    hits = cache.hits if cache is not None else 0
+    all_results = validate_graph_structure(g, timer, sample_per_stratum=args.approx,
+                                           confidence=args.confidence, seed=args.seed, cache=cache)
+    timer.close()
     for vr in all_results:
         status = "PASS" if vr.passed else "FAIL"
         print(f"  [{status}] {vr.name}: {vr.score:.0%} ({vr.details})")
@@ -269,14 +456,7 @@ def main():
     output = {
         "timestamp": datetime.now().isoformat(),
         "version": "1.1-structure",
-        "graph_stats": {
-            "nodes": len(g.nodes),
-            "edges": len(g.edges),
-            "documents": len(g.documents()),
-            "concepts": len(g.concepts()),
-            "processes": len(g.processes()),
-            "regulations": len(g.regulations()),
-        },
+        "graph_stats": graph_stats,
         "validation": {
             "total_tests": total_count,
             "passed": total_pass,
@@ -289,17 +469,27 @@ def main():
                 "passed": r.passed,
                 "score": round(r.score, 3),
                 "details": r.details,
+                **({"interval": [round(v, 3) for v in r.interval]} if r.interval else {}),
             }
             for r in all_results
         ],
     }
 
     output_path = "docs/results/ontology-validation.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    dump_json(output, output_path, pretty=True)
 
     print(f"\n  결과 저장: {output_path}")
 
+    # 항목별 계측 (ontology-validation.json 옆에 저장)
+    print(f"\n  항목별 소요시간:")
+    timer.print_table()
+    timing_path = timer.export("docs/results/ontology-validation-timing.json", tool="ontology_validator",
+                               nodes=graph_stats["nodes"], edges=graph_stats["edges"])
+    print(f"  계측 저장: {timing_path}")
+    if cache is not None:
+        cache.save()
+        print(f"  결과 캐시: 항목 {cache.hits - hits}/{total_count}개 재사용 ({cache.path})")
+
     # 실패 항목 안내
     failed = [r for r in all_results if not r.passed]
     if failed:
@@ -311,4 +501,6 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    with profiled("ontology_validator"):
+        status = main()
+    exit(status)
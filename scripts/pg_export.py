@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+PostgreSQL COPY 내보내기 (부하 테스트 DB 적재용)
+
+simulator.generate_graph_data() 결과를 packages/api/prisma/schema.prisma 테이블에 맞춰
+COPY 파일로 흘려 쓴다. API로 한 건씩 넣는 대신 psql \\copy 로 수백만 건을 몇 분 안에 적재.
+
+    domain_master        ← taxonomy.DOMAINS
+    documents            ← Document 노드
+    document_placements  ← 문서마다 1건 (properties.domain)
+    relations            ← 문서 ↔ 문서 엣지 (상품 노드 간 SUPERSEDES 등은 제외)
+
+- UUID는 노드/엣지 ID로부터 uuid5로 미리 계산 (같은 그래프 → 같은 UUID)
+- fileHash는 문서 ID·버전·수정일의 sha256 (실제 파일 내용이 아닌 적재용 고유값)
+- placement_code는 API와 같은 "{도메인}/DOC-{순번}" 형식
+- 관계 타입은 API 코드로 변환 (REFERENCES → REFERENCE, SIBLINGS → SIBLING),
+  도메인 필수 관계의 domain_code는 소스 문서의 도메인
+- text(기본) 또는 csv 형식. 적재 스크립트 load.sql 을 함께 생성
+
+    python pg_export.py --scale 100 --out /tmp/kms-copy
+    cd /tmp/kms-copy && psql "$DATABASE_URL" -f load.sql
+
+load.sql은 한 트랜잭션에서 적재하며, 관계 순환 트리거(trg_check_cycle)는 행마다
+재귀 CTE를 돌므로 적재 중에는 끈다 (적재 전 verifier의 계층/버전 순환 검사로 대신함).
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import re
+import uuid
+from typing import Dict, List
+
+from taxonomy import DOMAINS
+from profiling import phase, profiled
+
+FORMATS = ("text", "csv")
+
+# 생성 그래프의 관계 타입 → API RelationType
+RELATION_TYPE_MAP = {
+    "PARENT_OF": "PARENT_OF",
+    "CHILD_OF": "CHILD_OF",
+    "SIBLINGS": "SIBLING",
+    "REFERENCES": "REFERENCE",
+    "SUPERSEDES": "SUPERSEDES",
+}
+# packages/shared RELATION_META.domainRequired 와 동일
+DOMAIN_OPTIONAL_RELATIONS = {"SUPERSEDES"}
+
+# 테이블 → 컬럼 (적재 순서)
+TABLES: Dict[str, List[str]] = {
+    "domain_master": [
+        "code", "display_name", "parent_code", "description", "is_active", "sort_order",
+    ],
+    "documents": [
+        "id", "doc_code", "lifecycle", "security_level", "file_path", "file_name", "file_type",
+        "file_hash", "version_major", "version_minor", "reviewed_at", "created_at", "updated_at",
+    ],
+    "document_placements": [
+        "id", "document_id", "domain_code", "placement_code", "placed_at",
+    ],
+    "relations": [
+        "id", "source_id", "target_id", "relation_type", "domain_code",
+    ],
+}
+
+_NAMESPACE = uuid.UUID("6f1c2d3e-4b5a-5c6d-8e7f-9a0b1c2d3e4f")
+_NAMESPACE_BYTES = _NAMESPACE.bytes
+
+
+def _uuid(kind: str, key: str) -> str:
+    """str(uuid.uuid5(_NAMESPACE, f"{kind}:{key}"))와 같은 값 (UUID 객체 생성 없이)"""
+    b = bytearray(hashlib.sha1(_NAMESPACE_BYTES + f"{kind}:{key}".encode("utf-8")).digest()[:16])
+    b[6] = (b[6] & 0x0F) | 0x50
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COPY 행 기록기
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_TEXT_SPECIAL = re.compile(r"[\\\t\n\r]")
+_TEXT_ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+
+
+def _text_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    text = str(value)
+    if _TEXT_SPECIAL.search(text) is None:  # 대부분의 값은 이스케이프할 문자가 없다
+        return text
+    return _TEXT_SPECIAL.sub(lambda m: _TEXT_ESCAPES[m.group()], text)
+
+
+class CopyWriter:
+    """테이블 하나의 COPY 파일 (text: 탭 구분 + \\N, csv: 빈 값이 NULL)"""
+
+    def __init__(self, path: str, fmt: str = "text"):
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(FORMATS)})")
+        self.path = path
+        self.fmt = fmt
+        self.rows = 0
+        self._f = open(path, "w", encoding="utf-8", newline="")
+        self._csv = csv.writer(self._f) if fmt == "csv" else None
+
+    def write(self, row: tuple) -> None:
+        if self._csv is not None:
+            self._csv.writerow(["" if v is None else ("t" if v is True else "f" if v is False else v) for v in row])
+        else:
+            self._f.write("\t".join(map(_text_value, row)) + "\n")
+        self.rows += 1
+
+    def close(self) -> None:
+        self._f.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 행 변환
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _file_path(cls: dict) -> str:
+    """generate_sample_files 와 같은 폴더 규칙 (상품 → 보험사/상품, 보험사만 → 보험사, 그 외 → GLOBAL)"""
+    doc_type = cls.get("docType", "")
+    if cls.get("product"):
+        return f"data/samples/{cls.get('carrier', '')}/{cls['product']}/{doc_type}.md"
+    if cls.get("carrier"):
+        return f"data/samples/{cls['carrier']}/{doc_type}.md"
+    return f"data/samples/GLOBAL/{doc_type}.md"
+
+
+def _file_hash(node_id: str, props: dict) -> str:
+    version = props.get("version", {})
+    key = f"{node_id}|{version.get('major', 1)}.{version.get('minor', 0)}|{props.get('updatedAt', '')}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def export_copy(graph_data: dict, out_dir: str, fmt: str = "text",
+                doc_code_prefix: str = "DOC-SIM-") -> Dict[str, int]:
+    """COPY 파일 + load.sql 생성. 테이블별 행 수 반환"""
+    os.makedirs(out_dir, exist_ok=True)
+    ext = "csv" if fmt == "csv" else "copy"
+    writers = {table: CopyWriter(os.path.join(out_dir, f"{table}.{ext}"), fmt) for table in TABLES}
+    try:
+        with phase("domains"):
+            for order, (code, d) in enumerate(DOMAINS.items()):
+                writers["domain_master"].write((
+                    code, d.get("name", code), None, f"{d.get('business', '')}/{d.get('function', '')}", True, order,
+                ))
+
+        gd = graph_data.get("graph_data", {})
+        doc_uuid: Dict[str, str] = {}     # 문서 노드 ID → UUID (관계 끝점 판별 겸용)
+        doc_domain: Dict[str, str] = {}
+        placement_seq: Dict[str, int] = {}
+        with phase("documents"):
+            docs, placements = writers["documents"], writers["document_placements"]
+            for node in gd.get("nodes", []):
+                if "Document" not in node.get("labels", []):
+                    continue
+                node_id = node["id"]
+                props = node.get("properties", {})
+                cls = props.get("classification", {})
+                version = props.get("version", {})
+                domain = props.get("domain", "")
+                doc_id = doc_uuid[node_id] = _uuid("document", node_id)
+                doc_domain[node_id] = domain
+                path = _file_path(cls)
+
+                docs.write((
+                    doc_id, f"{doc_code_prefix}{len(doc_uuid):07d}", props.get("lifecycle", "DRAFT"), "INTERNAL",
+                    path, path.rsplit("/", 1)[-1], "md", _file_hash(node_id, props),
+                    version.get("major", 1), version.get("minor", 0),
+                    props.get("reviewedAt"), props.get("createdAt"), props.get("updatedAt"),
+                ))
+                seq = placement_seq[domain] = placement_seq.get(domain, 0) + 1
+                placements.write((
+                    _uuid("placement", node_id), doc_id, domain, f"{domain}/DOC-{seq:03d}",
+                    props.get("createdAt"),
+                ))
+
+        with phase("relations"):
+            relations = writers["relations"]
+            for edge in gd.get("edges", []):
+                rel_type = RELATION_TYPE_MAP.get(edge.get("type"))
+                src, tgt = doc_uuid.get(edge["source"]), doc_uuid.get(edge["target"])
+                if rel_type is None or src is None or tgt is None:
+                    continue
+                domain = None if rel_type in DOMAIN_OPTIONAL_RELATIONS else doc_domain[edge["source"]]
+                relations.write((
+                    _uuid("relation", f"{edge['source']}|{rel_type}|{edge['target']}"), src, tgt, rel_type, domain,
+                ))
+    finally:
+        for w in writers.values():
+            w.close()
+
+    _write_load_script(out_dir, ext, fmt)
+    return {table: w.rows for table, w in writers.items()}
+
+
+def _write_load_script(out_dir: str, ext: str, fmt: str) -> str:
+    """psql 적재 스크립트. domain_master는 이미 있을 수 있으므로 임시 테이블 경유 ON CONFLICT"""
+    options = " WITH (FORMAT csv)" if fmt == "csv" else ""
+    cols = {table: ", ".join(columns) for table, columns in TABLES.items()}
+    lines = [
+        "-- pg_export.py 생성: 출력 디렉토리에서 psql -f load.sql",
+        "\\set ON_ERROR_STOP on",
+        "BEGIN;",
+        "",
+        "CREATE TEMP TABLE _domain_master (LIKE domain_master INCLUDING DEFAULTS) ON COMMIT DROP;",
+        f"\\copy _domain_master ({cols['domain_master']}) FROM 'domain_master.{ext}'{options}",
+        "INSERT INTO domain_master SELECT * FROM _domain_master ON CONFLICT (code) DO NOTHING;",
+        "",
+        f"\\copy documents ({cols['documents']}) FROM 'documents.{ext}'{options}",
+        f"\\copy document_placements ({cols['document_placements']}) FROM 'document_placements.{ext}'{options}",
+        "",
+        "-- 행마다 재귀 CTE를 도는 순환 검사 트리거는 적재 중 끔 (verifier 계층/버전 순환 검사로 사전 확인)",
+        "ALTER TABLE relations DISABLE TRIGGER trg_check_cycle;",
+        f"\\copy relations ({cols['relations']}) FROM 'relations.{ext}'{options}",
+        "ALTER TABLE relations ENABLE TRIGGER trg_check_cycle;",
+        "",
+        "COMMIT;",
+        "ANALYZE documents;",
+        "ANALYZE document_placements;",
+        "ANALYZE relations;",
+        "",
+    ]
+    path = os.path.join(out_dir, "load.sql")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성 그래프 → PostgreSQL COPY 파일")
+    parser.add_argument("--scale", type=int, default=1, help="보험사 복제 배수 (simulator scaled_carriers)")
+    parser.add_argument("--graph", help="생성 대신 읽을 knowledge-graph.json 경로")
+    parser.add_argument("--out", default="data/pg-copy", help="출력 디렉토리")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("PostgreSQL COPY 내보내기")
+    print("=" * 60)
+
+    with phase("generation"):
+        if args.graph:
+            from serialization import load_json
+            graph_data = load_json(args.graph)
+        else:
+            from simulator import generate_graph_data
+            graph_data = generate_graph_data(scale=args.scale)
+
+    counts = export_copy(graph_data, args.out, args.format)
+    for table, rows in counts.items():
+        print(f"  ✓ {table}: {rows:,}행")
+    print(f"\n  저장: {args.out} (load.sql)")
+    return 0
+
+
+if __name__ == "__main__":
+    with profiled("pg_export"):
+        status = main()
+    exit(status)
@@ -0,0 +1,154 @@
+"""
+업무 프로세스 DAG (PRECEDES + USED_IN)
+
+simulator_ontology가 만드는 PRECEDES 체인(BIZ-PROSPECT → … → BIZ-CLAIM, BIZ-ISSUE → BIZ-SETTLE)을
+한 번 분석해 두고 워크플로 질의에 재사용한다.
+
+    dag = ProcessDAG.from_graph_data(graph_data)
+    dag.rank("BIZ-UW")                 # 위상 순위 (선행 단계 최장 경로 길이)
+    dag.prerequisites("BIZ-ISSUE")     # 선행 단계 전체 (위상 순)
+    dag.docs_before("BIZ-ISSUE")       # 선행 단계에서 쓰이는 문서 (USED_IN posting 합집합)
+    dag.cycles                         # 순환에 걸린 프로세스 (정상이면 [])
+
+- 위상 정렬/순위/선행 폐포(비트셋)는 생성 시 한 번 계산
+- docs_before()는 단계별로 처음 요청될 때 계산 후 캐시
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from taxonomy import PROCESSES
+
+
+class ProcessDAG:
+    """프로세스 선후관계 + 단계별 사용 문서"""
+
+    def __init__(self, process_ids: Iterable[str], precedes: Iterable[Tuple[str, str]],
+                 used_in: Iterable[Tuple[str, str]] = ()):
+        self.keys: List[str] = list(dict.fromkeys(process_ids))
+        self.row_of: Dict[str, int] = {pid: i for i, pid in enumerate(self.keys)}
+        n = len(self.keys)
+
+        self._succ: List[List[int]] = [[] for _ in range(n)]
+        indegree = [0] * n
+        self.unknown_edges: List[Tuple[str, str]] = []  # 프로세스가 아닌 끝점
+        for src, tgt in precedes:
+            s, t = self.row_of.get(src), self.row_of.get(tgt)
+            if s is None or t is None:
+                self.unknown_edges.append((src, tgt))
+                continue
+            self._succ[s].append(t)
+            indegree[t] += 1
+
+        # Kahn 위상 정렬 — 정렬되지 못한 노드는 순환 또는 순환 뒤 구간
+        order = [i for i in range(n) if indegree[i] == 0]
+        ranks = [0] * n
+        for u in order:  # order는 순회 중에 늘어난다
+            for v in self._succ[u]:
+                ranks[v] = max(ranks[v], ranks[u] + 1)
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+        self.order: List[str] = [self.keys[i] for i in order]
+        self.cycles: List[str] = [self.keys[i] for i in self._cyclic_rows(set(order))]
+        self._rank = {self.keys[i]: ranks[i] for i in order}
+
+        # 선행 단계 폐포 (위상 순으로 한 번에 전파)
+        self._ancestors = [0] * n
+        for u in order:
+            bits = self._ancestors[u] | (1 << u)
+            for v in self._succ[u]:
+                self._ancestors[v] |= bits
+
+        self._postings: Dict[str, Dict[str, None]] = {}
+        for doc_id, proc_id in used_in:
+            if proc_id in self.row_of:
+                self._postings.setdefault(proc_id, {})[doc_id] = None
+        self._docs_before: Dict[Tuple[str, bool], List[str]] = {}
+
+    def _cyclic_rows(self, sorted_rows: set) -> List[int]:
+        """미정렬 노드에서 (미정렬 구간 안의) 후속이 없는 노드를 반복 제거 → 순환에 걸린 노드만 남김"""
+        remaining = {i for i in range(len(self.keys)) if i not in sorted_rows}
+        outdegree = {i: sum(1 for v in self._succ[i] if v in remaining) for i in remaining}
+        pred: Dict[int, List[int]] = {}
+        for u in remaining:
+            for v in self._succ[u]:
+                if v in remaining:
+                    pred.setdefault(v, []).append(u)
+        sinks = [i for i, d in outdegree.items() if d == 0]
+        while sinks:
+            v = sinks.pop()
+            remaining.discard(v)
+            for u in pred.get(v, ()):
+                outdegree[u] -= 1
+                if outdegree[u] == 0:
+                    sinks.append(u)
+        return sorted(remaining)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[dict], process_ids: Iterable[str] = None) -> "ProcessDAG":
+        precedes, used_in = [], []
+        for e in edges:
+            if e["type"] == "PRECEDES":
+                precedes.append((e["source"], e["target"]))
+            elif e["type"] == "USED_IN":
+                used_in.append((e["source"], e["target"]))
+        return cls(PROCESSES if process_ids is None else process_ids, precedes, used_in)
+
+    @classmethod
+    def from_graph_data(cls, graph_data: dict) -> "ProcessDAG":
+        """simulator_ontology.generate_ontology_graph() 결과로 생성"""
+        gd = graph_data.get("graph_data", {})
+        process_ids = [n["id"] for n in gd.get("nodes", []) if "Process" in n.get("labels", [])]
+        return cls.from_edges(gd.get("edges", []), process_ids)
+
+    # ── 조회 ──
+
+    @property
+    def is_acyclic(self) -> bool:
+        return not self.cycles
+
+    def rank(self, process_id: str) -> int:
+        """위상 순위 (선행 단계가 없으면 0). 순환 구간이면 KeyError"""
+        return self._rank[process_id]
+
+    def prerequisites(self, process_id: str) -> List[str]:
+        """모든 선행 단계 (위상 순, 자기 자신 제외)"""
+        bits = self._ancestors[self.row_of[process_id]]
+        return [pid for pid in self.order if bits >> self.row_of[pid] & 1]
+
+    def precedes(self, a: str, b: str) -> bool:
+        """a가 b의 (추이적) 선행 단계인지 — O(1)"""
+        return bool(self._ancestors[self.row_of[b]] >> self.row_of[a] & 1)
+
+    def docs_used_in(self, process_id: str) -> List[str]:
+        return list(self._postings.get(process_id, ()))
+
+    def docs_before(self, process_id: str, include_self: bool = False) -> List[str]:
+        """process_id 이전 단계(들)에서 쓰이는 문서 — 처음 요청 시 계산 후 캐시"""
+        key = (process_id, include_self)
+        cached = self._docs_before.get(key)
+        if cached is None:
+            steps = self.prerequisites(process_id) + ([process_id] if include_self else [])
+            merged: Dict[str, None] = {}
+            for pid in steps:
+                merged.update(self._postings.get(pid, {}))
+            cached = self._docs_before[key] = list(merged)
+        return list(cached)
+
+    def edge_count(self) -> int:
+        return sum(len(s) for s in self._succ)
+
+
+if __name__ == "__main__":
+    from simulator_ontology import generate_ontology_graph
+
+    dag = ProcessDAG.from_graph_data(generate_ontology_graph())
+    print("=" * 60)
+    print("업무 프로세스 DAG")
+    print("=" * 60)
+    print(f"  프로세스 {len(dag.keys)}개, PRECEDES {dag.edge_count()}개, 순환 {dag.cycles or '없음'}")
+    for pid in dag.order:
+        if not dag.prerequisites(pid) and not dag._succ[dag.row_of[pid]]:
+            continue
+        print(f"  [{dag.rank(pid)}] {pid:<16} {PROCESSES.get(pid, {}).get('name', ''):<10} "
+              f"사용 문서 {len(dag.docs_used_in(pid)):>4}건, 선행 단계 문서 {len(dag.docs_before(pid)):>4}건")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+공용 프로파일링 스위치
+
+모든 CLI 진입점(simulator, simulator_ontology, verifier, ontology_validator,
+taxonomy/ontology의 __main__)을 같은 방식으로 프로파일링한다.
+환경변수로 켜고, 코드는 구간(phase)만 표시한다.
+
+    KMS_PROFILE=cprofile    python simulator.py     # 구간별 .pstats
+    KMS_PROFILE=sample      python verifier.py      # 구간별 collapsed stack (샘플링 타이머)
+    KMS_PROFILE=tracemalloc python ontology_validator.py  # 구간별 할당 collapsed stack (구간 끝에 살아있는 bytes)
+
+    KMS_PROFILE_DIR       출력 디렉토리 (기본 ./profiles)
+    KMS_PROFILE_INTERVAL  샘플링 간격 ms (기본 5)
+
+구간 표시 방법:
+    with profiled("simulator"):      # 진입점 전체 (구간 "main")
+        with phase("generation"):    # 생성 / serialization / load / rule.* 등
+            ...
+
+구간은 중첩될 수 있으며 시간/할당은 가장 안쪽 구간에만 귀속된다 (부모 구간은 자식 제외).
+collapsed 파일은 "root;...;leaf 값" 형식으로 flamegraph.pl / speedscope 에 그대로 넣을 수 있다.
+
+스크립트 수정 없이 임의 진입점 감싸기:
+    python profiling.py --mode sample -- taxonomy.py
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional
+
+MODES = ("cprofile", "tracemalloc", "sample")
+ENV_MODE = "KMS_PROFILE"
+ENV_DIR = "KMS_PROFILE_DIR"
+ENV_INTERVAL = "KMS_PROFILE_INTERVAL"
+TRACE_DEPTH = 16  # tracemalloc 보관 프레임 수
+
+_NULL = nullcontext()
+_active: Optional["Profiler"] = None
+
+
+class Profiler:
+    """구간 스택을 관리하고 모드별로 구간마다 결과를 모은다"""
+
+    def __init__(self, tool: str, mode: str, out_dir: str, interval_ms: float = 5.0):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 프로파일 모드: {mode} (가능: {', '.join(MODES)})")
+        self.tool = tool
+        self.mode = mode
+        self.out_dir = out_dir
+        self.interval = interval_ms / 1000
+        self._stack: List[str] = []
+        self._profiles: Dict[str, "cProfile.Profile"] = {}
+        self._stacks: Dict[str, Counter] = {}  # 구간 → collapsed stack → 샘플 수 / bytes
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._main_ident = threading.get_ident()
+
+    # ── 시작/종료 ──
+
+    def start(self) -> None:
+        if self.mode == "tracemalloc":
+            tracemalloc.start(TRACE_DEPTH)
+        elif self.mode == "sample":
+            self._sampler = threading.Thread(target=self._sample_loop, name="kms-profiler", daemon=True)
+            self._sampler.start()
+
+    def stop(self) -> List[str]:
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+        if self.mode == "tracemalloc" and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return self._write()
+
+    # ── 구간 ──
+
+    @contextmanager
+    def phase(self, name: str):
+        parent = self._stack[-1] if self._stack else None
+        self._suspend(parent)
+        self._stack.append(name)
+        self._resume(name)
+        try:
+            yield
+        finally:
+            self._suspend(name)
+            self._stack.pop()
+            self._resume(parent)
+
+    def _resume(self, name: Optional[str]) -> None:
+        if name is None:
+            return
+        if self.mode == "cprofile":
+            import cProfile
+            self._profiles.setdefault(name, cProfile.Profile()).enable()
+
+    def _suspend(self, name: Optional[str]) -> None:
+        if name is None:
+            return
+        if self.mode == "cprofile":
+            self._profiles[name].disable()
+        elif self.mode == "tracemalloc":
+            # 직전 경계에서 trace를 비웠으므로 스냅샷에는 이 구간에서 할당되어 아직 살아있는 것만 남는다.
+            # 전체 힙 스냅샷끼리 compare_to 하면 구간마다 힙 크기에 비례해 느려진다.
+            stacks = self._stacks.setdefault(name, Counter())
+            for stat in tracemalloc.take_snapshot().statistics("traceback"):
+                if not _is_own(stat.traceback[-1].filename):
+                    frames = [f"{_short(f.filename)}:{f.lineno}" for f in stat.traceback]  # 바깥 → 안쪽
+                    stacks[";".join(frames)] += stat.size
+            tracemalloc.clear_traces()
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            phase_name = self._stack[-1] if self._stack else None
+            frame = sys._current_frames().get(self._main_ident)
+            if phase_name is None or frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{_short(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            self._stacks.setdefault(phase_name, Counter())[";".join(reversed(frames))] += 1
+
+    # ── 출력 ──
+
+    def _write(self) -> List[str]:
+        os.makedirs(self.out_dir, exist_ok=True)
+        written = []
+        if self.mode == "cprofile":
+            for name, prof in self._profiles.items():
+                path = self._path(name, "pstats")
+                prof.dump_stats(path)
+                written.append(path)
+        else:
+            ext = "alloc.collapsed" if self.mode == "tracemalloc" else "collapsed"
+            for name, stacks in self._stacks.items():
+                path = self._path(name, ext)
+                with open(path, "w", encoding="utf-8") as f:
+                    for stack, value in stacks.most_common():
+                        f.write(f"{stack} {value}\n")
+                written.append(path)
+        return written
+
+    def _path(self, phase_name: str, ext: str) -> str:
+        import re
+        safe = re.sub(r"[^\w.-]+", "_", phase_name)
+        return os.path.join(self.out_dir, f"{self.tool}.{safe}.{ext}")
+
+
+_OWN_FILES = (tracemalloc.__file__, __file__)
+
+
+def _is_own(filename: str) -> bool:
+    """프로파일러 자신과 import 기계의 할당은 제외 (Snapshot.filter_traces는 trace마다 fnmatch라 느려서 그룹화 후에 거름)"""
+    return filename in _OWN_FILES or filename.startswith("<frozen importlib")
+
+
+def _short(filename: str) -> str:
+    """collapsed stack 가독성을 위해 파일 경로는 이름만"""
+    return os.path.basename(filename)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 진입점 API
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def phase(name: str):
+    """프로파일 구간 표시 (프로파일링이 꺼져 있으면 아무것도 하지 않음)"""
+    if _active is None:
+        return _NULL
+    return _active.phase(name)
+
+
+@contextmanager
+def profiled(tool: str, mode: Optional[str] = None, out_dir: Optional[str] = None,
+             interval_ms: Optional[float] = None):
+    """진입점 전체를 감싼다. mode가 없으면 KMS_PROFILE 환경변수, 그것도 없으면 프로파일링 안 함"""
+    global _active
+    mode = mode or os.environ.get(ENV_MODE, "")
+    if not mode or _active is not None:  # 꺼져 있거나 바깥에서 이미 프로파일링 중
+        yield
+        return
+
+    out_dir = out_dir or os.environ.get(ENV_DIR, "profiles")
+    interval_ms = interval_ms or float(os.environ.get(ENV_INTERVAL, "5"))
+    profiler = Profiler(tool, mode, out_dir, interval_ms)
+    _active = profiler
+    profiler.start()
+    t0 = time.perf_counter()
+    try:
+        with profiler.phase("main"):
+            yield
+    finally:
+        _active = None
+        written = profiler.stop()
+        print(f"\n[profile] {tool} {mode} {time.perf_counter() - t0:.2f}s → {len(written)}개 파일 ({out_dir})",
+              file=sys.stderr)
+
+
+def main():
+    import argparse
+    import runpy
+
+    parser = argparse.ArgumentParser(description="임의 스크립트를 프로파일링하여 실행")
+    parser.add_argument("--mode", choices=MODES, default="cprofile")
+    parser.add_argument("--out", default="profiles", help="출력 디렉토리")
+    parser.add_argument("--interval", type=float, default=5.0, help="sample 모드 간격(ms)")
+    parser.add_argument("script")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    # 대상 스크립트의 `from profiling import phase`가 이 모듈(__main__)의 상태를 보도록
+    sys.modules.setdefault("profiling", sys.modules[__name__])
+    script = os.path.abspath(args.script)
+    sys.argv = [script] + args.args
+    sys.path.insert(0, os.path.dirname(script))
+    tool = os.path.splitext(os.path.basename(script))[0]
+    status = 0
+    with profiled(tool, args.mode, args.out, args.interval):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return status
+
+
+if __name__ == "__main__":
+    exit(main())
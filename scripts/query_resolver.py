@@ -0,0 +1,122 @@
+"""
+질의 → 문서 해석기
+
+"삼성생명 종신 수수료" 같은 사용자 질문을 후보 문서 ID로 바꾼다.
+
+1. synonym_matcher로 질의에서 보험사/상품/문서유형/개념 추출
+2. 개념의 related_docs로 문서유형 확장
+3. 문서유형의 도메인(DOC_TYPE_DOMAIN_MAP) ssotKey 순서로 분류 경로 구성
+   - 질의에 없는 facet은 wildcard
+   - 특정 보험사/상품으로 찾지 못하면 공통(INS-COMMON/PRD-COMMON) 경로로 재시도
+4. FacetIndex에서 ACTIVE 문서 조회
+"""
+
+from dataclasses import dataclass, field
+from itertools import product as cartesian
+from typing import Dict, List, Optional
+
+from taxonomy import DOMAINS, DOC_TYPE_DOMAIN_MAP
+from concept_index import ConceptIndex
+from facet_index import ANY, FacetIndex, SsotPath
+from synonym_matcher import QueryMatcher, get_query_matcher
+
+# 특정 값으로 찾지 못했을 때 대신 조회할 공통 facet 값
+COMMON_FACET_VALUES = {"carrier": "INS-COMMON", "product": "PRD-COMMON"}
+
+
+@dataclass
+class Resolution:
+    query: str
+    doc_ids: List[str] = field(default_factory=list)
+    doc_types: List[str] = field(default_factory=list)
+    carriers: List[str] = field(default_factory=list)
+    products: List[str] = field(default_factory=list)
+    concepts: List[str] = field(default_factory=list)
+    paths: List[SsotPath] = field(default_factory=list)  # 문서가 조회된 분류 경로
+
+
+class QueryResolver:
+    """질의 해석기 (색인·매처는 생성 시 한 번만 준비)"""
+
+    def __init__(self, index: FacetIndex, matcher: Optional[QueryMatcher] = None,
+                 concepts: Optional[ConceptIndex] = None):
+        self.index = index
+        self.matcher = matcher or get_query_matcher()
+        self.concepts = concepts or ConceptIndex.from_concepts()
+
+    @classmethod
+    def from_graph(cls, graph_data: dict) -> "QueryResolver":
+        """simulator.generate_graph_data() 결과(또는 knowledge-graph.json)로 생성"""
+        nodes = graph_data.get("graph_data", {}).get("nodes", [])
+        return cls(FacetIndex.from_nodes(nodes))
+
+    def resolve(self, text: str, limit: Optional[int] = None) -> Resolution:
+        match = self.matcher.match(text)
+        result = Resolution(
+            query=text,
+            doc_types=list(match.doc_types),
+            carriers=match.carriers,
+            products=match.products,
+            concepts=match.concepts,
+        )
+
+        # 개념 → 관련 문서유형 확장
+        for concept_id in match.concepts:
+            for doc_type_id in self.concepts.doc_types(concept_id):
+                if doc_type_id not in result.doc_types:
+                    result.doc_types.append(doc_type_id)
+
+        facet_values = {"carrier": match.carriers, "product": match.products}
+
+        for doc_type_id in result.doc_types:
+            domain_id = DOC_TYPE_DOMAIN_MAP.get(doc_type_id)
+            if domain_id not in DOMAINS:
+                continue
+            fields = DOMAINS[domain_id].get("ssotKey", [])
+
+            found = self._collect(domain_id, fields, doc_type_id, facet_values, result)
+            if not found:
+                self._collect(domain_id, fields, doc_type_id, facet_values, result, use_common=True)
+
+            if limit is not None and len(result.doc_ids) >= limit:
+                del result.doc_ids[limit:]
+                break
+
+        return result
+
+    def _collect(self, domain_id: str, fields: list, doc_type_id: str,
+                 facet_values: Dict[str, list], result: Resolution,
+                 use_common: bool = False) -> int:
+        """문서유형 하나에 대해 가능한 분류 경로를 모두 조회, 찾은 문서 수 반환"""
+        choices = []
+        for f in fields:
+            if f == "docType":
+                choices.append([doc_type_id])
+            elif use_common and f in COMMON_FACET_VALUES:
+                choices.append([COMMON_FACET_VALUES[f]])
+            else:
+                choices.append(facet_values.get(f) or [ANY])
+
+        found = 0
+        for key in cartesian(*choices):
+            doc_ids = self.index.lookup(domain_id, key)
+            if doc_ids:
+                result.doc_ids.extend(doc_ids)
+                result.paths.append((domain_id, key))
+                found += len(doc_ids)
+        return found
+
+
+if __name__ == "__main__":
+    from simulator import generate_graph_data
+
+    resolver = QueryResolver.from_graph(generate_graph_data())
+    print("=" * 60)
+    print("질의 → 문서 해석")
+    print("=" * 60)
+    for query in ["삼성생명 종신 수수료", "DB손보 실손 심사기준", "한화 컴플라이언스", "1200%룰", "신입 교육"]:
+        r = resolver.resolve(query, limit=5)
+        print(f"\n  '{query}'")
+        print(f"    facets: 보험사 {r.carriers}, 상품 {r.products}, 문서유형 {r.doc_types}")
+        for doc_id in r.doc_ids:
+            print(f"    → {doc_id}")
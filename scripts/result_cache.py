@@ -0,0 +1,302 @@
+"""
+검증 결과 캐시 (그래프 내용 해시 + 규칙 테이블 지문)
+
+같은 그래프 파일, 같은 분류체계/온톨로지 테이블로 다시 검증하면 규칙을 다시 돌리지 않고
+저장해 둔 결과(통과/실패 수, 위반 기록, 출력)를 그대로 재생한다.
+
+- 입력 파일: 내용 sha256. 크기·mtime이 이전과 같으면 저장해 둔 해시를 재사용 (stat 한 번)
+  디렉터리는 하위 파일 목록의 해시
+- 테이블: taxonomy/ontology 모듈의 대문자 상수를 키 정렬 JSON으로 직렬화한 sha256
+- 코드: scripts/*.py 전체 내용 해시 (taxonomy/ontology 포함. 규칙이 부르는 함수가 어디서 바뀌어도 모든 항목 무효)
+  → 테이블 지문은 같은 코드로 테이블 값만 달라진 경우(런타임에 바꾼 테이블 등)를 규칙별로 가른다
+- 규칙마다 의존하는 입력(파일 이름, 테이블 이름, 추가 키)만으로 키를 만든다
+  → DOMAINS만 바꾸면 DOMAINS를 읽는 규칙만 다시 실행
+- 항목은 규칙별로 따로 pickle. 위반 기록이 MAX_RECORDED_VIOLATIONS를 넘는 규칙은 저장하지 않는다
+- 캐시 파일은 pickle이므로 믿을 수 있는 경로에만 둔다 (verifier/ontology_validator는 --cache일 때만 사용)
+
+    cache = ResultCache("data/.cache/verifier.pkl", files={GRAPH: graph_path},
+                        tables=table_fingerprints(taxonomy))
+    deps = (GRAPH, "DOMAINS")
+    hit = cache.get("verify_ssot", deps)
+    if hit is None:
+        with cache.record(collector) as rec:
+            passed, failed = run()
+        cache.put("verify_ssot", deps, rec.entry(passed, failed))
+    else:
+        passed, failed = hit.replay(collector)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+CACHE_VERSION = 1
+GRAPH = "graph"
+MISSING = "missing"  # 없는 입력 파일의 지문 (없는 샘플 디렉터리 = 파일 0개)
+MAX_RECORDED_VIOLATIONS = 100_000
+_CHUNK = 1 << 20
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 지문
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def file_digest(path: str) -> str:
+    """파일 내용 sha256 (1MB씩 읽음)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dir_signature(path: str) -> str:
+    """디렉터리 하위 파일 목록(상대 경로)의 해시 (내용·mtime은 보지 않음, 파일 구성에만 의존하는 규칙용)"""
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        rel = os.path.relpath(root, path)
+        for name in sorted(files):
+            h.update(f"{rel}/{name}\0".encode())
+    return h.hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def fingerprint(value: Any) -> str:
+    """테이블 값의 지문 (dict 키 순서와 무관)"""
+    try:
+        data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=_canonical)
+    except TypeError:  # 키 타입이 섞여 정렬할 수 없는 경우
+        data = repr(value)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def table_fingerprints(*modules: ModuleType) -> Dict[str, str]:
+    """모듈의 공개 대문자 상수(dict/list/tuple/set) → 지문"""
+    tables = {}
+    for module in modules:
+        for name, value in vars(module).items():
+            if name.isupper() and not name.startswith("_") and isinstance(value, (dict, list, tuple, set, frozenset)):
+                tables[name] = fingerprint(value)
+    return tables
+
+
+def code_fingerprint(directory: str = _SCRIPTS_DIR) -> str:
+    """검증 코드 지문: 디렉터리의 모든 *.py 내용 (테이블 모듈 포함)"""
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            h.update(name.encode() + b"\0")
+            with open(os.path.join(directory, name), "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 규칙 결과 기록 / 재생
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class CachedRule:
+    passed: int
+    failed: int
+    output: str                                            # 규칙 실행 중 stdout
+    violations: List[tuple] = field(default_factory=list)  # collector.add 호출 (args, kwargs)
+    state: Dict[str, Any] = field(default_factory=dict)    # 규칙이 남긴 부가 결과 (예: 표본 추정치)
+
+    def replay(self, collector=None) -> Tuple[int, int]:
+        """출력과 위반 기록을 실행 순서 그대로 재생 → (통과, 실패)"""
+        sys.stdout.write(self.output)
+        if collector is not None:
+            for args, kwargs in self.violations:
+                collector.add(*args, **kwargs)
+        return self.passed, self.failed
+
+
+class Recording:
+    """record() 구간의 stdout과 collector.add 호출"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.violations: List[tuple] = []
+        self.overflow = False
+
+    @property
+    def output(self) -> str:
+        return "".join(self.parts)
+
+    def entry(self, passed: int, failed: int, **state) -> Optional[CachedRule]:
+        """기록 → 캐시 항목 (위반이 너무 많아 기록을 버렸으면 None)"""
+        if self.overflow:
+            return None
+        return CachedRule(passed, failed, self.output, self.violations, state)
+
+
+class _Tee:
+    """쓰기를 원래 스트림과 버퍼에 함께"""
+
+    def __init__(self, stream, parts: List[str]):
+        self._stream = stream
+        self._parts = parts
+
+    def write(self, s: str) -> int:
+        self._parts.append(s)
+        return self._stream.write(s)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 캐시 파일
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ResultCache:
+    """규칙별 (키, 결과) 항목을 한 pickle 파일에 보관
+
+    files: 의존 이름 → 입력 파일/디렉터리 경로, tables: 의존 이름 → 지문,
+    options: 결과에 영향을 주는 실행 옵션 (모든 키에 포함)
+    """
+
+    def __init__(self, path: str, files: Optional[Dict[str, str]] = None,
+                 tables: Optional[Dict[str, str]] = None, options: Optional[dict] = None):
+        self.path = path
+        self.files = dict(files or {})
+        self.tables = dict(tables or {})
+        self.hits = 0
+        self.misses = 0
+        self._base = (CACHE_VERSION, code_fingerprint(), fingerprint(options or {}))
+        self._inputs: Dict[str, str] = {}
+        self._dirty = False
+        self._digests: Dict[str, tuple] = {}           # 절대 경로 → (크기, mtime_ns, sha256)
+        self._rules: Dict[str, Tuple[str, bytes]] = {}  # 규칙 → (키, pickle)
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception:  # 깨졌거나 형식이 다른 파일은 빈 캐시로 시작 (save에서 덮어씀)
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._digests = data.get("digests", {})
+            self._rules = data.get("rules", {})
+
+    # ── 키 ──
+
+    def _input(self, name: str) -> str:
+        if name not in self._inputs:
+            if name in self.files:
+                self._inputs[name] = self._path_digest(self.files[name])
+            elif name in self.tables:
+                self._inputs[name] = self.tables[name]
+            else:
+                raise KeyError(f"알 수 없는 캐시 의존: {name}")
+        return self._inputs[name]
+
+    def _path_digest(self, path: str) -> str:
+        try:
+            if os.path.isdir(path):
+                return dir_signature(path)
+            st = os.stat(path)
+        except FileNotFoundError:
+            return MISSING
+        full = os.path.abspath(path)
+        known = self._digests.get(full)
+        if known and known[:2] == (st.st_size, st.st_mtime_ns):
+            return known[2]
+        digest = file_digest(path)
+        self._digests[full] = (st.st_size, st.st_mtime_ns, digest)
+        self._dirty = True
+        return digest
+
+    def key(self, rule: str, deps: Iterable[str], extra: tuple = ()) -> str:
+        """규칙 키: 코드·옵션 지문 + 의존 입력 지문 + 추가 키"""
+        inputs = [(name, self._input(name)) for name in sorted(set(deps))]
+        return hashlib.sha256(repr((self._base, rule, inputs, extra)).encode()).hexdigest()
+
+    # ── 조회 / 저장 ──
+
+    def has(self, rule: str, deps: Iterable[str], extra: tuple = ()) -> bool:
+        key = self.key(rule, deps, extra)
+        stored = self._rules.get(rule)
+        return stored is not None and stored[0] == key
+
+    def get(self, rule: str, deps: Iterable[str], extra: tuple = ()) -> Any:
+        key = self.key(rule, deps, extra)
+        stored = self._rules.get(rule)
+        if stored is not None and stored[0] == key:
+            try:
+                value = pickle.loads(stored[1])
+            except Exception:
+                value = None
+            if value is not None:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, rule: str, deps: Iterable[str], value: Any, extra: tuple = ()) -> bool:
+        """value가 None이거나 pickle할 수 없으면 저장하지 않음"""
+        if value is None:
+            return False
+        try:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        self._rules[rule] = (self.key(rule, deps, extra), payload)
+        self._dirty = True
+        return True
+
+    @contextmanager
+    def record(self, collector=None) -> Iterator[Recording]:
+        """구간의 stdout(원래 출력도 유지)과 collector.add 호출 기록"""
+        rec = Recording()
+        patched = collector is not None
+        if patched:
+            add = collector.add
+
+            def recording_add(*args, **kwargs):
+                if not rec.overflow:
+                    if len(rec.violations) >= MAX_RECORDED_VIOLATIONS:
+                        rec.overflow, rec.violations = True, []
+                    else:
+                        rec.violations.append((args, kwargs))
+                add(*args, **kwargs)
+
+            collector.add = recording_add
+        try:
+            with redirect_stdout(_Tee(sys.stdout, rec.parts)):
+                yield rec
+        finally:
+            if patched:
+                del collector.add
+
+    def save(self) -> Optional[str]:
+        """바뀐 항목이 있으면 임시 파일에 쓰고 교체"""
+        if not self._dirty:
+            return None
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "digests": self._digests, "rules": self._rules},
+                        f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+        self._dirty = False
+        return self.path
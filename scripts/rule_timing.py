@@ -0,0 +1,134 @@
+"""
+검증 규칙별 계측
+
+verifier.py의 verify_* 와 ontology_validator의 구조 검증 항목마다
+wall time, CPU time, 처리 항목 수, 초당 처리량, 최대 메모리 증가량을 기록하고
+docs/results/ 아래 JSON으로 내보내 검증 비용 회귀를 추적한다.
+
+    timer = RuleTimer()
+    with timer.rule("verify_ssot") as probe:
+        passed, failed = verify_ssot()
+        probe.items = passed + failed
+    timer.export("docs/results/verifier-timing.json", tool="verifier")
+
+결과 캐시에서 재생한 규칙은 probe.cached = True로 표시한다.
+그 행은 cached: true, items_per_s: null로 내보내 (재생 시간은 규칙 비용이 아님)
+처리량 회귀 비교에서 빠지게 한다.
+
+메모리는 tracemalloc 기준 (규칙 시작 시점 대비 최대 할당 증가량).
+tracemalloc은 할당마다 비용이 들어 (verifier 전체 실행 약 4배) 기본은 끄고
+trace_memory=True (CLI --trace-memory)일 때만 잰다. 끄면 mem 열은 비어 있다.
+"""
+
+import os
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import List, Optional
+
+from profiling import phase
+from serialization import dump_json
+
+
+@dataclass
+class RuleTiming:
+    name: str
+    wall_s: float
+    cpu_s: float
+    items: int
+    items_per_s: Optional[float]  # 캐시 재생이면 None
+    peak_mem_delta_kb: Optional[float]
+    cached: bool = False
+
+
+class _Probe:
+    """with 블록 안에서 처리 항목 수와 캐시 재생 여부를 채우는 용도"""
+    __slots__ = ("items", "cached")
+
+    def __init__(self):
+        self.items = 0
+        self.cached = False
+
+
+class RuleTimer:
+    """규칙 실행 구간 계측기"""
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.timings: List[RuleTiming] = []
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def rule(self, name: str):
+        # KMS_PROFILE 이 켜져 있으면 규칙별 프로파일 구간.
+        # 프로파일러(tracemalloc 모드)가 구간 경계에서 trace를 비우므로 계측은 구간 안쪽에서 시작한다
+        with phase(f"rule.{name}"):
+            with self._measure(name) as probe:
+                yield probe
+
+    @contextmanager
+    def _measure(self, name: str):
+        probe = _Probe()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield probe
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            peak_kb = None
+            if self.trace_memory:
+                peak_kb = round(max(0, tracemalloc.get_traced_memory()[1] - mem_start) / 1024, 1)
+            self.timings.append(RuleTiming(
+                name=name,
+                wall_s=round(wall, 6),
+                cpu_s=round(cpu, 6),
+                items=probe.items,
+                items_per_s=None if probe.cached else round(probe.items / wall, 1) if wall > 0 else 0.0,
+                peak_mem_delta_kb=peak_kb,
+                cached=probe.cached,
+            ))
+
+    def close(self) -> None:
+        """이 계측기가 시작한 tracemalloc 정지"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def to_dict(self, **meta) -> dict:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            **meta,
+            "trace_memory": self.trace_memory,
+            "total_wall_s": round(sum(t.wall_s for t in self.timings), 6),
+            "total_cpu_s": round(sum(t.cpu_s for t in self.timings), 6),
+            "cached_rules": sum(t.cached for t in self.timings),
+            "rules": [asdict(t) for t in self.timings],
+        }
+
+    def export(self, path: str, **meta) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        return dump_json(self.to_dict(**meta), path, pretty=True)
+
+    def print_table(self) -> None:
+        print(f"  {_pad('규칙', 32)} {'wall(ms)':>10} {'cpu(ms)':>10} {'items':>10} {'items/s':>12} {'mem(KB)':>10}")
+        for t in self.timings:
+            mem = f"{t.peak_mem_delta_kb:,.1f}" if t.peak_mem_delta_kb is not None else "-"
+            rate = "(캐시)" if t.cached else f"{t.items_per_s:,.0f}"
+            print(f"  {_pad(t.name, 32)} {t.wall_s * 1000:>10.2f} {t.cpu_s * 1000:>10.2f} "
+                  f"{t.items:>10,} {_pad(rate, 12, right=True)} {mem:>10}")
+
+
+def _pad(text: str, width: int, right: bool = False) -> str:
+    """한글(전각) 폭을 2로 계산한 왼쪽 (right=True면 오른쪽) 정렬"""
+    used = sum(2 if unicodedata.east_asian_width(c) in ("W", "F") else 1 for c in text)
+    fill = " " * max(0, width - used)
+    return fill + text if right else text + fill
@@ -0,0 +1,186 @@
+"""
+층화 표본 추출 + 위반율 추정 (근사 검증용)
+
+큰 그래프 전체를 검사하는 대신, 층(예: 도메인 × tier)마다 최대 per_stratum 건을
+무작위로 뽑아 규칙을 적용하고 모집단 위반율과 신뢰구간을 추정한다.
+
+- 추출: 층마다 reservoir (Algorithm L). 한 번 흘려 읽으며 층별 모집단 수 N_h도 센다
+- 추정: 층화 비율 p = Σ W_h·p_h (W_h = N_h / N),
+  분산 = Σ W_h²·p_h(1 - p_h)/(n_h - 1)·(1 - n_h/N_h) (유한 모집단 보정)
+- 구간: 유효 표본 수 n_eff = p(1 - p)/분산 (Kish)로 Wilson 구간.
+  위반이 0건이어도 상한이 0이 되지 않는다 (표본에서 못 봤을 뿐일 수 있음)
+- 모든 층을 전수 추출했으면 구간 폭 0 (정확값)
+
+    sample = StratifiedSample(per_stratum=200, seed=0)
+    for doc in docs:
+        sample.add((domain, tier), doc)
+    tally = RateTally(sample)
+    for stratum, doc in sample.items():
+        tally.record("required_fields", stratum, violated=...)
+    for est in tally.estimates(confidence=0.95):
+        est.rule, est.rate, est.low, est.high
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+DEFAULT_PER_STRATUM = 200
+DEFAULT_CONFIDENCE = 0.95
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 층화 reservoir 추출
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Reservoir:
+    """Algorithm L: 채운 뒤에는 건너뛸 개수를 기하분포로 뽑아 항목마다 난수를 만들지 않는다"""
+    __slots__ = ("k", "items", "seen", "w", "next")
+
+    def __init__(self, k: int):
+        self.k = k
+        self.items: list = []
+        self.seen = 0
+        self.w = 1.0
+        self.next = 0
+
+    def add(self, item, rng: random.Random) -> None:
+        self.seen += 1
+        if len(self.items) < self.k:
+            self.items.append(item)
+            if len(self.items) == self.k:
+                self.w = math.exp(math.log(rng.random()) / self.k)
+                self.next = self.seen + self._skip(rng)
+            return
+        if self.seen == self.next:
+            self.items[rng.randrange(self.k)] = item
+            self.w *= math.exp(math.log(rng.random()) / self.k)
+            self.next = self.seen + self._skip(rng)
+
+    def _skip(self, rng: random.Random) -> int:
+        if self.w >= 1.0:
+            return 1
+        return int(math.log(rng.random()) / math.log(1 - self.w)) + 1
+
+
+class StratifiedSample:
+    """층별 최대 per_stratum 건 단순 무작위 표본 + 층별 모집단 수"""
+
+    def __init__(self, per_stratum: int = DEFAULT_PER_STRATUM, seed: int = 0):
+        if per_stratum < 1:
+            raise ValueError(f"층별 표본 수는 1 이상이어야 합니다: {per_stratum}")
+        self.per_stratum = per_stratum
+        self._rng = random.Random(seed)
+        self._strata: Dict[Hashable, _Reservoir] = {}
+
+    def add(self, stratum: Hashable, item) -> None:
+        reservoir = self._strata.get(stratum)
+        if reservoir is None:
+            reservoir = self._strata[stratum] = _Reservoir(self.per_stratum)
+        reservoir.add(item, self._rng)
+
+    def population(self, stratum: Hashable) -> int:
+        reservoir = self._strata.get(stratum)
+        return reservoir.seen if reservoir else 0
+
+    @property
+    def total_population(self) -> int:
+        return sum(r.seen for r in self._strata.values())
+
+    @property
+    def total_sampled(self) -> int:
+        return sum(len(r.items) for r in self._strata.values())
+
+    def strata(self) -> List[Hashable]:
+        return list(self._strata)
+
+    def items(self) -> Iterator[Tuple[Hashable, object]]:
+        for stratum, reservoir in self._strata.items():
+            for item in reservoir.items:
+                yield stratum, item
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 위반율 추정
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class RateEstimate:
+    rule: str
+    population: int
+    sampled: int
+    violations: int      # 표본에서 위반한 항목 수
+    rate: float          # 추정 모집단 위반율
+    low: float
+    high: float
+    confidence: float
+
+    @property
+    def exact(self) -> bool:
+        return self.sampled == self.population
+
+    @property
+    def estimated_violations(self) -> Tuple[int, int, int]:
+        """모집단 위반 건수 추정 (하한, 점추정, 상한)"""
+        n = self.population
+        return math.floor(self.low * n), round(self.rate * n), math.ceil(self.high * n)
+
+
+def estimate_rate(rule: str, strata: Dict[Hashable, Tuple[int, int, int]],
+                  confidence: float = DEFAULT_CONFIDENCE) -> RateEstimate:
+    """strata: 층 → (모집단 수 N_h, 표본 수 n_h, 표본 위반 수 x_h)"""
+    population = sum(N for N, _, _ in strata.values())
+    sampled = sum(n for _, n, _ in strata.values())
+    violations = sum(x for _, _, x in strata.values())
+    if population == 0 or sampled == 0:
+        return RateEstimate(rule, population, sampled, violations, 0.0, 0.0, 1.0 if population else 0.0, confidence)
+
+    rate, variance = 0.0, 0.0
+    for N, n, x in strata.values():
+        if n == 0:
+            continue
+        w = N / population
+        p = x / n
+        rate += w * p
+        if n < N:
+            variance += w * w * p * (1 - p) / max(n - 1, 1) * (1 - n / N)
+
+    if sampled == population:
+        return RateEstimate(rule, population, sampled, violations, rate, rate, rate, confidence)
+
+    n_eff = rate * (1 - rate) / variance if variance > 0 else sampled
+    low, high = _wilson(rate, n_eff, NormalDist().inv_cdf(0.5 + confidence / 2))
+    return RateEstimate(rule, population, sampled, violations, rate, low, high, confidence)
+
+
+def _wilson(p: float, n: float, z: float) -> Tuple[float, float]:
+    z2 = z * z
+    denom = 1 + z2 / n
+    center = (p + z2 / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class RateTally:
+    """규칙 × 층별 표본 위반 수 집계 → 규칙별 RateEstimate"""
+
+    def __init__(self, sample: StratifiedSample):
+        self.sample = sample
+        self._checked: Dict[str, Dict[Hashable, List[int]]] = {}  # 규칙 → 층 → [표본 수, 위반 수]
+
+    def record(self, rule: str, stratum: Hashable, violated: bool) -> None:
+        counts = self._checked.setdefault(rule, {}).setdefault(stratum, [0, 0])
+        counts[0] += 1
+        counts[1] += bool(violated)
+
+    def estimates(self, confidence: float = DEFAULT_CONFIDENCE) -> List[RateEstimate]:
+        results = []
+        for rule, by_stratum in self._checked.items():
+            strata = {}
+            for stratum in self.sample.strata():
+                n, x = by_stratum.get(stratum, (0, 0))
+                strata[stratum] = (self.sample.population(stratum), n, x)
+            results.append(estimate_rate(rule, strata, confidence))
+        return results
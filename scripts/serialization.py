@@ -0,0 +1,129 @@
+"""
+JSON 직렬화 계층
+
+그래프/온톨로지/분류체계 파일은 모두 이 모듈을 거쳐 읽고 쓴다.
+설치되어 있으면 빠른 인코더를 쓰고, 없으면 표준 라이브러리로 동작한다.
+
+    orjson  >  msgspec  >  json (표준 라이브러리)
+
+- 기본은 compact 출력 (기계가 읽는 파일). 사람이 읽는 보고서만 pretty=True
+- 모든 백엔드의 출력은 같은 값으로 파싱된다 (ensure_ascii=False, 비문자열 키는 문자열로)
+- 파일은 한 번에 인코딩/읽기하고, 큰 그래프를 파싱하는 동안에는 순환 GC를 멈춘다
+
+    from serialization import dump_json, load_json
+    dump_json(graph_data, "data/knowledge-graph.json")
+    graph_data = load_json("data/knowledge-graph.json")
+
+    KMS_JSON_BACKEND  백엔드 강제 (orjson | msgspec | json)
+    KMS_JSON_PRETTY   1이면 compact 기본값 대신 들여쓰기 출력
+"""
+
+import gc
+import json
+import os
+from typing import Any, Callable, Optional
+
+BACKENDS = ("orjson", "msgspec", "json")
+ENV_BACKEND = "KMS_JSON_BACKEND"
+ENV_PRETTY = "KMS_JSON_PRETTY"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 백엔드
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _orjson():
+    import orjson
+
+    def dumps(obj, pretty: bool, default: Optional[Callable]) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=default, option=option)
+
+    return dumps, orjson.loads
+
+
+def _msgspec():
+    import msgspec
+
+    def dumps(obj, pretty: bool, default: Optional[Callable]) -> bytes:
+        data = msgspec.json.encode(obj, enc_hook=default)
+        return msgspec.json.format(data, indent=2) if pretty else data
+
+    return dumps, msgspec.json.decode
+
+
+def _stdlib():
+    def dumps(obj, pretty: bool, default: Optional[Callable]) -> bytes:
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=2, default=default)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+        return text.encode("utf-8")
+
+    return dumps, json.loads
+
+
+_LOADERS = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+BACKEND = "json"
+_dumps, _loads = _stdlib()
+
+
+def use_backend(name: Optional[str] = None) -> str:
+    """백엔드 선택. name이 없으면 설치된 것 중 가장 빠른 것 (ImportError면 다음 후보)"""
+    global BACKEND, _dumps, _loads
+    candidates = [name] if name else list(BACKENDS)
+    for candidate in candidates:
+        if candidate not in _LOADERS:
+            raise ValueError(f"지원하지 않는 JSON 백엔드: {candidate} (가능: {', '.join(BACKENDS)})")
+        try:
+            _dumps, _loads = _LOADERS[candidate]()
+        except ImportError:
+            if name:
+                raise
+            continue
+        BACKEND = candidate
+        return BACKEND
+    return BACKEND
+
+
+use_backend(os.environ.get(ENV_BACKEND) or None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# API
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _pretty_default() -> bool:
+    return os.environ.get(ENV_PRETTY, "") not in ("", "0")
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None, default: Optional[Callable] = None) -> bytes:
+    """UTF-8 bytes로 직렬화. pretty가 None이면 KMS_JSON_PRETTY (기본 compact)"""
+    return _dumps(obj, _pretty_default() if pretty is None else pretty, default)
+
+
+def loads(data) -> Any:
+    return _loads(data)
+
+
+def dump_json(obj: Any, path: str, pretty: Optional[bool] = None, default: Optional[Callable] = None) -> str:
+    """파일로 저장 (한 번에 인코딩 후 한 번에 쓰기)"""
+    data = dumps(obj, pretty, default)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def load_json(path: str) -> Any:
+    """파일 읽기. 파싱 중에는 순환 GC를 멈춘다
+    (수백만 개 dict/list를 만드는 동안 GC가 반복 실행되어 파싱 시간의 절반 가까이를 차지)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _loads(data)
+    finally:
+        if enabled:
+            gc.enable()
@@ -5,9 +5,9 @@ KMS v3.0 샘플 데이터 생성기
 - 문서에 domain, lifecycle, version(객체), reviewedAt, classification, meta 필드 추가
 - 라이프사이클 상태 분배 (ACTIVE 80%, STALE 10%, DRAFT 5%, DEPRECATED 5%)
 - 신선도 테스트를 위한 날짜 분산
+- 계층(ROOT → 보험사 → 상품 → 문서) 서브트리별 Merkle 해시를 "merkle" 키로 기록 (graph_diff.py)
 """
 
-import json
 import os
 import random
 from datetime import datetime, timedelta
@@ -17,29 +17,67 @@ from taxonomy import (
     REGULATION_TIMELINE, COMMISSION_TYPES, CHARGEBACK_RULES, KPI_METRICS,
     SYSTEM_CONFIG, BUSINESSES, DOMAINS, DOC_TYPE_DOMAIN_MAP
 )
+from facet_index import FacetIndex, ssot_key
+from serialization import dump_json
+from profiling import phase, profiled
 
 random.seed(42)
 
-# 전체 보험사 (공통 제외)
-SAMPLE_CARRIERS = [k for k in CARRIERS.keys() if k != "INS-COMMON"]
+# ── 파생 테이블 (첫 접근 시 구성) ──
+# SAMPLE_CARRIERS 등은 CARRIERS/PRODUCTS에서 파생되는 테이블이므로
+# import 시점이 아니라 처음 참조될 때 한 번만 만든다 (PEP 562 모듈 __getattr__).
 
-# 카테고리별 전체 상품 (공통/버전 상품 제외)
-SAMPLE_PRODUCTS = {
-    "life": [p for p, v in PRODUCTS.items()
-             if v.get("category") in ("LIFE", "HEALTH", "ANNUITY")
-             and p != "PRD-COMMON" and not v.get("supersedes")],
-    "non-life": [p for p, v in PRODUCTS.items()
-                 if v.get("category") in ("NON-LIFE", "HEALTH")
+def _build_sample_carriers():
+    """전체 보험사 (공통 제외)"""
+    return [k for k in CARRIERS.keys() if k != "INS-COMMON"]
+
+
+def _build_sample_products():
+    """카테고리별 전체 상품 (공통/버전 상품 제외)"""
+    return {
+        "life": [p for p, v in PRODUCTS.items()
+                 if v.get("category") in ("LIFE", "HEALTH", "ANNUITY")
                  and p != "PRD-COMMON" and not v.get("supersedes")],
-}
+        "non-life": [p for p, v in PRODUCTS.items()
+                     if v.get("category") in ("NON-LIFE", "HEALTH")
+                     and p != "PRD-COMMON" and not v.get("supersedes")],
+    }
+
 
-# 버전/개편 상품 (메이저 보험사만)
-VERSIONED_PRODUCTS = {
-    "life": [p for p, v in PRODUCTS.items() if v.get("supersedes") and v.get("category") in ("LIFE", "HEALTH", "ANNUITY")],
-    "non-life": [p for p, v in PRODUCTS.items() if v.get("supersedes") and v.get("category") in ("NON-LIFE", "HEALTH")],
+def _build_versioned_products():
+    """버전/개편 상품 (메이저 보험사만)"""
+    return {
+        "life": [p for p, v in PRODUCTS.items() if v.get("supersedes") and v.get("category") in ("LIFE", "HEALTH", "ANNUITY")],
+        "non-life": [p for p, v in PRODUCTS.items() if v.get("supersedes") and v.get("category") in ("NON-LIFE", "HEALTH")],
+    }
+
+
+def _build_major_carriers():
+    return [k for k, v in CARRIERS.items() if v.get("tier") == "major"]
+
+
+_LAZY_TABLES = {
+    "SAMPLE_CARRIERS": _build_sample_carriers,
+    "SAMPLE_PRODUCTS": _build_sample_products,
+    "VERSIONED_PRODUCTS": _build_versioned_products,
+    "MAJOR_CARRIERS": _build_major_carriers,
 }
 
-MAJOR_CARRIERS = [k for k, v in CARRIERS.items() if v.get("tier") == "major"]
+
+def __getattr__(name: str):
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value  # 이후 접근은 일반 전역 조회
+    return value
+
+
+def lazy_table(name: str):
+    """모듈 내부용: 파생 테이블을 (필요하면 구성 후) 반환"""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
 
 # 공통 문서 (보험사/상품 무관)
 COMMON_DOC_TYPES = [
@@ -153,15 +191,24 @@ def generate_doc_id(doc_type: str, carrier: str = None, product: str = None, seq
         return f"{doc_type}-COMMON-{seq:03d}"
 
 
+_template_loader = None
+
+
+def _get_template_loader():
+    """doc_templates는 실제 콘텐츠가 필요할 때 처음 한 번만 import"""
+    global _template_loader
+    if _template_loader is None:
+        from doc_templates import get_template
+        _template_loader = get_template
+    return _template_loader
+
+
 def generate_doc_content(doc_type: str, carrier: str = None, product: str = None) -> str:
+    carrier_name = CARRIERS.get(carrier, {}).get("name", "공통") if carrier else "공통"
+    product_name = PRODUCTS.get(product, {}).get("name", "공통") if product else "공통"
     try:
-        from doc_templates import get_template
-        carrier_name = CARRIERS.get(carrier, {}).get("name", "공통") if carrier else "공통"
-        product_name = PRODUCTS.get(product, {}).get("name", "공통") if product else "공통"
-        return get_template(doc_type, carrier_name, product_name)
+        return _get_template_loader()(doc_type, carrier_name, product_name)
     except Exception:
-        carrier_name = CARRIERS.get(carrier, {}).get("name", "공통") if carrier else "공통"
-        product_name = PRODUCTS.get(product, {}).get("name", "공통") if product else "공통"
         doc_type_name = DOC_TYPES.get(doc_type, {}).get("name", doc_type)
         return f"# {carrier_name} {product_name} {doc_type_name}\n\n## 개요\n{carrier_name}의 {product_name} 관련 {doc_type_name}입니다.\n"
 
@@ -213,10 +260,32 @@ def random_dates(tier: str, lifecycle: str):
     )
 
 
-def generate_graph_data():
+def scaled_carriers(scale: int = 1) -> list:
+    """(carrier_id, carrier) 목록
+
+    scale > 1 이면 샘플 보험사를 복제(ID 접미사 -X0002 …)하여
+    그래프를 약 scale배 크기로 만든다. 벤치마크/부하 테스트용.
+    """
+    pairs = []
+    for n in range(1, scale + 1):
+        for carrier_id in lazy_table("SAMPLE_CARRIERS"):
+            carrier = CARRIERS.get(carrier_id, {})
+            if n > 1:
+                carrier_id = f"{carrier_id}-X{n:04d}"
+                carrier = {**carrier, "name": f"{carrier.get('name', '')} #{n}", "alias": []}
+            pairs.append((carrier_id, carrier))
+    return pairs
+
+
+def generate_graph_data(scale: int = 1):
     """v3.0 그래프 데이터 생성 (프레임워크 구조 반영)"""
+    carriers = scaled_carriers(scale)
+    sample_products = lazy_table("SAMPLE_PRODUCTS")
+    versioned_products = lazy_table("VERSIONED_PRODUCTS")
     nodes = []
     edges = []
+    # SSOT 중복 방지: 이미 생성된 분류 경로 (검증기/질의 경로와 같은 키 체계)
+    facet_index = FacetIndex(wildcards=False)
 
     nodes.append({
         "id": "ROOT-IFA-KNOWLEDGE",
@@ -229,8 +298,7 @@ def generate_graph_data():
     })
 
     # 보험사 노드
-    for carrier_id in SAMPLE_CARRIERS:
-        carrier = CARRIERS.get(carrier_id, {})
+    for carrier_id, carrier in carriers:
         nodes.append({
             "id": carrier_id,
             "labels": ["Carrier", carrier.get("type", "life")],
@@ -286,10 +354,7 @@ def generate_graph_data():
             }
         })
         edges.append({"source": "ROOT-IFA-KNOWLEDGE", "target": doc_id, "type": "HAS_COMMON_DOC"})
-
-    # SSOT 중복 방지: 도메인의 ssotKey에 product가 없으면 carrier당 1건만
-    carrier_level_docs = set()  # (carrier_id, doc_type_id) 이미 생성된 것
-    global_level_docs = set()   # (doc_type_id) 이미 생성된 것
+        facet_index.add(doc_id, domain, common_cls, lifecycle)
 
     def add_product_docs(carrier_id, carrier, product_id, product, nodes, edges):
         count = 0
@@ -317,48 +382,41 @@ def generate_graph_data():
             if doc_type_id in COMMON_DOC_TYPES:
                 continue
 
-            # SSOT 준수: 도메인의 ssotKey에 따라 생성 범위 제한
+            # SSOT 준수: 도메인 facets에 따라 ID/classification 결정
             domain = DOC_TYPE_DOMAIN_MAP.get(doc_type_id, "GA-SALES")
             domain_def = DOMAINS.get(domain, {})
-            ssot_key = domain_def.get("ssotKey", [])
             facet_ids = {f["id"] for f in domain_def.get("facets", [])}
 
-            # ssotKey에 따른 중복 방지 + ID/classification 결정
             has_carrier = "carrier" in facet_ids
             has_product = "product" in facet_ids
 
+            # carrier×product×docType 도메인 (GA-SALES, GA-COMM, GA-CONTRACT): 상품별
+            # carrier×docType 도메인 (GA-COMP): carrier당 1건
+            # docType만 (GA-EDU): 전역 1건
+            id_carrier = carrier_id if has_carrier else None
+            id_product = product_id if has_product else None
+
+            # classification: 도메인 facets에 정의된 필드만 포함
+            classification = {"docType": doc_type_id}
+            if has_carrier:
+                classification["carrier"] = carrier_id
             if has_product:
-                # carrier×product×docType 도메인 (GA-SALES, GA-COMM, GA-CONTRACT)
-                id_carrier, id_product = carrier_id, product_id
-            elif has_carrier:
-                # carrier×docType 도메인 (GA-COMP): carrier당 1건
-                key = (carrier_id, doc_type_id)
-                if key in carrier_level_docs:
-                    continue
-                carrier_level_docs.add(key)
-                id_carrier, id_product = carrier_id, None
-            else:
-                # docType만 (GA-EDU): 전역 1건
-                if doc_type_id in global_level_docs:
-                    continue
-                global_level_docs.add(doc_type_id)
-                id_carrier, id_product = None, None
+                classification["product"] = product_id
+
+            # 같은 SSOT 경로에 이미 생성된 문서가 있으면 건너뜀
+            key = ssot_key(domain, classification)
+            if key is not None and facet_index.has_path(domain, key):
+                continue
 
             doc_id = generate_doc_id(doc_type_id, id_carrier, id_product)
             tier = doc_type.get("tier", "WARM")
             lifecycle = random_lifecycle()
             created_at, updated_at, reviewed_at = random_dates(tier, lifecycle)
+            facet_index.add(doc_id, domain, classification, lifecycle)
 
             # 버전 상품 문서는 v2.0
             version = {"major": 2, "minor": 0} if is_versioned_product else {"major": 1, "minor": 0}
 
-            # classification: 도메인 facets에 정의된 필드만 포함
-            classification = {"docType": doc_type_id}
-            if has_carrier:
-                classification["carrier"] = carrier_id
-            if has_product:
-                classification["product"] = product_id
-
             # name: facets에 맞게 구성
             name_parts = []
             if has_carrier:
@@ -423,18 +481,17 @@ def generate_graph_data():
         return count
 
     doc_count = 0
-    for carrier_id in SAMPLE_CARRIERS:
-        carrier = CARRIERS.get(carrier_id, {})
+    for carrier_id, carrier in carriers:
         carrier_type = carrier.get("type", "life")
         is_major = carrier.get("tier") == "major"
 
-        products = SAMPLE_PRODUCTS["non-life"] if carrier_type == "non-life" else SAMPLE_PRODUCTS["life"]
+        products = sample_products["non-life"] if carrier_type == "non-life" else sample_products["life"]
         for product_id in products:
             product = PRODUCTS.get(product_id, {})
             doc_count += add_product_docs(carrier_id, carrier, product_id, product, nodes, edges)
 
         if is_major:
-            versioned = VERSIONED_PRODUCTS["non-life"] if carrier_type == "non-life" else VERSIONED_PRODUCTS["life"]
+            versioned = versioned_products["non-life"] if carrier_type == "non-life" else versioned_products["life"]
             for product_id in versioned:
                 product = PRODUCTS.get(product_id, {})
                 doc_count += add_product_docs(carrier_id, carrier, product_id, product, nodes, edges)
@@ -452,7 +509,7 @@ def generate_graph_data():
     stats = {
         "total_nodes": len(nodes),
         "total_edges": len(edges),
-        "carriers": len(SAMPLE_CARRIERS),
+        "carriers": len(carriers),
         "common_docs": len(COMMON_DOC_TYPES),
         "doc_types": len(DOC_TYPES),
         "documents": doc_count + len(COMMON_DOC_TYPES),
@@ -464,8 +521,11 @@ def generate_graph_data():
     return {"stats": stats, "graph_data": {"nodes": nodes, "edges": edges}}
 
 
-def generate_sample_files(base_path: str):
+def generate_sample_files(base_path: str, scale: int = 1):
     """샘플 파일 생성 (도메인 facets 기반 SSOT 적용)"""
+    carriers = scaled_carriers(scale)
+    sample_products = lazy_table("SAMPLE_PRODUCTS")
+    versioned_products = lazy_table("VERSIONED_PRODUCTS")
     samples_path = os.path.join(base_path, "data", "samples")
     common_path = os.path.join(samples_path, "COMMON")
     os.makedirs(common_path, exist_ok=True)
@@ -530,17 +590,16 @@ def generate_sample_files(base_path: str):
             count += 1
         return count
 
-    for carrier_id in SAMPLE_CARRIERS:
-        carrier = CARRIERS.get(carrier_id, {})
+    for carrier_id, carrier in carriers:
         carrier_type = carrier.get("type", "life")
         is_major = carrier.get("tier") == "major"
 
-        products = SAMPLE_PRODUCTS["non-life"] if carrier_type == "non-life" else SAMPLE_PRODUCTS["life"]
+        products = sample_products["non-life"] if carrier_type == "non-life" else sample_products["life"]
         for product_id in products:
             file_count += write_product_docs(carrier_id, product_id, samples_path)
 
         if is_major:
-            versioned = VERSIONED_PRODUCTS["non-life"] if carrier_type == "non-life" else VERSIONED_PRODUCTS["life"]
+            versioned = versioned_products["non-life"] if carrier_type == "non-life" else versioned_products["life"]
             for product_id in versioned:
                 file_count += write_product_docs(carrier_id, product_id, samples_path)
 
@@ -555,17 +614,24 @@ def main():
     print("=" * 60)
 
     print("\n[1/2] 그래프 데이터 생성 중...")
-    graph_data = generate_graph_data()
+    with phase("generation"):
+        graph_data = generate_graph_data()
+
+    with phase("merkle"):
+        from merkle import build_merkle
+        graph_data["merkle"] = build_merkle(graph_data["graph_data"]["nodes"],
+                                            graph_data["graph_data"]["edges"]).to_dict()
 
     graph_path = os.path.join(base_path, "data", "knowledge-graph.json")
-    with open(graph_path, "w", encoding="utf-8") as f:
-        json.dump(graph_data, f, ensure_ascii=False, indent=2)
+    with phase("serialization"):
+        dump_json(graph_data, graph_path)
 
     print(f"  ✓ {graph_path}")
     print(f"  - 노드: {graph_data['stats']['total_nodes']}개")
     print(f"  - 엣지: {graph_data['stats']['total_edges']}개")
     print(f"  - 문서: {graph_data['stats']['documents']}개")
     print(f"  - 규제: {graph_data['stats']['regulations']}개")
+    print(f"  - Merkle 루트: {graph_data['merkle']['root']}")
 
     # 라이프사이클 분포 출력
     doc_nodes = [n for n in graph_data['graph_data']['nodes'] if 'Document' in n.get('labels', [])]
@@ -576,7 +642,8 @@ def main():
     print(f"  - 라이프사이클 분포: {lifecycle_dist}")
 
     print("\n[2/2] 샘플 문서 파일 생성 중...")
-    file_count = generate_sample_files(base_path)
+    with phase("sample_files"):
+        file_count = generate_sample_files(base_path)
     print(f"  ✓ data/samples/")
     print(f"  - 파일: {file_count}개")
 
@@ -586,4 +653,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with profiled("simulator"):
+        main()
@@ -8,7 +8,6 @@
 - 프로세스 순서(PRECEDES) 관계 추가
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 
@@ -18,17 +17,20 @@ from taxonomy import (
 )
 from ontology import (
     CARRIER_CLASS_MAP, PRODUCT_CLASS_MAP, DOC_TYPE_CLASS_MAP,
-    PROCESS_CLASS_MAP, CONCEPTS, SYNONYM_MAP, RELATION_TYPES,
+    PROCESS_CLASS_MAP, CONCEPTS,
 )
 from simulator import (
-    SAMPLE_CARRIERS, SAMPLE_PRODUCTS, COMMON_DOC_TYPES,
-    DOC_PROCESS_MAP, DOC_AUDIENCE_MAP, DOC_TEMPLATES,
-    get_tier, get_source, generate_doc_id, generate_doc_content,
+    COMMON_DOC_TYPES, DOC_PROCESS_MAP, DOC_AUDIENCE_MAP,
+    get_tier, get_source, generate_doc_id, lazy_table, scaled_carriers,
 )
+from profiling import phase, profiled
+from serialization import dump_json
 
 
-def generate_ontology_graph():
-    """온톨로지 메타데이터가 포함된 지식 그래프 생성"""
+def generate_ontology_graph(scale: int = 1):
+    """온톨로지 메타데이터가 포함된 지식 그래프 생성 (scale > 1 이면 보험사를 복제해 약 scale배)"""
+    carriers = scaled_carriers(scale)
+    sample_products = lazy_table("SAMPLE_PRODUCTS")
     nodes = []
     edges = []
 
@@ -44,8 +46,7 @@ def generate_ontology_graph():
     })
 
     # ── 보험사 노드 ──
-    for carrier_id in SAMPLE_CARRIERS:
-        carrier = CARRIERS.get(carrier_id, {})
+    for carrier_id, carrier in carriers:
         nodes.append({
             "id": carrier_id,
             "labels": ["Carrier", carrier.get("type", "life")],
@@ -117,10 +118,9 @@ def generate_ontology_graph():
 
     # ── 상품별 문서 노드 ──
     doc_count = 0
-    for carrier_id in SAMPLE_CARRIERS:
-        carrier = CARRIERS.get(carrier_id, {})
+    for carrier_id, carrier in carriers:
         carrier_type = carrier.get("type", "life")
-        products = SAMPLE_PRODUCTS["non-life"] if carrier_type == "non-life" else SAMPLE_PRODUCTS["life"]
+        products = sample_products["non-life"] if carrier_type == "non-life" else sample_products["life"]
 
         for product_id in products:
             product = PRODUCTS.get(product_id, {})
@@ -222,6 +222,12 @@ def generate_ontology_graph():
             edges.append({"source": installment_id, "target": doc_id, "type": "RESTRICTS"})
 
     # ── 개념(Concept) 노드 ──
+    # 문서유형별 첫 문서 (EXPLAINS 대표 문서) — 개념마다 전체 노드를 훑지 않도록 한 번만 계산
+    first_doc_by_type = {}
+    for n in nodes:
+        if "Document" in n.get("labels", []):
+            first_doc_by_type.setdefault(n["properties"].get("doc_type"), n["id"])
+
     for concept_id, concept in CONCEPTS.items():
         nodes.append({
             "id": concept_id,
@@ -248,11 +254,10 @@ def generate_ontology_graph():
                 target_doc_id = generate_doc_id(doc_type_id)
                 edges.append({"source": concept_id, "target": target_doc_id, "type": "EXPLAINS"})
             else:
-                # 비공통 문서는 이미 생성된 노드 중 해당 유형 문서에 연결
-                for n in nodes:
-                    if "Document" in n.get("labels", []) and n["properties"].get("doc_type") == doc_type_id:
-                        edges.append({"source": concept_id, "target": n["id"], "type": "EXPLAINS"})
-                        break  # 대표 1개만 연결
+                # 비공통 문서는 이미 생성된 노드 중 해당 유형 문서에 연결 (대표 1개만)
+                target_doc_id = first_doc_by_type.get(doc_type_id)
+                if target_doc_id:
+                    edges.append({"source": concept_id, "target": target_doc_id, "type": "EXPLAINS"})
 
         # 개념 ↔ 개념 RELATED_TO
         for related_id in concept.get("related_concepts", []):
@@ -270,7 +275,7 @@ def generate_ontology_graph():
     stats = {
         "total_nodes": len(nodes),
         "total_edges": len(edges),
-        "carriers": len(SAMPLE_CARRIERS),
+        "carriers": len(carriers),
         "common_docs": len(COMMON_DOC_TYPES),
         "doc_types": len(DOC_TYPES),
         "documents": doc_count + len(COMMON_DOC_TYPES),
@@ -300,11 +305,12 @@ def main():
     print("온톨로지 기반 지식 그래프 생성기 v3.0")
     print("=" * 60)
 
-    graph_data = generate_ontology_graph()
+    with phase("generation"):
+        graph_data = generate_ontology_graph()
 
     output_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "knowledge-graph-ontology.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(graph_data, f, ensure_ascii=False, indent=2)
+    with phase("serialization"):
+        dump_json(graph_data, output_path)
 
     stats = graph_data["stats"]
     print(f"\n  노드: {stats['total_nodes']}개")
@@ -317,4 +323,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with profiled("simulator_ontology"):
+        main()
@@ -0,0 +1,280 @@
+"""
+스트리밍 그래프 스냅샷 diff (id 정렬 파일 병합 조인)
+
+두 스냅샷의 노드/엣지를 키 순으로 정렬한 파일을 한 줄씩 나란히 읽으며 병합 조인해
+추가·삭제·변경 레코드를 속성 단위 변경과 함께 JSONL로 낸다.
+메모리는 양쪽 현재 레코드 한 줄씩만 쓰므로 그래프 크기와 무관하다.
+(graph_diff.py는 Merkle 해시로 바뀐 가지를 찾고, 여기서는 레코드 단위 변경 내용을 낸다)
+
+정렬 스냅샷 (sort 명령이 만듦, 디렉터리 하나):
+    nodes.jsonl   키 ["id"]                    순
+    edges.jsonl   키 ["source", "type", "target"] 순 (같은 키는 레코드 바이트 순)
+    각 줄: <키 JSON 배열>\\t<레코드 JSON>   (키는 문자열 코드포인트 순)
+  - 정렬은 external_sort.ExternalSorter (메모리 예산 안의 run + k-way 병합)
+  - 원본 knowledge-graph.json을 읽는 단계만 그래프 전체를 메모리에 올린다
+
+diff 레코드 (한 줄에 하나):
+    {"op": "add" | "remove" | "change", "kind": "node" | "edge", "key": [...],
+     "record": 새 레코드 (삭제면 옛 레코드),
+     "changes": [{"path": ["properties", "lifecycle"], "old": ..., "new": ...}, ...]}  # change만
+  - changes의 old/new는 한쪽에 없는 필드면 생략
+  - dict는 키별로 내려가고 리스트·스칼라는 값 전체를 비교
+  - 줄 바이트가 같은 레코드는 파싱하지 않고 건너뜀
+
+    python scripts/snapshot_diff.py sort data/knowledge-graph.json snapshots/run-1
+    python scripts/snapshot_diff.py diff snapshots/run-1 snapshots/run-2 --output docs/results/snapshot-diff.jsonl
+    python scripts/snapshot_diff.py diff old.json data/knowledge-graph.json   # JSON이면 임시 디렉터리에 정렬 후 비교
+
+종료 코드: 0 = 같음, 1 = 다름, 2 = 입력이 정렬 스냅샷 형식이 아님
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from external_sort import DEFAULT_MEMORY_MB, ExternalSorter
+from profiling import phase, profiled
+from serialization import dumps, load_json, loads
+
+NODE_FILE = "nodes.jsonl"
+EDGE_FILE = "edges.jsonl"
+NODE_KEY = ("id",)
+EDGE_KEY = ("source", "type", "target")
+
+
+def _key_of(fields: Tuple[str, ...]) -> Callable[[dict], tuple]:
+    def key(record: dict) -> tuple:
+        # None과 str은 비교할 수 없으므로 빈 문자열로 (정렬 키 전용, 레코드는 그대로)
+        return tuple("" if record.get(f) is None else str(record.get(f)) for f in fields)
+    return key
+
+
+node_key = _key_of(NODE_KEY)
+edge_key = _key_of(EDGE_KEY)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 정렬 스냅샷 쓰기 / 읽기
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def write_sorted(records: Iterable[dict], key: Callable[[dict], tuple], path: str,
+                 memory_mb: float = DEFAULT_MEMORY_MB, tmp_dir: Optional[str] = None) -> int:
+    """레코드를 키 순으로 정렬해 "<키>\\t<레코드>" 줄로 기록 → 레코드 수"""
+    count = 0
+    with ExternalSorter(memory_mb, tmp_dir) as sorter:
+        for record in records:
+            sorter.add(key(record) + (dumps(record, pretty=False),))
+        with open(path, "wb") as f:
+            for *k, data in sorter.sorted():
+                f.write(dumps(k, pretty=False) + b"\t" + data + b"\n")
+                count += 1
+    return count
+
+
+def sort_snapshot(graph: dict, out_dir: str, memory_mb: float = DEFAULT_MEMORY_MB,
+                  tmp_dir: Optional[str] = None) -> Tuple[int, int]:
+    """knowledge-graph.json 데이터 → 정렬 스냅샷 디렉터리 → (노드 수, 엣지 수)"""
+    os.makedirs(out_dir, exist_ok=True)
+    data = graph.get("graph_data", {})
+    nodes = write_sorted(data.get("nodes", []), node_key, os.path.join(out_dir, NODE_FILE), memory_mb, tmp_dir)
+    edges = write_sorted(data.get("edges", []), edge_key, os.path.join(out_dir, EDGE_FILE), memory_mb, tmp_dir)
+    return nodes, edges
+
+
+def read_sorted(path: str) -> Iterator[Tuple[tuple, bytes]]:
+    """정렬 파일 → (키, 레코드 JSON 바이트) (키가 줄어들면 ValueError)"""
+    prev = None
+    with open(path, "rb") as f:
+        for lineno, line in enumerate(f, 1):
+            raw_key, sep, data = line.rstrip(b"\n").partition(b"\t")
+            if not sep:
+                raise ValueError(f"{path}:{lineno}: 정렬 스냅샷 형식이 아닙니다 (<키>\\t<레코드>)")
+            key = tuple(loads(raw_key))
+            if prev is not None and key < prev:
+                raise ValueError(f"{path}:{lineno}: 키 순으로 정렬되지 않았습니다 ({key} < {prev})")
+            prev = key
+            yield key, data
+
+
+def merge_join(old: Iterator[Tuple[tuple, bytes]],
+               new: Iterator[Tuple[tuple, bytes]]) -> Iterator[Tuple[tuple, Optional[bytes], Optional[bytes]]]:
+    """키 순 두 스트림 병합 조인 → (키, 옛 레코드 | None, 새 레코드 | None)
+
+    같은 키가 여러 줄이면 양쪽에서 순서대로 짝짓고 남는 쪽은 추가/삭제
+    """
+    a, b = next(old, None), next(new, None)
+    while a is not None or b is not None:
+        if b is None or (a is not None and a[0] < b[0]):
+            yield a[0], a[1], None
+            a = next(old, None)
+        elif a is None or b[0] < a[0]:
+            yield b[0], None, b[1]
+            b = next(new, None)
+        else:
+            yield a[0], a[1], b[1]
+            a, b = next(old, None), next(new, None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 레코드 비교
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_ABSENT = object()
+
+
+def record_changes(old: Any, new: Any, path: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+    """dict는 키별로 내려가며, 리스트·스칼라는 값 전체로 비교한 변경 목록"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for k in list(old) + [k for k in new if k not in old]:
+            changes.extend(record_changes(old.get(k, _ABSENT), new.get(k, _ABSENT), path + (k,)))
+        return changes
+    if old == new:
+        return []
+    change = {"path": list(path)}
+    if old is not _ABSENT:
+        change["old"] = old
+    if new is not _ABSENT:
+        change["new"] = new
+    return [change]
+
+
+@dataclass
+class DiffStats:
+    counts: Dict[str, Dict[str, int]] = field(default_factory=lambda: {
+        kind: {"add": 0, "remove": 0, "change": 0, "same": 0} for kind in ("node", "edge")
+    })
+
+    @property
+    def identical(self) -> bool:
+        return not any(c["add"] or c["remove"] or c["change"] for c in self.counts.values())
+
+
+def diff_stream(kind: str, key_fields: Tuple[str, ...], old_path: str, new_path: str,
+                stats: DiffStats) -> Iterator[dict]:
+    """한 종류(node/edge) 정렬 파일 두 개 → diff 레코드"""
+    counts = stats.counts[kind]
+    for key, a, b in merge_join(read_sorted(old_path), read_sorted(new_path)):
+        if a == b:
+            counts["same"] += 1
+            continue
+        if a is None:
+            counts["add"] += 1
+            yield {"op": "add", "kind": kind, "key": list(key), "record": loads(b)}
+            continue
+        if b is None:
+            counts["remove"] += 1
+            yield {"op": "remove", "kind": kind, "key": list(key), "record": loads(a)}
+            continue
+        old, new = loads(a), loads(b)
+        changes = record_changes({k: v for k, v in old.items() if k not in key_fields},
+                                 {k: v for k, v in new.items() if k not in key_fields})
+        if not changes:  # 직렬화만 다름 (키 순서, JSON 백엔드)
+            counts["same"] += 1
+            continue
+        counts["change"] += 1
+        yield {"op": "change", "kind": kind, "key": list(key), "record": new, "changes": changes}
+
+
+def diff_snapshots(old_dir: str, new_dir: str, stats: Optional[DiffStats] = None) -> Iterator[dict]:
+    """정렬 스냅샷 디렉터리 두 개 → 노드 diff 레코드, 이어서 엣지 diff 레코드"""
+    stats = stats if stats is not None else DiffStats()
+    yield from diff_stream("node", NODE_KEY, os.path.join(old_dir, NODE_FILE), os.path.join(new_dir, NODE_FILE), stats)
+    yield from diff_stream("edge", EDGE_KEY, os.path.join(old_dir, EDGE_FILE), os.path.join(new_dir, EDGE_FILE), stats)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 메인 실행
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _snapshot_dir(path: str, memory_mb: float, tmp_root: str) -> str:
+    """정렬 스냅샷 디렉터리면 그대로, 그래프 JSON이면 임시 디렉터리에 정렬"""
+    if os.path.isdir(path):
+        return path
+    out_dir = tempfile.mkdtemp(prefix="kms-snapshot-", dir=tmp_root)
+    with phase("sort"):
+        nodes, edges = sort_snapshot(load_json(path), out_dir, memory_mb)
+    print(f"  정렬: {path} → 노드 {nodes:,}개, 엣지 {edges:,}개")
+    return out_dir
+
+
+def _format_change(change: dict) -> str:
+    old = dumps(change["old"], pretty=False).decode() if "old" in change else "∅"
+    new = dumps(change["new"], pretty=False).decode() if "new" in change else "∅"
+    return f"{'.'.join(change['path'])}: {old} → {new}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 그래프 스냅샷 diff")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_sort = sub.add_parser("sort", help="knowledge-graph.json → 정렬 스냅샷 디렉터리 (nodes.jsonl, edges.jsonl)")
+    p_sort.add_argument("graph", help="knowledge-graph.json 경로")
+    p_sort.add_argument("out_dir", help="정렬 스냅샷 디렉터리")
+    p_sort.add_argument("--memory-mb", type=float, default=DEFAULT_MEMORY_MB, help="정렬 메모리 예산")
+
+    p_diff = sub.add_parser("diff", help="두 스냅샷 병합 조인 diff")
+    p_diff.add_argument("old", help="이전 스냅샷 (정렬 디렉터리 또는 knowledge-graph.json)")
+    p_diff.add_argument("new", help="새 스냅샷")
+    p_diff.add_argument("--output", default="docs/results/snapshot-diff.jsonl", help="diff 레코드 JSONL 경로")
+    p_diff.add_argument("--memory-mb", type=float, default=DEFAULT_MEMORY_MB, help="JSON 입력 정렬 메모리 예산")
+    p_diff.add_argument("--limit", type=int, default=10, help="출력할 예시 레코드 수")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("그래프 스냅샷 diff (정렬 병합 조인)")
+    print("=" * 60)
+
+    if args.command == "sort":
+        with phase("load"):
+            graph = load_json(args.graph)
+        with phase("sort"):
+            nodes, edges = sort_snapshot(graph, args.out_dir, args.memory_mb)
+        print(f"\n  ✓ 노드: {nodes:,}개 → {os.path.join(args.out_dir, NODE_FILE)}")
+        print(f"  ✓ 엣지: {edges:,}개 → {os.path.join(args.out_dir, EDGE_FILE)}")
+        return 0
+
+    tmp_root = tempfile.mkdtemp(prefix="kms-diff-")
+    try:
+        old_dir = _snapshot_dir(args.old, args.memory_mb, tmp_root)
+        new_dir = _snapshot_dir(args.new, args.memory_mb, tmp_root)
+        stats = DiffStats()
+        examples = []
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with phase("diff"), open(args.output, "wb") as out:
+            for record in diff_snapshots(old_dir, new_dir, stats):
+                out.write(dumps(record, pretty=False) + b"\n")
+                if len(examples) < args.limit:
+                    examples.append(record)
+    except ValueError as e:  # 정렬 스냅샷 형식/순서 오류
+        print(f"\n  ❌ {e}")
+        return 2
+    finally:
+        shutil.rmtree(tmp_root, ignore_errors=True)
+
+    print(f"\n  {'':<6} {'추가':>8} {'삭제':>8} {'변경':>8} {'동일':>10}")
+    for kind, label in (("node", "노드"), ("edge", "엣지")):
+        c = stats.counts[kind]
+        print(f"  {label:<4} {c['add']:>10,} {c['remove']:>10,} {c['change']:>10,} {c['same']:>12,}")
+
+    if examples:
+        print(f"\n  예시 ({len(examples)}건):")
+        for record in examples:
+            print(f"    [{record['op']}] {record['kind']} {' / '.join(record['key'])}")
+            for change in record.get("changes", [])[:5]:
+                print(f"      {_format_change(change)}")
+    print(f"\n  저장: {args.output}")
+
+    print("\n" + "=" * 60)
+    print("✅ 변경 없음" if stats.identical else "❌ 변경 있음")
+    print("=" * 60)
+    return 0 if stats.identical else 1
+
+
+if __name__ == "__main__":
+    with profiled("snapshot_diff"):
+        status = main()
+    exit(status)
@@ -0,0 +1,81 @@
+"""
+외부 정렬 SSOT 검증 (메모리보다 큰 그래프)
+
+FacetIndex는 모든 ACTIVE 문서 ID를 경로별 dict로 들고 있다.
+여기서는 문서를 한 번 흘려 읽으며 (domain, ssot_key, 순번, doc_id) 튜플을
+메모리 예산 단위 정렬 run으로 내보내고, k-way 병합 순서대로 경로를 묶어
+ACTIVE 문서가 2건 이상인 경로를 찾는다. 메모리는 예산 + 위반 경로만큼만 쓴다.
+
+결과는 FacetIndex.from_nodes(nodes, wildcards=False)와 같다.
+
+- ACTIVE 등록마다 한 건: 같은 문서 ID가 여러 번 나와도 각각 센다 (중복 ID 노드도 SSOT 위반)
+- 경로 안 ID는 처음 나온 순서, 여러 번 나온 ID는 나온 수만큼 반복 (FacetIndex.conflicts와 같음)
+- 도메인 미등록 문서는 무시 (ssot_key가 None)
+- 키 값은 정렬용으로 None → (0,), 숫자 → (1, 값), 문자열 → (2, 값)으로 감싸 섞여도 비교되게 하고
+  결과에서 원래 값으로 되돌린다 (classification 값이 JSON null이어도 FacetIndex와 같은 결과)
+- 위반 경로 순서도 FacetIndex와 같게, 경로의 두 번째 ACTIVE 등록 순번 순
+
+    scan = scan_ssot(doc_nodes, memory_mb=128)
+    scan.conflicts, scan.active_path_count, scan.runs
+"""
+
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional
+
+from external_sort import DEFAULT_MEMORY_MB, ExternalSorter
+from facet_index import SsotPath, occurrences, ssot_key
+
+
+def _sortable(key: tuple) -> tuple:
+    """ssot_key 튜플 → 원소끼리 항상 비교 가능한 정렬 키 (같은 값은 같은 키)"""
+    return tuple((0,) if v is None else (2, v) if isinstance(v, str) else (1, v) for v in key)
+
+
+def _restore(key: tuple) -> tuple:
+    return tuple(None if len(v) == 1 else v[1] for v in key)
+
+
+@dataclass
+class SsotScan:
+    conflicts: Dict[SsotPath, List[str]] = field(default_factory=dict)  # 위반 경로 → ACTIVE 문서 ID
+    active_path_count: int = 0
+    documents: int = 0   # 등록된 문서 (중복 ID 포함)
+    runs: int = 0        # 디스크로 흘린 run 수
+
+
+def scan_ssot(doc_nodes: Iterable[dict], memory_mb: float = DEFAULT_MEMORY_MB,
+              tmp_dir: Optional[str] = None) -> SsotScan:
+    """문서 노드를 한 번 순회해 SSOT 위반 경로와 ACTIVE 경로 수를 구한다"""
+    scan = SsotScan()
+    found = []
+    with ExternalSorter(memory_mb, tmp_dir) as by_path:
+        for seq, node in enumerate(doc_nodes):
+            if "Document" not in node.get("labels", []):
+                continue
+            props = node.get("properties", {})
+            domain = props.get("domain", "")
+            key = ssot_key(domain, props.get("classification", {}))
+            if key is None:
+                continue
+            scan.documents += 1
+            if props.get("lifecycle", "") == "ACTIVE":
+                by_path.add((domain, _sortable(key), seq, node["id"]))
+
+        # (domain, key, 순번) 순서로 경로별 묶음
+        for (domain, key), group in groupby(by_path.sorted(), key=itemgetter(0, 1)):
+            scan.active_path_count += 1
+            first = next(group)
+            second = next(group, None)
+            if second is None:
+                continue
+            posting: Dict[str, int] = {}
+            for member in (first, second, *group):
+                posting[member[3]] = posting.get(member[3], 0) + 1
+            found.append((second[2], (domain, _restore(key)), occurrences(posting)))
+        scan.runs = by_path.runs
+
+    found.sort(key=itemgetter(0))
+    scan.conflicts = {path: ids for _, path, ids in found}
+    return scan
@@ -0,0 +1,264 @@
+"""
+동의어/별칭 다중 패턴 매처 (Aho-Corasick)
+
+자유 텍스트 질의를 한 번만 훑어서 문서유형, 보험사, 상품, 개념을 찾는다.
+패턴은 ontology.SYNONYM_MAP / CONCEPTS 와 taxonomy.CARRIERS / PRODUCTS /
+DOC_TYPES 의 이름·별칭·동의어에서 만들고, 처음 사용할 때 한 번만 컴파일한다.
+
+매칭 규칙:
+- 대소문자 무시 (패턴과 질의 모두 소문자화, 매칭 위치는 원문 기준)
+- 영숫자만으로 된 패턴(DB, KB, CI, term 등)은 단어 경계에서만 매칭
+- 겹치는 매칭은 leftmost-longest 로 해소 ("삼성화재"가 "삼성"보다 우선)
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from taxonomy import CARRIERS, PRODUCTS, DOC_TYPES
+from ontology import SYNONYM_MAP, CONCEPTS
+
+# 매칭 대상 종류
+KIND_DOC_TYPE = "doc_type"
+KIND_CARRIER = "carrier"
+KIND_PRODUCT = "product"
+KIND_CONCEPT = "concept"
+
+# 공통 엔티티("전체", "ALL")는 질의 해석에서 제외
+EXCLUDED_IDS = {"INS-COMMON", "PRD-COMMON"}
+
+
+def _is_ascii_word(text: str) -> bool:
+    return text.isascii() and text.replace(" ", "").isalnum()
+
+
+def _is_ascii_alnum(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Aho-Corasick 오토마톤
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AhoCorasick:
+    """문자열 → payload 목록 다중 패턴 매처
+
+    add()로 패턴을 등록하고 build() 후 iter_matches()로 스캔한다.
+    스캔 비용은 O(질의 길이 + 매칭 수).
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._payloads: List[list] = [[]]    # 상태에서 끝나는 패턴의 payload
+        self._lengths: List[int] = [0]       # 상태에서 끝나는 패턴 길이
+        self._word: List[bool] = [False]     # 단어 경계 필요 여부
+        self._dict_link: List[int] = [0]     # fail 체인상 가장 가까운 종료 상태
+        self._built = False
+
+    def add(self, pattern: str, payload) -> None:
+        if self._built:
+            raise RuntimeError("build() 이후에는 패턴을 추가할 수 없습니다")
+        pattern = pattern.lower()
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._payloads.append([])
+                self._lengths.append(0)
+                self._word.append(False)
+                self._dict_link.append(0)
+                self._goto[state][ch] = nxt
+            state = nxt
+        if payload not in self._payloads[state]:
+            self._payloads[state].append(payload)
+        self._lengths[state] = len(pattern)
+        self._word[state] = _is_ascii_word(pattern)
+
+    def build(self) -> "AhoCorasick":
+        """BFS로 fail 링크와 출력(dict) 링크 계산"""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fallback = self._goto[f].get(ch, 0)
+                self._fail[nxt] = fallback if fallback != nxt else 0
+                target = self._fail[nxt]
+                self._dict_link[nxt] = target if self._payloads[target] else self._dict_link[target]
+
+        self._built = True
+        return self
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def iter_matches(self, text: str):
+        """(start, end, payloads) 를 end 오름차순으로 생성 (위치는 원문 text 기준)"""
+        if not self._built:
+            raise RuntimeError("build()를 먼저 호출하세요")
+        lowered = text.lower()
+        origin = None  # 소문자 문자열 위치 → 원문 위치 (소문자화로 길이가 바뀐 경우만)
+        if len(lowered) != len(text):  # 'İ' → 'i̇' 처럼 한 글자가 여러 글자로
+            lowered = "".join(ch.lower() for ch in text)
+            origin = [j for j, ch in enumerate(text) for _ in range(len(ch.lower()))]
+        goto, fail = self._goto, self._fail
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            out = state if self._payloads[state] else self._dict_link[state]
+            while out:
+                end = i + 1
+                start = end - self._lengths[out]
+                if not self._word[out] or self._at_word_boundary(lowered, start, end):
+                    if origin is None:
+                        yield start, end, self._payloads[out]
+                    else:
+                        yield origin[start], origin[end - 1] + 1, self._payloads[out]
+                out = self._dict_link[out]
+
+    @staticmethod
+    def _at_word_boundary(text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_ascii_alnum(text[start - 1]):
+            return False
+        if end < len(text) and _is_ascii_alnum(text[end]):
+            return False
+        return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 질의 매처
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class QueryMatch:
+    """질의에서 찾은 facet 값 (등장 순서 유지, 중복 제거)"""
+    doc_types: List[str] = field(default_factory=list)
+    carriers: List[str] = field(default_factory=list)
+    products: List[str] = field(default_factory=list)
+    concepts: List[str] = field(default_factory=list)
+    spans: List[Tuple[int, int, str]] = field(default_factory=list)
+
+    def add(self, kind: str, value: str) -> None:
+        bucket = {
+            KIND_DOC_TYPE: self.doc_types,
+            KIND_CARRIER: self.carriers,
+            KIND_PRODUCT: self.products,
+            KIND_CONCEPT: self.concepts,
+        }[kind]
+        if value not in bucket:
+            bucket.append(value)
+
+    def is_empty(self) -> bool:
+        return not (self.doc_types or self.carriers or self.products or self.concepts)
+
+
+class QueryMatcher:
+    """온톨로지/분류체계 용어 전체를 컴파일한 질의 매처"""
+
+    def __init__(self, automaton: AhoCorasick, pattern_count: int):
+        self.automaton = automaton
+        self.pattern_count = pattern_count
+
+    def match(self, text: str) -> QueryMatch:
+        """질의 1회 스캔 → leftmost-longest 로 겹침 해소 후 facet 별 분류"""
+        longest_at = {}  # start → (end, payloads)
+        for start, end, payloads in self.automaton.iter_matches(text):
+            best = longest_at.get(start)
+            if best is None or end > best[0]:
+                longest_at[start] = (end, payloads)
+
+        result = QueryMatch()
+        covered = 0
+        for start in sorted(longest_at):
+            if start < covered:
+                continue
+            end, payloads = longest_at[start]
+            covered = end
+            result.spans.append((start, end, text[start:end]))
+            for kind, value in payloads:
+                result.add(kind, value)
+        return result
+
+
+def _iter_patterns():
+    """(패턴 문자열, (종류, ID)) 생성"""
+    for keyword, doc_types in SYNONYM_MAP.items():
+        for doc_type_id in doc_types:
+            yield keyword, (KIND_DOC_TYPE, doc_type_id)
+    for doc_type_id, doc_type in DOC_TYPES.items():
+        yield doc_type.get("name", ""), (KIND_DOC_TYPE, doc_type_id)
+
+    for carrier_id, carrier in CARRIERS.items():
+        if carrier_id in EXCLUDED_IDS:
+            continue
+        for term in [carrier.get("name", "")] + carrier.get("alias", []):
+            yield term, (KIND_CARRIER, carrier_id)
+
+    for product_id, product in PRODUCTS.items():
+        if product_id in EXCLUDED_IDS:
+            continue
+        for term in [product.get("name", "")] + product.get("alias", []):
+            yield term, (KIND_PRODUCT, product_id)
+
+    for concept_id, concept in CONCEPTS.items():
+        for term in [concept["name"]] + concept.get("synonyms", []):
+            yield term, (KIND_CONCEPT, concept_id)
+
+
+def build_query_matcher() -> QueryMatcher:
+    automaton = AhoCorasick()
+    count = 0
+    for term, payload in _iter_patterns():
+        if term:
+            automaton.add(term, payload)
+            count += 1
+    return QueryMatcher(automaton.build(), count)
+
+
+_matcher = None
+
+
+def get_query_matcher() -> QueryMatcher:
+    """처음 호출 시 컴파일, 이후 재사용"""
+    global _matcher
+    if _matcher is None:
+        _matcher = build_query_matcher()
+    return _matcher
+
+
+def match_query(text: str) -> QueryMatch:
+    """자유 텍스트 질의 → 문서유형/보험사/상품/개념"""
+    return get_query_matcher().match(text)
+
+
+if __name__ == "__main__":
+    matcher = get_query_matcher()
+    print("=" * 60)
+    print("동의어/별칭 매처")
+    print("=" * 60)
+    print(f"  패턴: {matcher.pattern_count}개, 상태: {matcher.automaton.state_count}개")
+
+    for query in ["삼성생명 종신 수수료", "삼성화재 자동차보험 약관", "DB손보 실손 심사기준", "FYC 1200%룰 분급제"]:
+        m = matcher.match(query)
+        print(f"\n  '{query}'")
+        print(f"    문서유형: {m.doc_types}")
+        print(f"    보험사: {m.carriers}")
+        print(f"    상품: {m.products}")
+        print(f"    개념: {m.concepts}")
@@ -9,6 +9,8 @@ GA 보험영업은 첫 번째 도메인(박스)이며,
 import json
 from datetime import datetime
 
+from serialization import dump_json
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 시스템 프레임워크 (도메인 무관, 불변 규칙)
@@ -597,17 +599,19 @@ def export_to_json(filepath: str = "data/taxonomy.json"):
         "default_relations": DEFAULT_RELATIONS,
         "data_tiers": DATA_TIERS,
     }
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    return filepath
+    return dump_json(data, filepath)
 
 
 if __name__ == "__main__":
-    stats = get_taxonomy_stats()
-    print("=" * 60)
-    print("KMS Framework v3.0 Statistics")
-    print("=" * 60)
-    print(json.dumps(stats, indent=2, ensure_ascii=False))
-
-    filepath = export_to_json()
-    print(f"\n✓ Exported to {filepath}")
+    from profiling import phase, profiled
+
+    with profiled("taxonomy"):
+        stats = get_taxonomy_stats()
+        print("=" * 60)
+        print("KMS Framework v3.0 Statistics")
+        print("=" * 60)
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+
+        with phase("serialization"):
+            filepath = export_to_json()
+        print(f"\n✓ Exported to {filepath}")
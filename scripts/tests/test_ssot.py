@@ -0,0 +1,104 @@
+"""
+SSOT 유니크 제약 검증 (verifier.verify_ssot)
+
+같은 분류 경로의 ACTIVE 등록은 문서 ID가 같아도 한 건씩 센다.
+중복 ID 노드가 모두 ACTIVE면 SSOT 위반으로 보고되어야 하고,
+세 백엔드(FacetIndex, SQLite 저장소, 외부 정렬)의 결과가 같아야 한다.
+
+    python -m unittest discover -s scripts/tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from verifier import FrameworkVerifier  # noqa: E402
+
+
+def document(doc_id: str, doc_type: str, lifecycle: str = "ACTIVE", carrier: str = "INS-SAMSUNG",
+             product: str = "INS-SAMSUNG-PRD-LIFE-VARIABLE", domain: str = "GA-SALES") -> dict:
+    return {
+        "id": doc_id,
+        "labels": ["Document"],
+        "properties": {
+            "domain": domain,
+            "lifecycle": lifecycle,
+            "classification": {"carrier": carrier, "product": product, "docType": doc_type},
+        },
+    }
+
+
+def write_graph(base_path: str, nodes: list, edges: list = ()) -> None:
+    os.makedirs(os.path.join(base_path, "data"), exist_ok=True)
+    with open(os.path.join(base_path, "data", "knowledge-graph.json"), "w", encoding="utf-8") as f:
+        json.dump({"graph_data": {"nodes": nodes, "edges": list(edges)}}, f, ensure_ascii=False)
+
+
+def run_ssot(base_path: str, **options):
+    """verify_ssot → (통과, 실패, SSOT 위반 메시지)"""
+    verifier = FrameworkVerifier(base_path, **options)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert verifier.load_graph()
+        passed, failed = verifier.verify_ssot()
+    messages = list(verifier.violations.messages())
+    if verifier.store is not None:
+        verifier.store.close()
+    return passed, failed, messages
+
+
+class DuplicateActiveNodeTest(unittest.TestCase):
+    def test_duplicated_active_node_is_a_conflict(self):
+        nodes = [
+            document("DOC-A", "DOC-PROPOSAL"),
+            document("DOC-B", "DOC-TERMS"),
+            document("DOC-A", "DOC-PROPOSAL"),  # 같은 ID, 같은 경로, ACTIVE
+        ]
+        with tempfile.TemporaryDirectory() as base_path:
+            write_graph(base_path, nodes)
+            passed, failed, messages = run_ssot(base_path)
+        self.assertEqual((passed, failed), (1, 2))
+        self.assertEqual(len(messages), 1)
+        self.assertIn("ACTIVE 2건", messages[0])
+        self.assertIn("['DOC-A', 'DOC-A']", messages[0])
+
+
+
+class BackendEquivalenceTest(unittest.TestCase):
+    NODES = [
+        document("DOC-A", "DOC-PROPOSAL"),
+        document("DOC-A", "DOC-PROPOSAL", lifecycle="DRAFT"),   # 같은 ID, 같은 경로, 비ACTIVE
+        document("DOC-B", "DOC-TERMS"),
+        document("DOC-C", "DOC-COMMISSION"),
+        document("DOC-B", "DOC-TERMS"),                          # 같은 ID, 같은 경로, ACTIVE
+        document("DOC-D", "DOC-COMMISSION"),
+        document("DOC-C", "DOC-COMMISSION", lifecycle="ARCHIVED"),
+        document("DOC-E", "DOC-GUIDE"),
+        document("DOC-E", "DOC-GUIDE", carrier="INS-HANWHA"),    # 같은 ID, 다른 경로
+        document("DOC-F", "DOC-TERMS"),
+        document("DOC-G", "DOC-TERMS", domain="UNKNOWN"),       # 도메인 미등록 → 무시
+    ]
+
+    def test_backends_agree_on_duplicate_ids_and_mixed_lifecycles(self):
+        with tempfile.TemporaryDirectory() as base_path:
+            write_graph(base_path, self.NODES)
+            results = {
+                "memory": run_ssot(base_path),
+                "sqlite": run_ssot(base_path, store_path=os.path.join(base_path, "graph.sqlite")),
+                "external": run_ssot(base_path, ssot_memory_mb=0.001),
+            }
+        # ACTIVE 경로 5개 중 DOC-TERMS(B, B, F)와 DOC-COMMISSION(C, D)이 위반
+        for backend, (passed, failed, messages) in results.items():
+            with self.subTest(backend=backend):
+                self.assertEqual((passed, failed), (3, 5))
+                self.assertEqual(messages, results["memory"][2])
+        self.assertEqual(len(results["memory"][2]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
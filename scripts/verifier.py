@@ -5,42 +5,249 @@ KMS v3.0 프레임워크 검증기
 도메인 전문가가 어떤 문서를 만들든, 이 틀은 깨지면 안 된다.
 """
 
-import json
 import os
+import taxonomy
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from taxonomy import (
     CARRIERS, PRODUCTS, DOC_TYPES, PROCESSES, AUDIENCES,
     DATA_TIERS, CERTIFICATIONS, GA_TYPES, REGULATION_TIMELINE,
     SYSTEM_CONFIG, BUSINESSES, DOMAINS, DOC_TYPE_DOMAIN_MAP,
     get_taxonomy_stats
 )
+from facet_index import FacetIndex
+from bitmap_index import BitmapIndex
+from endpoint_check import check_endpoints
+from cycle_check import check_cycles
+from result_cache import GRAPH, ResultCache, table_fingerprints
+from violations import ERROR, WARNING, ViolationCollector
+from rule_timing import RuleTimer
+from profiling import profiled
+from serialization import dump_json, load_json
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 문서/엣지 단위 검사 (전수 검증과 표본 검증이 함께 사용)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+REQUIRED_SYSTEM_FIELDS = ["domain", "lifecycle", "version"]
+REQUIRED_DATE_FIELDS = ["createdAt", "updatedAt"]
+
+Issue = Tuple[str, str, str, tuple, str]  # (level, code, template, args, domain)
+
+
+def check_required_fields(doc: dict) -> Tuple[int, List[Issue]]:
+    """시스템 필수 필드 + 날짜 + classification.docType → (통과한 항목 수, 위반)"""
+    props = doc.get("properties", {})
+    doc_id = doc.get("id", "?")
+    domain = props.get("domain", "")
+    passed, issues = 0, []
+
+    # 시스템 필드
+    for field in REQUIRED_SYSTEM_FIELDS:
+        if field not in props or props[field] is None:
+            issues.append((ERROR, "MISSING_FIELD", "{}: 필수 필드 누락 '{}'", (doc_id, field), domain))
+        else:
+            passed += 1
+
+    # 날짜 필드
+    for field in REQUIRED_DATE_FIELDS:
+        if field not in props or not props[field]:
+            issues.append((ERROR, "MISSING_DATE", "{}: 필수 날짜 누락 '{}'", (doc_id, field), domain))
+        else:
+            passed += 1
+
+    # classification 객체 존재
+    cls = props.get("classification", {})
+    if not cls or "docType" not in cls:
+        issues.append((ERROR, "MISSING_DOCTYPE", "{}: classification.docType 누락", (doc_id,), domain))
+    else:
+        passed += 1
+    return passed, issues
+
+
+def check_domain_assignment(doc: dict) -> Tuple[int, List[Issue]]:
+    """domain이 DOMAINS에 있고 docType/facet과 맞는지 → (통과한 facet 수, 위반·경고)"""
+    props = doc.get("properties", {})
+    doc_id = doc.get("id", "?")
+    domain = props.get("domain", "")
+    cls = props.get("classification", {})
+    doc_type = cls.get("docType", "")
+    passed, issues = 0, []
+
+    # domain이 DOMAINS에 존재
+    if domain not in DOMAINS:
+        return 0, [(ERROR, "INVALID_DOMAIN", "{}: 잘못된 도메인 '{}'", (doc_id, domain), domain)]
+
+    # docType의 기본 도메인과 일치 확인
+    expected_domain = DOC_TYPE_DOMAIN_MAP.get(doc_type, "")
+    if expected_domain and domain != expected_domain:
+        issues.append((WARNING, "DOMAIN_MISMATCH", "{}: 도메인 불일치 (실제: {}, 기대: {})",
+                       (doc_id, domain, expected_domain), domain))
+
+    # 도메인의 필수 facet이 classification에 존재
+    domain_def = DOMAINS[domain]
+    allowed_facets = {f["id"] for f in domain_def.get("facets", [])}
+    for facet in domain_def.get("facets", []):
+        if facet.get("required") and not cls.get(facet["id"]):
+            issues.append((ERROR, "MISSING_FACET", "{}: 도메인 {}의 필수 facet '{}' 누락",
+                           (doc_id, domain, facet["id"]), domain))
+        else:
+            passed += 1
+
+    # classification에 도메인 facets에 없는 필드가 있으면 오류
+    for field in cls:
+        if field not in allowed_facets:
+            issues.append((ERROR, "UNDEFINED_FACET", "{}: 도메인 {}에 정의되지 않은 classification 필드 '{}'",
+                           (doc_id, domain, field), domain))
+    return passed, issues
+
+
+def check_lifecycle(doc: dict, valid_states: set) -> Optional[Issue]:
+    props = doc.get("properties", {})
+    if props.get("lifecycle", "") in valid_states:
+        return None
+    return (ERROR, "INVALID_STATE", "{}: 잘못된 라이프사이클 '{}'",
+            (doc.get("id", "?"), props.get("lifecycle", "")), props.get("domain", ""))
+
+
+def check_freshness(doc: dict, today: datetime) -> Tuple[Optional[str], Optional[Issue]]:
+    """ACTIVE 문서의 신선도 구간 → (FRESH | WARNING | EXPIRED | None, 날짜 파싱 경고 | None)"""
+    props = doc.get("properties", {})
+    if props.get("lifecycle") != "ACTIVE":
+        return None, None
+    updated = props.get("updatedAt") or props.get("createdAt")
+    if not updated:
+        return None, None
+    max_days = SYSTEM_CONFIG["freshness_defaults"].get(props.get("tier", "WARM"), 90)
+    try:
+        days_since = (today - datetime.fromisoformat(updated)).days
+    except Exception:
+        return None, (WARNING, "DATE_PARSE", "{}: 날짜 파싱 실패 ({})", (doc["id"], updated), props.get("domain", ""))
+    ratio = days_since / max_days if max_days else 0
+    thresholds = SYSTEM_CONFIG.get("freshness_thresholds", {})
+    if ratio < thresholds.get("FRESH", 0.7):
+        return "FRESH", None
+    if ratio < thresholds.get("WARNING", 1.0):
+        return "WARNING", None
+    return "EXPIRED", None
+
+
+def check_relationship_scope(edge: dict, src_node: dict, tgt_node: dict, rel_types: dict) -> Optional[Issue]:
+    """same_domain 관계의 양 끝 carrier+product가 같은지 (시스템 관계가 아니면 통과)"""
+    edge_type = edge.get("type", "")
+    rel_def = rel_types.get(edge_type)
+    if not rel_def or rel_def.get("scope", "") != "same_domain":
+        return None  # 시스템 관계가 아닌 것 (HAS_CARRIER 등) 또는 cross_domain
+
+    src_cls = src_node.get("properties", {}).get("classification", {})
+    tgt_cls = tgt_node.get("properties", {}).get("classification", {})
+    src_domain = (src_cls.get("carrier", ""), src_cls.get("product", ""))
+    tgt_domain = (tgt_cls.get("carrier", ""), tgt_cls.get("product", ""))
+
+    if src_domain != tgt_domain and src_domain[0] and tgt_domain[0]:
+        return (ERROR, "SCOPE_VIOLATION", "scope 위반: {} {} → {} ({} ≠ {})",
+                (edge_type, edge["source"], edge["target"], src_domain, tgt_domain),
+                src_node.get("properties", {}).get("domain", ""))
+    return None
+
+
+# 규칙별 캐시 의존: 그래프 파일(GRAPH), 샘플 디렉터리(SAMPLES), taxonomy 테이블 이름
+SAMPLES = "samples"
+RULE_DEPENDENCIES = {
+    "verify_taxonomy": ("DOC_TYPES", "DATA_TIERS", "DOC_TYPE_DOMAIN_MAP", "DOMAINS", "SYSTEM_CONFIG",
+                        "BUSINESSES", "CARRIERS", "PRODUCTS", "PRODUCT_CATEGORIES", "PROCESSES", "AUDIENCES"),
+    "verify_graph_integrity": (GRAPH,),
+    "verify_required_fields": (GRAPH,),
+    "verify_lifecycle": (GRAPH, "SYSTEM_CONFIG"),
+    "verify_ssot": (GRAPH, "DOMAINS"),
+    "verify_domain_assignment": (GRAPH, "DOMAINS", "DOC_TYPE_DOMAIN_MAP"),
+    "verify_relationship_scope": (GRAPH, "SYSTEM_CONFIG"),
+    "verify_freshness_and_files": (GRAPH, SAMPLES, "SYSTEM_CONFIG"),  # + 오늘 날짜
+    "verify_acyclic_relations": (GRAPH,),
+    "verify_duplicate_nodes": (GRAPH,),
+    "verify_files_and_regulations": (GRAPH, SAMPLES),
+    "verify_sampled": (GRAPH, "DOMAINS", "DOC_TYPE_DOMAIN_MAP", "SYSTEM_CONFIG"),  # + 오늘 날짜 (신선도)
+}
+DATED_RULES = ("verify_freshness_and_files", "verify_sampled")  # 오늘 날짜 기준 규칙
+DEFAULT_STORE = os.path.join("data", "knowledge-graph.sqlite")  # graph_store.py --db 기본값
 
 
 class FrameworkVerifier:
     """프레임워크 강제 규칙 검증기"""
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, export_path: str = None, sample_size: int = 5,
+                 trace_memory: bool = False, store_path: str = None, ssot_memory_mb: float = None,
+                 endpoint_fp_rate: float = None, endpoint_confirm: bool = False,
+                 approx_per_stratum: int = None, confidence: float = None, seed: int = 0,
+                 cache_path: str = None):
         self.base_path = base_path
         self.graph_path = os.path.join(base_path, "data", "knowledge-graph.json")
+        # 고정 메모리 옵션은 그래프 JSON 전체를 self.nodes/self.edges로 올리지 않도록 저장소에서 흘려 읽는다
+        # (store_path가 없으면 DEFAULT_STORE. 적재할 때만 JSON을 한 번 읽음)
+        if store_path is None and (ssot_memory_mb is not None or endpoint_fp_rate is not None):
+            store_path = os.path.join(base_path, DEFAULT_STORE)
         self.samples_path = os.path.join(base_path, "data", "samples")
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        # 위반은 (rule, code, domain)별 건수 + 표본만 보관, export_path 지정 시 전체를 JSONL로 기록
+        self.violations = ViolationCollector(sample_size=sample_size, export_path=export_path)
+        # 규칙별 wall/CPU/처리량/메모리 → docs/results/verifier-timing.json
+        self.timer = RuleTimer(trace_memory=trace_memory)
+        self.timing_path = os.path.join(base_path, "docs", "results", "verifier-timing.json")
         self.graph_data = None
         self.nodes = []
         self.edges = []
         self.doc_nodes = []
+        self.facet_index: FacetIndex = None
+        self.doc_bitmaps: BitmapIndex = None
+        # store_path 지정 시 SQLite 저장소에서 읽고 SSOT/끝점/라이프사이클/scope 규칙은 SQL로 실행
+        self.store_path = store_path
+        self.store = None  # graph_store.GraphStore
+        # ssot_memory_mb 지정 시 SSOT는 예산 안의 외부 정렬로 검사 (FacetIndex를 만들지 않음)
+        self.ssot_memory_mb = ssot_memory_mb
+        # endpoint_fp_rate 지정 시 엣지 끝점은 Bloom 필터 + 디스크 정렬 ID 파일로 검사
+        self.endpoint_fp_rate = endpoint_fp_rate
+        self.endpoint_confirm = endpoint_confirm
+        # approx_per_stratum 지정 시 근사 모드: 전역 규칙(1, 5, 9, 노드 중복, 파일·규제)은 전수,
+        # 문서/엣지 단위 규칙(2 끝점, 3, 4, 6, 7, 8 신선도)은 층화 표본으로 위반율 추정.
+        # 생략되는 것은 분포 출력뿐 (라이프사이클·도메인·관계 타입별 건수, 신선도 구간 비율)
+        self.approx_per_stratum = approx_per_stratum
+        self.confidence = confidence  # None이면 sampling.DEFAULT_CONFIDENCE
+        self.seed = seed
+        self.approx_path = os.path.join(base_path, "docs", "results", "verifier-approx.json")
+        self.estimates = []
+        # cache_path 지정 시 규칙별 결과를 (그래프 해시, 의존 테이블 지문, 옵션) 키로 재사용
+        self.cache: ResultCache = None
+        self.cached_rules: List[str] = []
+        if cache_path:
+            self.cache = ResultCache(
+                cache_path,
+                files={GRAPH: self.graph_path, SAMPLES: self.samples_path},
+                tables=table_fingerprints(taxonomy),
+                options={"store": bool(store_path), "ssot_memory_mb": ssot_memory_mb,
+                         "endpoint_fp_rate": endpoint_fp_rate, "endpoint_confirm": endpoint_confirm,
+                         "approx": approx_per_stratum, "confidence": confidence, "seed": seed},
+            )
 
     def load_graph(self) -> bool:
         try:
-            with open(self.graph_path, "r", encoding="utf-8") as f:
-                self.graph_data = json.load(f)
+            if self.store_path:
+                from graph_store import GraphStore
+                self.store = GraphStore.open_or_build(self.store_path, self.graph_path)
+                self.nodes = self.store.nodes()
+                self.doc_nodes = self.store.nodes("Document")
+                self.edges = self.store.edges()
+                return True
+            self.graph_data = load_json(self.graph_path)
             self.nodes = self.graph_data.get("graph_data", {}).get("nodes", [])
             self.edges = self.graph_data.get("graph_data", {}).get("edges", [])
             self.doc_nodes = [n for n in self.nodes if "Document" in n.get("labels", [])]
+            if self.ssot_memory_mb is None:
+                self.facet_index = FacetIndex.from_nodes(self.doc_nodes, wildcards=False)
+            if self.approx_per_stratum is None:
+                self.doc_bitmaps = BitmapIndex.from_documents(self.doc_nodes)
             return True
         except Exception as e:
-            self.errors.append(f"그래프 로드 실패: {e}")
+            self.violations.error("load", "LOAD_FAILED", "그래프 로드 실패: {}", e)
             return False
 
     # ──────────────────────────────────────────────────────────
@@ -49,7 +256,7 @@ class FrameworkVerifier:
 
     def verify_taxonomy(self) -> Tuple[int, int]:
         """분류체계 마스터 데이터가 빠짐없이 정의되어 있는지"""
-        print("\n[1/8] 분류체계 완전성 검증...")
+        print("\n[1/9] 분류체계 완전성 검증...")
         passed, failed = 0, 0
 
         # 모든 DOC_TYPE이 DATA_TIERS에 등록
@@ -59,7 +266,7 @@ class FrameworkVerifier:
 
         for doc_type_id in DOC_TYPES.keys():
             if doc_type_id not in all_tier_docs:
-                self.errors.append(f"문서유형 {doc_type_id}: DATA_TIERS에 미등록")
+                self.violations.error("taxonomy", "TIER_UNREGISTERED", "문서유형 {}: DATA_TIERS에 미등록", doc_type_id)
                 failed += 1
             else:
                 passed += 1
@@ -67,7 +274,7 @@ class FrameworkVerifier:
         # 모든 DOC_TYPE이 DOC_TYPE_DOMAIN_MAP에 등록
         for doc_type_id in DOC_TYPES.keys():
             if doc_type_id not in DOC_TYPE_DOMAIN_MAP:
-                self.errors.append(f"문서유형 {doc_type_id}: DOC_TYPE_DOMAIN_MAP에 미등록")
+                self.violations.error("taxonomy", "DOMAIN_MAP_UNREGISTERED", "문서유형 {}: DOC_TYPE_DOMAIN_MAP에 미등록", doc_type_id)
                 failed += 1
             else:
                 passed += 1
@@ -75,7 +282,8 @@ class FrameworkVerifier:
         # DOC_TYPE_DOMAIN_MAP의 도메인이 DOMAINS에 존재
         for doc_type_id, domain_id in DOC_TYPE_DOMAIN_MAP.items():
             if domain_id not in DOMAINS:
-                self.errors.append(f"DOC_TYPE_DOMAIN_MAP[{doc_type_id}] → {domain_id}: DOMAINS에 미등록")
+                self.violations.error("taxonomy", "DOMAIN_UNDEFINED", "DOC_TYPE_DOMAIN_MAP[{}] → {}: DOMAINS에 미등록",
+                                      doc_type_id, domain_id, domain=domain_id)
                 failed += 1
             else:
                 passed += 1
@@ -96,32 +304,30 @@ class FrameworkVerifier:
 
     def verify_graph_integrity(self) -> Tuple[int, int]:
         """노드 중복 없음, 엣지 양 끝이 존재"""
-        print("\n[2/8] 그래프 무결성 검증...")
-        passed, failed = 0, 0
-
-        node_ids = set()
-        for node in self.nodes:
-            node_id = node.get("id")
-            if node_id in node_ids:
-                self.errors.append(f"중복 노드: {node_id}")
-                failed += 1
-            else:
-                node_ids.add(node_id)
-                passed += 1
-
-        for edge in self.edges:
-            src, tgt = edge.get("source"), edge.get("target")
-            if src not in node_ids:
-                self.errors.append(f"엣지 소스 없음: {src}")
-                failed += 1
-            elif tgt not in node_ids:
-                self.errors.append(f"엣지 타겟 없음: {tgt}")
-                failed += 1
-            else:
-                passed += 1
+        print("\n[2/9] 그래프 무결성 검증...")
+
+        if self.endpoint_fp_rate is not None:
+            from endpoint_check import check_endpoints_streaming
+            report = check_endpoints_streaming((node.get("id") for node in self.nodes), self.edges,
+                                               fp_rate=self.endpoint_fp_rate, confirm=self.endpoint_confirm)
+        elif self.store is not None:
+            report = self.store.check_endpoints()
+        else:
+            report = check_endpoints((node.get("id") for node in self.nodes), self.edges)
+        messages = {"duplicate": "중복 노드", "source": "엣지 소스 없음", "target": "엣지 타겟 없음"}
+        codes = {"duplicate": "DUPLICATE_NODE", "source": "MISSING_SOURCE", "target": "MISSING_TARGET"}
+        for kind, value in report.samples:
+            self.violations.error("graph_integrity", codes[kind], messages[kind] + ": {}", value)
+        if report.failed > len(report.samples):
+            by_type = ", ".join(f"{end}/{rel}={n}" for (end, rel), n in sorted(report.missing.items()))
+            self.violations.error("graph_integrity", "TRUNCATED", "그래프 무결성 위반 {}건 (중복 노드 {}, {})",
+                                  report.failed, report.duplicate_nodes, by_type)
+        passed, failed = report.passed, report.failed
 
         print(f"  ✓ 노드: {len(self.nodes)}개 (문서 {len(self.doc_nodes)}개)")
         print(f"  ✓ 엣지: {len(self.edges)}개")
+        if report.fp_rate:
+            print(f"  ✓ 끝점 검사 Bloom 필터: 누락 끝점을 놓쳤을 확률 ≤ {report.fp_rate:.2e}")
 
         return passed, failed
 
@@ -131,41 +337,15 @@ class FrameworkVerifier:
 
     def verify_required_fields(self) -> Tuple[int, int]:
         """모든 문서에 시스템 필수 필드가 존재하는지 (프레임워크 강제)"""
-        print("\n[3/8] 프레임워크 필수 필드 검증...")
+        print("\n[3/9] 프레임워크 필수 필드 검증...")
         passed, failed = 0, 0
 
-        required_system = ["domain", "lifecycle", "version"]
-        required_dates = ["createdAt", "updatedAt"]
-
         for doc in self.doc_nodes:
-            props = doc.get("properties", {})
-            doc_id = doc.get("id", "?")
-
-            # 시스템 필드
-            for field in required_system:
-                if field not in props or props[field] is None:
-                    self.errors.append(f"{doc_id}: 필수 필드 누락 '{field}'")
-                    failed += 1
-                else:
-                    passed += 1
+            p, issues = check_required_fields(doc)
+            passed += p
+            failed += self._report("required_fields", issues)
 
-            # 날짜 필드
-            for field in required_dates:
-                if field not in props or not props[field]:
-                    self.errors.append(f"{doc_id}: 필수 날짜 누락 '{field}'")
-                    failed += 1
-                else:
-                    passed += 1
-
-            # classification 객체 존재
-            cls = props.get("classification", {})
-            if not cls or "docType" not in cls:
-                self.errors.append(f"{doc_id}: classification.docType 누락")
-                failed += 1
-            else:
-                passed += 1
-
-        print(f"  ✓ {len(self.doc_nodes)}개 문서 × {len(required_system) + len(required_dates) + 1}개 필드 검증")
+        print(f"  ✓ {len(self.doc_nodes)}개 문서 × {len(REQUIRED_SYSTEM_FIELDS) + len(REQUIRED_DATE_FIELDS) + 1}개 필드 검증")
 
         return passed, failed
 
@@ -175,21 +355,31 @@ class FrameworkVerifier:
 
     def verify_lifecycle(self) -> Tuple[int, int]:
         """라이프사이클 값이 허용된 상태 중 하나인지"""
-        print("\n[4/8] 라이프사이클 상태 검증...")
+        print("\n[4/9] 라이프사이클 상태 검증...")
         passed, failed = 0, 0
 
         valid_states = set(SYSTEM_CONFIG["lifecycle_states"])
-        state_count = {}
-
-        for doc in self.doc_nodes:
-            lc = doc.get("properties", {}).get("lifecycle", "")
-            state_count[lc] = state_count.get(lc, 0) + 1
-
-            if lc not in valid_states:
-                self.errors.append(f"{doc['id']}: 잘못된 라이프사이클 '{lc}'")
+        if self.store is not None:
+            # (domain, lifecycle) 색인만 읽는 집계
+            state_count = self.store.lifecycle_counts()
+            for doc_id, lifecycle, domain in self.store.invalid_lifecycle(valid_states):
+                self.violations.error("lifecycle", "INVALID_STATE", "{}: 잘못된 라이프사이클 '{}'",
+                                      doc_id, lifecycle, domain=domain)
                 failed += 1
-            else:
-                passed += 1
+            passed += sum(state_count.values()) - failed
+        else:
+            bitmaps = self.doc_bitmaps if self.doc_bitmaps is not None else BitmapIndex.from_documents(self.doc_nodes)
+            state_count = bitmaps.value_counts("lifecycle")
+
+            # 허용 상태 비트맵의 여집합 = 위반 문서 (위반 문서만 순회)
+            invalid = ~bitmaps.any_of("lifecycle", valid_states)
+            for row in invalid.rows():
+                doc = self.doc_nodes[row]
+                props = doc.get("properties", {})
+                self.violations.error("lifecycle", "INVALID_STATE", "{}: 잘못된 라이프사이클 '{}'",
+                                      doc["id"], props.get("lifecycle", ""), domain=props.get("domain", ""))
+            failed += invalid.count()
+            passed += len(bitmaps) - failed
 
         for state, count in sorted(state_count.items(), key=lambda x: -x[1]):
             pct = count / len(self.doc_nodes) * 100 if self.doc_nodes else 0
@@ -203,44 +393,31 @@ class FrameworkVerifier:
 
     def verify_ssot(self) -> Tuple[int, int]:
         """같은 분류 경로에 ACTIVE 문서가 2개 이상이면 SSOT 위반"""
-        print("\n[5/8] SSOT 유니크 제약 검증...")
+        print("\n[5/9] SSOT 유니크 제약 검증...")
         passed, failed = 0, 0
 
-        # 도메인별 SSOT 키 구성
-        active_paths = {}  # {(domain, key_tuple): [doc_ids]}
-
-        for doc in self.doc_nodes:
-            props = doc.get("properties", {})
-            lifecycle = props.get("lifecycle", "")
-            if lifecycle != "ACTIVE":
-                continue
-
-            domain_id = props.get("domain", "")
-            domain_def = DOMAINS.get(domain_id)
-            if not domain_def:
-                continue
-
-            cls = props.get("classification", {})
-            ssot_key = domain_def.get("ssotKey", [])
-
-            # SSOT 키로 경로 생성
-            key_values = tuple(cls.get(k, "") for k in ssot_key)
-            path = (domain_id, key_values)
-
-            if path not in active_paths:
-                active_paths[path] = []
-            active_paths[path].append(doc.get("id"))
+        if self.ssot_memory_mb is not None:
+            # (domain, key, doc_id) 정렬 run을 k-way 병합 (메모리 = 예산 + 위반 경로)
+            from ssot_external import scan_ssot
+            scan = scan_ssot(self.doc_nodes, memory_mb=self.ssot_memory_mb)
+            conflicts, active_path_count = scan.conflicts, scan.active_path_count
+        elif self.store is not None:
+            # ACTIVE 부분 색인 (domain, k1, k2, k3) 위의 GROUP BY
+            conflicts, active_path_count = self.store.ssot_conflicts(), self.store.ssot_active_path_count()
+        else:
+            # 도메인별 SSOT 키 색인 (load_graph에서 한 번 구성, 위반 경로는 색인이 추적)
+            index = self.facet_index if self.facet_index is not None else FacetIndex.from_nodes(self.doc_nodes, wildcards=False)
+            conflicts, active_path_count = index.conflicts(), index.active_path_count
 
         violations = 0
-        for path, doc_ids in active_paths.items():
-            if len(doc_ids) > 1:
-                self.errors.append(f"SSOT 위반: {path[0]} {path[1]} → ACTIVE {len(doc_ids)}건: {doc_ids[:3]}")
-                violations += 1
-                failed += len(doc_ids)
-            else:
-                passed += 1
-
-        print(f"  ✓ ACTIVE 유니크 경로: {len(active_paths)}개")
+        for path, doc_ids in conflicts.items():
+            self.violations.error("ssot", "SSOT_CONFLICT", "SSOT 위반: {} {} → ACTIVE {}건: {}",
+                                  path[0], path[1], len(doc_ids), doc_ids[:3], domain=path[0])
+            violations += 1
+            failed += len(doc_ids)
+        passed += active_path_count - violations
+
+        print(f"  ✓ ACTIVE 유니크 경로: {active_path_count}개")
         if violations:
             print(f"  ✗ SSOT 위반: {violations}건")
         else:
@@ -254,42 +431,13 @@ class FrameworkVerifier:
 
     def verify_domain_assignment(self) -> Tuple[int, int]:
         """문서의 domain이 DOMAINS에 존재하고, docType과 매칭되는지"""
-        print("\n[6/8] 도메인 귀속 검증...")
+        print("\n[6/9] 도메인 귀속 검증...")
         passed, failed = 0, 0
 
         for doc in self.doc_nodes:
-            props = doc.get("properties", {})
-            doc_id = doc.get("id", "?")
-            domain = props.get("domain", "")
-            cls = props.get("classification", {})
-            doc_type = cls.get("docType", "")
-
-            # domain이 DOMAINS에 존재
-            if domain not in DOMAINS:
-                self.errors.append(f"{doc_id}: 잘못된 도메인 '{domain}'")
-                failed += 1
-                continue
-
-            # docType의 기본 도메인과 일치 확인
-            expected_domain = DOC_TYPE_DOMAIN_MAP.get(doc_type, "")
-            if expected_domain and domain != expected_domain:
-                self.warnings.append(f"{doc_id}: 도메인 불일치 (실제: {domain}, 기대: {expected_domain})")
-
-            # 도메인의 필수 facet이 classification에 존재
-            domain_def = DOMAINS[domain]
-            allowed_facets = {f["id"] for f in domain_def.get("facets", [])}
-            for facet in domain_def.get("facets", []):
-                if facet.get("required") and not cls.get(facet["id"]):
-                    self.errors.append(f"{doc_id}: 도메인 {domain}의 필수 facet '{facet['id']}' 누락")
-                    failed += 1
-                else:
-                    passed += 1
-
-            # classification에 도메인 facets에 없는 필드가 있으면 오류
-            for field in cls:
-                if field not in allowed_facets:
-                    self.errors.append(f"{doc_id}: 도메인 {domain}에 정의되지 않은 classification 필드 '{field}'")
-                    failed += 1
+            p, issues = check_domain_assignment(doc)
+            passed += p
+            failed += self._report("domain_assignment", issues)
 
         domain_dist = {}
         for doc in self.doc_nodes:
@@ -307,42 +455,21 @@ class FrameworkVerifier:
 
     def verify_relationship_scope(self) -> Tuple[int, int]:
         """same_domain 관계가 실제로 같은 도메인 내에서만 연결되는지"""
-        print("\n[7/8] 관계 scope 규칙 검증...")
+        print("\n[7/9] 관계 scope 규칙 검증...")
         passed, failed = 0, 0
 
         rel_types = SYSTEM_CONFIG.get("relationship_types", {})
+        if self.store is not None:
+            return self._verify_relationship_scope_sql(rel_types)
         node_map = {n["id"]: n for n in self.nodes}
 
         for edge in self.edges:
-            edge_type = edge.get("type", "")
-            rel_def = rel_types.get(edge_type)
-            if not rel_def:
-                passed += 1  # 시스템 관계가 아닌 것 (HAS_CARRIER 등)
-                continue
-
-            scope = rel_def.get("scope", "")
-            if scope != "same_domain":
+            issue = check_relationship_scope(edge, node_map.get(edge["source"], {}),
+                                             node_map.get(edge["target"], {}), rel_types)
+            if issue is None:
                 passed += 1
-                continue
-
-            # same_domain 규칙: 양 끝의 carrier+product가 같아야 함
-            src_node = node_map.get(edge["source"], {})
-            tgt_node = node_map.get(edge["target"], {})
-
-            src_cls = src_node.get("properties", {}).get("classification", {})
-            tgt_cls = tgt_node.get("properties", {}).get("classification", {})
-
-            src_domain = (src_cls.get("carrier", ""), src_cls.get("product", ""))
-            tgt_domain = (tgt_cls.get("carrier", ""), tgt_cls.get("product", ""))
-
-            if src_domain != tgt_domain and src_domain[0] and tgt_domain[0]:
-                self.errors.append(
-                    f"scope 위반: {edge_type} {edge['source']} → {edge['target']} "
-                    f"({src_domain} ≠ {tgt_domain})"
-                )
-                failed += 1
             else:
-                passed += 1
+                failed += self._report("relationship_scope", [issue])
 
         # 관계 유형별 통계
         edge_types = {}
@@ -355,54 +482,68 @@ class FrameworkVerifier:
 
         return passed, failed
 
+    def _report(self, rule: str, issues: List[Issue]) -> int:
+        """검사 함수가 돌려준 위반을 수집기에 기록하고 오류 건수 반환"""
+        errors = 0
+        for level, code, template, args, domain in issues:
+            self.violations.add(level, rule, code, template, args, domain)
+            errors += level == ERROR
+        return errors
+
+    def _verify_relationship_scope_sql(self, rel_types: dict) -> Tuple[int, int]:
+        """저장소 경로: same_domain 관계 엣지를 (type, source) 색인으로 골라 양 끝 문서와 조인"""
+        same_domain = [t for t, rel_def in rel_types.items() if rel_def.get("scope", "") == "same_domain"]
+        failed = 0
+        for edge_type, source, target, src_domain, tgt_domain, domain in self.store.scope_violations(same_domain):
+            self.violations.error(
+                "relationship_scope", "SCOPE_VIOLATION", "scope 위반: {} {} → {} ({} ≠ {})",
+                edge_type, source, target, src_domain, tgt_domain, domain=domain,
+            )
+            failed += 1
+
+        edge_types = self.store.edge_type_counts()
+        for t, c in sorted(edge_types.items(), key=lambda x: -x[1])[:10]:
+            print(f"  ✓ {t}: {c}건")
+
+        return sum(edge_types.values()) - failed, failed
+
     # ──────────────────────────────────────────────────────────
     # 8. 신선도 / 파일 / 규제
     # ──────────────────────────────────────────────────────────
 
     def verify_freshness_and_files(self) -> Tuple[int, int]:
         """신선도 계산 가능 여부 + 샘플 파일 + 규제 노드"""
-        print("\n[8/8] 신선도 · 파일 · 규제 검증...")
+        print("\n[8/9] 신선도 · 파일 · 규제 검증...")
         passed, failed = 0, 0
 
         # 신선도: ACTIVE 문서 중 EXPIRED 비율
         today = datetime.now()
-        fresh_count, warning_count, expired_count = 0, 0, 0
-        thresholds = SYSTEM_CONFIG.get("freshness_thresholds", {})
-
+        states = {"FRESH": 0, "WARNING": 0, "EXPIRED": 0}
         for doc in self.doc_nodes:
-            props = doc.get("properties", {})
-            if props.get("lifecycle") != "ACTIVE":
-                continue
-
-            updated = props.get("updatedAt") or props.get("createdAt")
-            tier = props.get("tier", "WARM")
-            max_days = SYSTEM_CONFIG["freshness_defaults"].get(tier, 90)
-
-            if not updated:
-                continue
-
-            try:
-                updated_dt = datetime.fromisoformat(updated)
-                days_since = (today - updated_dt).days
-                ratio = days_since / max_days if max_days else 0
-
-                if ratio < thresholds.get("FRESH", 0.7):
-                    fresh_count += 1
-                elif ratio < thresholds.get("WARNING", 1.0):
-                    warning_count += 1
-                else:
-                    expired_count += 1
+            state, issue = check_freshness(doc, today)
+            if state is not None:
+                states[state] += 1
                 passed += 1
-            except Exception:
-                self.warnings.append(f"{doc['id']}: 날짜 파싱 실패 ({updated})")
+            elif issue is not None:
+                self._report("freshness", [issue])
 
-        total_active = fresh_count + warning_count + expired_count
+        total_active = sum(states.values())
         if total_active:
             print(f"  ✓ ACTIVE 문서 신선도:")
-            print(f"    FRESH: {fresh_count}건 ({fresh_count/total_active*100:.1f}%)")
-            print(f"    WARNING: {warning_count}건 ({warning_count/total_active*100:.1f}%)")
-            print(f"    EXPIRED: {expired_count}건 ({expired_count/total_active*100:.1f}%)")
+            for state, count in states.items():
+                print(f"    {state}: {count}건 ({count/total_active*100:.1f}%)")
 
+        passed += self._files_and_regulations()
+        return passed, failed
+
+    def verify_files_and_regulations(self) -> Tuple[int, int]:
+        """근사 모드의 8번: 샘플 파일 + 규제 노드만 전수 (신선도는 verify_sampled에서 표본 추정)"""
+        print("\n[8/9] 파일 · 규제 검증 (신선도는 표본 추정)...")
+        return self._files_and_regulations(), 0
+
+    def _files_and_regulations(self) -> int:
+        """샘플 파일 수 + 규제 노드 출력 → 통과 수"""
+        passed = 0
         # 샘플 파일
         file_count = 0
         if os.path.exists(self.samples_path):
@@ -418,6 +559,122 @@ class FrameworkVerifier:
             props = reg.get("properties", {})
             print(f"    - {props.get('date', 'N/A')}: {props.get('name', 'N/A')} ({props.get('status', 'N/A')})")
             passed += 1
+        return passed
+
+    # ──────────────────────────────────────────────────────────
+    # 9. 계층/버전 관계 순환
+    # ──────────────────────────────────────────────────────────
+
+    def verify_acyclic_relations(self) -> Tuple[int, int]:
+        """PARENT_OF/CHILD_OF, SUPERSEDES 관계에 순환이 없는지 (DB 트리거 check_circular_reference 사전 검사)"""
+        print("\n[9/9] 계층 · 버전 관계 순환 검증...")
+        passed, failed = 0, 0
+
+        names = {"hierarchy": "계층(PARENT_OF/CHILD_OF)", "version": "버전(SUPERSEDES)"}
+        for report in check_cycles(self.edges):
+            for i in range(report.failed):
+                path = report.cycle_path(i)
+                self.violations.error(
+                    "acyclic_relations", f"{report.family.upper()}_CYCLE", "{} 순환 ({}개 노드): {}",
+                    names[report.family], len(report.cycles[i]), " → ".join(path[:8]) + (" → …" if len(path) > 8 else ""),
+                )
+            passed += report.passed
+            failed += report.failed
+            print(f"  ✓ {names[report.family]}: 노드 {report.nodes}개, 엣지 {report.edges}개, 순환 {report.failed}건")
+
+        return passed, failed
+
+    # ──────────────────────────────────────────────────────────
+    # 근사 모드: 노드 중복 (전수) + 층화 표본
+    # ──────────────────────────────────────────────────────────
+
+    def verify_duplicate_nodes(self) -> Tuple[int, int]:
+        """근사 모드의 2번 중 노드 중복: 표본으로는 찾을 수 없으므로 ID 집합 한 번으로 전수"""
+        print("\n[2/9] 노드 중복 검증 (전수, 엣지 끝점은 표본 추정)...")
+        if self.store is not None:
+            duplicates = dict(self.store.duplicate_nodes())
+        else:
+            seen, duplicates = set(), {}
+            for node in self.nodes:
+                node_id = node.get("id")
+                if node_id in seen:
+                    duplicates[node_id] = duplicates.get(node_id, 0) + 1
+                else:
+                    seen.add(node_id)
+        failed = sum(duplicates.values())
+        for node_id, extra in duplicates.items():
+            for _ in range(extra):
+                self.violations.error("graph_integrity", "DUPLICATE_NODE", "중복 노드: {}", node_id)
+        print(f"  ✓ 노드: {len(self.nodes)}개, 중복 {failed}건")
+        return len(self.nodes) - failed, failed
+
+    def verify_sampled(self) -> Tuple[int, int]:
+        """문서는 (domain, tier), 엣지는 관계 타입으로 층을 나눠 뽑은 표본에 문서/엣지 단위 규칙 적용"""
+        from sampling import DEFAULT_CONFIDENCE, RateTally, StratifiedSample
+        if self.confidence is None:
+            self.confidence = DEFAULT_CONFIDENCE
+        print(f"\n[표본] 문서 · 엣지 층화 표본 검증 (층별 최대 {self.approx_per_stratum}건, "
+              f"신뢰수준 {self.confidence:.0%})...")
+        valid_states = set(SYSTEM_CONFIG["lifecycle_states"])
+        rel_types = SYSTEM_CONFIG.get("relationship_types", {})
+        today = datetime.now()
+
+        docs = StratifiedSample(self.approx_per_stratum, self.seed)
+        for doc in self.doc_nodes:
+            props = doc.get("properties", {})
+            docs.add((props.get("domain", ""), props.get("tier", "")), doc)
+        edges = StratifiedSample(self.approx_per_stratum, self.seed + 1)
+        for edge in self.edges:
+            edges.add(edge.get("type", ""), edge)
+
+        tally = RateTally(docs)
+        passed, failed = 0, 0
+        for stratum, doc in docs.items():
+            for rule, (_, issues) in (
+                ("required_fields", check_required_fields(doc)),
+                ("lifecycle", (0, [i for i in [check_lifecycle(doc, valid_states)] if i])),
+                ("domain_assignment", check_domain_assignment(doc)),
+            ):
+                errors = self._report(rule, issues)
+                tally.record(rule, stratum, errors > 0)
+                failed += errors > 0
+                passed += errors == 0
+            # 신선도: 날짜를 읽을 수 없는 ACTIVE 문서 비율 (경고라 실패에는 넣지 않음)
+            state, issue = check_freshness(doc, today)
+            self._report("freshness", [issue] if issue else [])
+            tally.record("freshness", stratum, issue is not None)
+            passed += state is not None
+
+        # 표본 엣지의 끝점만 조회 (전체 노드 맵을 만들지 않음)
+        wanted = {e[key] for _, e in edges.items() for key in ("source", "target") if e.get(key) is not None}
+        if self.store is not None:
+            endpoints = self.store.fetch_nodes(wanted)
+        else:
+            endpoints = {n["id"]: n for n in self.nodes if n.get("id") in wanted}
+
+        edge_tally = RateTally(edges)
+        for stratum, edge in edges.items():
+            missing = [end for end in ("source", "target") if edge.get(end) not in endpoints][:1]
+            for end in missing:
+                self.violations.error("graph_integrity", f"MISSING_{end.upper()}",
+                                      ("엣지 소스 없음" if end == "source" else "엣지 타겟 없음") + ": {}", edge.get(end))
+            issue = check_relationship_scope(edge, endpoints.get(edge.get("source"), {}),
+                                             endpoints.get(edge.get("target"), {}), rel_types)
+            scope_errors = self._report("relationship_scope", [issue] if issue else [])
+            for rule, violated in (("graph_integrity", bool(missing)), ("relationship_scope", scope_errors > 0)):
+                edge_tally.record(rule, stratum, violated)
+                failed += violated
+                passed += not violated
+
+        self.estimates = tally.estimates(self.confidence) + edge_tally.estimates(self.confidence)
+        print(f"  ✓ 문서 표본: {docs.total_sampled:,}/{docs.total_population:,}건 ({len(docs.strata())}개 층)")
+        print(f"  ✓ 엣지 표본: {edges.total_sampled:,}/{edges.total_population:,}건 ({len(edges.strata())}개 층)")
+        # 한글 헤더는 글자당 2칸
+        print(f"  {'규칙':<18} {'표본':>6} {'위반':>4} {'위반율':>7}  {self.confidence:.0%} 구간")
+        for est in self.estimates:
+            low, point, high = est.estimated_violations
+            print(f"  {est.rule:<20} {est.sampled:>8,} {est.violations:>6,} {est.rate:>10.3%}  "
+                  f"[{est.low:.3%}, {est.high:.3%}] ≈ {point:,}건 ({low:,} ~ {high:,})")
 
         return passed, failed
 
@@ -430,55 +687,188 @@ class FrameworkVerifier:
         print("KMS v3.0 프레임워크 검증")
         print("=" * 60)
 
-        if not self.load_graph():
-            print("\n❌ 그래프 로드 실패")
-            return False
+        if self.approx_per_stratum is not None:
+            rules = [
+                self.verify_taxonomy,               # 1. 분류체계 완전성
+                self.verify_duplicate_nodes,        # 2. 노드 중복 (전수)
+                self.verify_ssot,                   # 5. SSOT 유니크 제약 (경로 단위 전역 규칙)
+                self.verify_files_and_regulations,  # 8. 샘플 파일 + 규제 (전수)
+                self.verify_acyclic_relations,      # 9. 계층/버전 관계 순환 (전역 구조)
+                self.verify_sampled,                # 2 끝점·3·4·6·7·8 신선도 → 표본 추정
+            ]
+        else:
+            rules = [
+                self.verify_taxonomy,           # 1. 분류체계 완전성
+                self.verify_graph_integrity,     # 2. 노드/엣지 무결성
+                self.verify_required_fields,     # 3. 프레임워크 필수 필드
+                self.verify_lifecycle,           # 4. 라이프사이클 상태
+                self.verify_ssot,               # 5. SSOT 유니크 제약
+                self.verify_domain_assignment,   # 6. 도메인 귀속
+                self.verify_relationship_scope,  # 7. 관계 scope 규칙
+                self.verify_freshness_and_files, # 8. 신선도 + 파일 + 규제
+                self.verify_acyclic_relations,   # 9. 계층/버전 관계 순환
+            ]
+
+        # 캐시에 없는 규칙 중 그래프를 읽는 것이 있을 때만 로드 (모두 캐시에 있으면 파일 해시만 확인)
+        counts = self.cache.get("load_graph", (GRAPH,)) if self.cache is not None else None
+        if counts is None or any(GRAPH in RULE_DEPENDENCIES[func.__name__]
+                                 and not self.cache.has(func.__name__, *self._cache_key(func.__name__))
+                                 for func in rules):
+            with self.timer.rule("load_graph") as probe:
+                loaded = self.load_graph()
+                probe.items = len(self.nodes) + len(self.edges)
+            if not loaded:
+                print("\n❌ 그래프 로드 실패")
+                self.timer.close()
+                self.violations.close()
+                return False
+            counts = len(self.nodes), len(self.edges)
+            if self.cache is not None:
+                self.cache.put("load_graph", (GRAPH,), counts)
+        nodes, edges = counts
 
         total_passed, total_failed = 0, 0
-
-        for verify_func in [
-            self.verify_taxonomy,           # 1. 분류체계 완전성
-            self.verify_graph_integrity,     # 2. 노드/엣지 무결성
-            self.verify_required_fields,     # 3. 프레임워크 필수 필드
-            self.verify_lifecycle,           # 4. 라이프사이클 상태
-            self.verify_ssot,               # 5. SSOT 유니크 제약
-            self.verify_domain_assignment,   # 6. 도메인 귀속
-            self.verify_relationship_scope,  # 7. 관계 scope 규칙
-            self.verify_freshness_and_files, # 8. 신선도 + 파일 + 규제
-        ]:
-            p, f = verify_func()
+        for verify_func in rules:
+            with self.timer.rule(verify_func.__name__) as probe:
+                p, f = self._run_rule(verify_func)
+                probe.items = p + f
+                probe.cached = verify_func.__name__ in self.cached_rules
             total_passed += p
             total_failed += f
+        self.timer.close()
+        if self.store is not None:
+            self.store.close()
 
         print("\n" + "=" * 60)
         print("검증 결과")
         print("=" * 60)
         print(f"\n  통과: {total_passed:,}")
         print(f"  실패: {total_failed}")
-        print(f"  경고: {len(self.warnings)}")
-
-        if self.errors:
-            print(f"\n  오류 ({len(self.errors)}개):")
-            for err in self.errors[:10]:
+        print(f"  경고: {self.violations.count('warning')}")
+
+        error_count = self.violations.count("error")
+        if error_count:
+            limit = 10
+            buckets = list(self.violations.buckets("error").items())
+            print(f"\n  오류 ({error_count}개):")
+            for (rule, code, domain), count in buckets[:limit]:
+                print(f"    [{rule}/{code}{'/' + domain if domain else ''}] {count}건")
+            if len(buckets) > limit:
+                print(f"    … 외 {len(buckets) - limit:,}개")
+            print(f"\n  오류 예시:")
+            shown = 0
+            for err in self.violations.messages("error", limit=limit):
                 print(f"    - {err}")
-            if len(self.errors) > 10:
-                print(f"    ... 외 {len(self.errors) - 10}건")
+                shown += 1
+            if error_count > shown:
+                print(f"    … 외 {error_count - shown:,}개")
+
+        self.violations.close()
+        if self.violations.export_path:
+            print(f"\n  전체 위반 목록: {self.violations.export_path}")
+
+        print(f"\n  규칙별 소요시간:")
+        self.timer.print_table()
+        self.timer.export(self.timing_path, tool="verifier", nodes=nodes, edges=edges,
+                          passed=total_passed, failed=total_failed)
+        print(f"  저장: {self.timing_path}")
+        if self.cache is not None:
+            self.cache.save()
+            print(f"  결과 캐시: 규칙 {len(self.cached_rules)}/{len(rules)}개 재사용 ({self.cache.path})")
+        if self.approx_per_stratum is not None:
+            self._export_estimates(nodes, edges)
+            print(f"  표본 추정 저장: {self.approx_path}")
 
         print("\n" + "=" * 60)
+        approx = " (표본 근사 검증)" if self.approx_per_stratum is not None else ""
         if total_failed == 0:
-            print("✅ 프레임워크 검증 통과!")
+            print(f"✅ 프레임워크 검증 통과!{approx}")
         else:
-            print(f"❌ 프레임워크 위반 {total_failed}건")
+            print(f"❌ 프레임워크 위반 {total_failed}건{approx}")
         print("=" * 60)
 
         return total_failed == 0
 
+    def _cache_key(self, name: str) -> Tuple[tuple, tuple]:
+        """규칙의 캐시 의존 + 추가 키 (신선도는 오늘 날짜 기준이라 날짜가 바뀌면 다시 계산)"""
+        extra = (datetime.now().date().isoformat(),) if name in DATED_RULES else ()
+        return RULE_DEPENDENCIES[name], extra
+
+    def _run_rule(self, verify_func) -> Tuple[int, int]:
+        """캐시에 같은 입력의 결과가 있으면 출력·위반을 재생, 없으면 실행하며 기록"""
+        if self.cache is None:
+            return verify_func()
+        name = verify_func.__name__
+        deps, extra = self._cache_key(name)
+        hit = self.cache.get(name, deps, extra)
+        if hit is not None:
+            self.cached_rules.append(name)
+            self.estimates = hit.state.get("estimates", self.estimates)
+            return hit.replay(self.violations)
+        with self.cache.record(self.violations) as rec:
+            p, f = verify_func()
+        state = {"estimates": self.estimates} if name == "verify_sampled" else {}
+        self.cache.put(name, deps, rec.entry(p, f, **state), extra)
+        return p, f
+
+    def _export_estimates(self, nodes: int, edges: int) -> str:
+        os.makedirs(os.path.dirname(self.approx_path), exist_ok=True)
+        return dump_json({
+            "timestamp": datetime.now().isoformat(),
+            "nodes": nodes,
+            "edges": edges,
+            "per_stratum": self.approx_per_stratum,
+            "confidence": self.confidence,
+            "seed": self.seed,
+            "rules": [
+                {
+                    "rule": e.rule, "population": e.population, "sampled": e.sampled, "violations": e.violations,
+                    "rate": round(e.rate, 6), "low": round(e.low, 6), "high": round(e.high, 6),
+                    "estimated_violations": e.estimated_violations,
+                }
+                for e in self.estimates
+            ],
+        }, self.approx_path, pretty=True)
+
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="KMS v3.0 프레임워크 검증")
+    parser.add_argument("--export-violations", metavar="PATH",
+                        help="전체 위반 목록을 JSONL로 기록 (지정하지 않으면 버킷별 건수 + 표본만 보관)")
+    parser.add_argument("--samples", type=int, default=5, help="(rule, code, domain)별 보관할 예시 수")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="규칙별 최대 메모리 증가량도 계측 (tracemalloc, 실행이 몇 배 느려짐)")
+    parser.add_argument("--store", metavar="PATH",
+                        help="SQLite 그래프 저장소에서 검증 (없거나 그래프보다 오래되면 새로 적재, graph_store.py)")
+    parser.add_argument("--ssot-memory-mb", type=float, metavar="MB",
+                        help="SSOT 검증을 이 메모리 예산 안의 외부 정렬로 실행 (ssot_external.py). "
+                             f"그래프는 저장소에서 흘려 읽음: --store가 없으면 {DEFAULT_STORE}")
+    parser.add_argument("--endpoint-fp-rate", type=float, metavar="P",
+                        help="엣지 끝점을 오탐률 P의 Bloom 필터 + 디스크 정렬 ID 파일로 검사 (고정 메모리). "
+                             f"그래프는 저장소에서 흘려 읽음: --store가 없으면 {DEFAULT_STORE}")
+    parser.add_argument("--endpoint-confirm", action="store_true",
+                        help="--endpoint-fp-rate 와 함께: Bloom 통과 끝점도 ID 파일에서 확인 (정확, 느림, 저장소 사용)")
+    parser.add_argument("--approx", type=int, metavar="N",
+                        help="근사 모드: 문서 (domain, tier)·엣지 타입 층별 최대 N건 표본으로 위반율과 신뢰구간 추정")
+    parser.add_argument("--confidence", type=float, help="--approx 신뢰수준 (기본 0.95)")
+    parser.add_argument("--seed", type=int, default=0, help="--approx 표본 추출 시드")
+    parser.add_argument("--cache", action="store_true",
+                        help="규칙 결과 캐시(data/.cache/verifier.pkl, pickle)를 읽고 씀. 믿을 수 있는 data 디렉터리에서만 사용")
+    args = parser.parse_args()
+
     base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    verifier = FrameworkVerifier(base_path)
+    cache_path = None if not args.cache else os.path.join(base_path, "data", ".cache", "verifier.pkl")
+    verifier = FrameworkVerifier(base_path, export_path=args.export_violations, sample_size=args.samples,
+                                 trace_memory=args.trace_memory, store_path=args.store,
+                                 ssot_memory_mb=args.ssot_memory_mb, endpoint_fp_rate=args.endpoint_fp_rate,
+                                 endpoint_confirm=args.endpoint_confirm, approx_per_stratum=args.approx,
+                                 confidence=args.confidence, seed=args.seed, cache_path=cache_path)
     return 0 if verifier.run_all() else 1
 
 
 if __name__ == "__main__":
-    exit(main())
+    with profiled("verifier"):
+        status = main()
+    exit(status)
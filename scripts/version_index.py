@@ -0,0 +1,140 @@
+"""
+버전 체인 인덱스 (SUPERSEDES)
+
+simulator가 만드는 SUPERSEDES 엣지(신규 → 기존)를 체인으로 묶어
+문서마다 체인 root(최초 버전), 최신 후속 버전, 전체 계보를 미리 계산해 둔다.
+
+    idx = VersionIndex.from_graph_data(graph_data)
+    idx.latest("DOC-TERMS-INS-SAMSUNG-PRD-LIFE-WHOLE-001")
+    # → "DOC-TERMS-INS-SAMSUNG-PRD-LIFE-WHOLE-R2602-001"
+
+- latest()/root() : O(1)  (문서 → 소속 체인 → 처음/마지막)
+- lineage()       : 체인 길이에 비례 (최초 → 최신 순)
+- add()           : SUPERSEDES 엣지 1건 증분 반영 (두 체인을 잇고 짧은 쪽 노드만 소속을 바꿈
+                    → 엣지가 어떤 순서로 와도 전체 O(n log n))
+
+체인은 선형을 가정한다. 한 버전을 두 문서가 대체(분기)하거나
+한 문서가 두 버전을 대체(병합)하거나 순환이 생기는 엣지는 반영하지 않고 anomalies에 남긴다.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+SUPERSEDES = "SUPERSEDES"
+
+
+class VersionIndex:
+    """SUPERSEDES 체인 → root / latest / lineage"""
+
+    def __init__(self):
+        self._successor: Dict[str, str] = {}       # 기존 → 신규 (직접)
+        self._predecessor: Dict[str, str] = {}     # 신규 → 기존 (직접)
+        self._chain_of: Dict[str, str] = {}        # 체인 소속 노드 → 체인 대표 (합칠 때 긴 쪽 대표 유지)
+        self._chains: Dict[str, Deque[str]] = {}   # 대표 → [최초, ..., 최신]
+        self.anomalies: List[Tuple[str, str, str]] = []  # (신규, 기존, 사유)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[dict]) -> "VersionIndex":
+        index = cls()
+        for e in edges:
+            if e.get("type") == SUPERSEDES:
+                index.add(e["source"], e["target"])
+        return index
+
+    @classmethod
+    def from_graph_data(cls, graph_data: dict) -> "VersionIndex":
+        """simulator.generate_graph_data() 결과(또는 knowledge-graph.json)로 생성"""
+        return cls.from_edges(graph_data.get("graph_data", {}).get("edges", []))
+
+    # ── 갱신 ──
+
+    def add(self, new_id: str, old_id: str) -> bool:
+        """new_id SUPERSEDES old_id 반영. 선형 체인을 깨는 엣지는 anomalies에 기록하고 False"""
+        if self._successor.get(old_id) == new_id:
+            return True
+        if old_id in self._successor:
+            self.anomalies.append((new_id, old_id, "branch"))
+            return False
+        if new_id in self._predecessor:
+            self.anomalies.append((new_id, old_id, "merge"))
+            return False
+        rep = self._chain_of.get(old_id)
+        if new_id == old_id or (rep is not None and rep == self._chain_of.get(new_id)):  # new_id가 old_id 체인의 root
+            self.anomalies.append((new_id, old_id, "cycle"))
+            return False
+        old_rep, new_rep = self._chain(old_id), self._chain(new_id)
+
+        # old_id는 후속이 없으므로 자기 체인의 최신, new_id는 선행이 없으므로 자기 체인의 root
+        head, tail = self._chains[old_rep], self._chains[new_rep]
+        if len(head) >= len(tail):
+            head.extend(tail)
+            keep, drop, moved = old_rep, new_rep, tail
+        else:
+            tail.extendleft(reversed(head))
+            keep, drop, moved = new_rep, old_rep, head
+        del self._chains[drop]
+        for node in moved:
+            self._chain_of[node] = keep
+
+        self._successor[old_id] = new_id
+        self._predecessor[new_id] = old_id
+        return True
+
+    def _chain(self, doc_id: str) -> str:
+        """doc_id가 속한 체인의 대표 (없으면 길이 1 체인을 만듦)"""
+        rep = self._chain_of.get(doc_id)
+        if rep is None:
+            rep = self._chain_of[doc_id] = doc_id
+            self._chains[rep] = deque((doc_id,))
+        return rep
+
+    # ── 조회 ──
+
+    def root(self, doc_id: str) -> str:
+        """체인의 최초 버전 (체인에 없으면 자기 자신)"""
+        rep = self._chain_of.get(doc_id)
+        return self._chains[rep][0] if rep is not None else doc_id
+
+    def latest(self, doc_id: str) -> str:
+        """체인의 최신 버전 (체인에 없으면 자기 자신)"""
+        rep = self._chain_of.get(doc_id)
+        return self._chains[rep][-1] if rep is not None else doc_id
+
+    def is_latest(self, doc_id: str) -> bool:
+        return doc_id not in self._successor
+
+    def lineage(self, doc_id: str) -> List[str]:
+        """최초 → 최신 순 전체 계보"""
+        rep = self._chain_of.get(doc_id)
+        return list(self._chains[rep]) if rep is not None else [doc_id]
+
+    def successor(self, doc_id: str) -> Optional[str]:
+        return self._successor.get(doc_id)
+
+    def predecessor(self, doc_id: str) -> Optional[str]:
+        return self._predecessor.get(doc_id)
+
+    def chains(self) -> Dict[str, List[str]]:
+        """root → 계보 (길이 2 이상인 체인만)"""
+        return {chain[0]: list(chain) for chain in self._chains.values()}
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+
+if __name__ == "__main__":
+    from simulator import generate_graph_data
+
+    idx = VersionIndex.from_graph_data(generate_graph_data())
+    print("=" * 60)
+    print("버전 체인 인덱스 (SUPERSEDES)")
+    print("=" * 60)
+    lengths: Dict[int, int] = {}
+    for chain in idx.chains().values():
+        lengths[len(chain)] = lengths.get(len(chain), 0) + 1
+    print(f"  체인 {len(idx):,}개, 길이 분포 {dict(sorted(lengths.items()))}, 이상 {len(idx.anomalies)}건")
+    for doc_id in ["DOC-TERMS-INS-SAMSUNG-PRD-LIFE-WHOLE-001", "INS-SAMSUNG-PRD-HEALTH-CANCER"]:
+        print(f"\n  {doc_id}")
+        print(f"    root:   {idx.root(doc_id)}")
+        print(f"    latest: {idx.latest(doc_id)}")
+        print(f"    lineage: {' → '.join(idx.lineage(doc_id))}")
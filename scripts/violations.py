@@ -0,0 +1,105 @@
+"""
+검증 위반 수집기
+
+위반마다 문자열을 만들어 리스트에 쌓는 대신
+(rule, code, domain) 버킷별 건수 + 버킷별 reservoir 표본만 메모리에 둔다.
+
+- 메시지는 (템플릿, 인자)로 보관하고 출력/내보내기 때에만 format
+- 전체 목록은 export_path를 지정했을 때만 JSONL로 즉시 흘려 쓴다 (메모리에 쌓지 않음)
+
+    vc = ViolationCollector(sample_size=5)
+    vc.error("ssot", "SSOT_CONFLICT", "SSOT 위반: {} {} → ACTIVE {}건", domain, key, n, domain=domain)
+    vc.count("error"), vc.buckets(), list(vc.messages(limit=10))
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from serialization import dumps
+
+ERROR = "error"
+WARNING = "warning"
+
+Bucket = Tuple[str, str, str]  # (rule, code, domain)
+
+
+class ViolationCollector:
+    """(rule, code, domain)별 건수 + reservoir 표본. export_path가 있으면 전체를 JSONL로 스트리밍"""
+
+    def __init__(self, sample_size: int = 5, export_path: Optional[str] = None, seed: int = 0):
+        self.sample_size = sample_size
+        self.export_path = export_path
+        self._counts: Dict[str, Dict[Bucket, int]] = {ERROR: {}, WARNING: {}}
+        self._samples: Dict[Tuple[str, Bucket], List[tuple]] = {}
+        self._rng = random.Random(seed)
+        self._export = open(export_path, "wb") if export_path else None
+
+    # ── 기록 ──
+
+    def error(self, rule: str, code: str, template: str, *args, domain: str = "") -> None:
+        self.add(ERROR, rule, code, template, args, domain)
+
+    def warning(self, rule: str, code: str, template: str, *args, domain: str = "") -> None:
+        self.add(WARNING, rule, code, template, args, domain)
+
+    def add(self, severity: str, rule: str, code: str, template: str, args: tuple = (), domain: str = "") -> None:
+        bucket = (rule, code, domain or "")
+        counts = self._counts[severity]
+        seen = counts.get(bucket, 0) + 1
+        counts[bucket] = seen
+
+        # reservoir sampling (Algorithm R): 버킷별 균등 표본 sample_size개
+        key = (severity, bucket)
+        sample = self._samples.setdefault(key, [])
+        if len(sample) < self.sample_size:
+            sample.append((template, args))
+        else:
+            j = self._rng.randrange(seen)
+            if j < self.sample_size:
+                sample[j] = (template, args)
+
+        if self._export is not None:
+            self._export.write(dumps({
+                "severity": severity, "rule": rule, "code": code, "domain": bucket[2],
+                "message": template.format(*args),
+            }, pretty=False, default=str) + b"\n")
+
+    def close(self) -> None:
+        if self._export is not None:
+            self._export.close()
+            self._export = None
+
+    # ── 조회 ──
+
+    def count(self, severity: str = ERROR) -> int:
+        return sum(self._counts[severity].values())
+
+    def buckets(self, severity: str = ERROR) -> Dict[Bucket, int]:
+        """버킷별 건수 (많은 순)"""
+        return dict(sorted(self._counts[severity].items(), key=lambda x: -x[1]))
+
+    def samples(self, bucket: Bucket, severity: str = ERROR) -> List[str]:
+        return [t.format(*a) for t, a in self._samples.get((severity, bucket), [])]
+
+    def messages(self, severity: str = ERROR, limit: Optional[int] = None) -> Iterator[str]:
+        """표본 메시지 (건수 많은 버킷부터, 필요한 만큼만 format)"""
+        emitted = 0
+        for bucket in self.buckets(severity):
+            for template, args in self._samples.get((severity, bucket), []):
+                if limit is not None and emitted >= limit:
+                    return
+                yield template.format(*args)
+                emitted += 1
+
+    def summary(self) -> dict:
+        """JSON 직렬화용 요약 (버킷별 건수 + 표본)"""
+        return {
+            severity: [
+                {"rule": b[0], "code": b[1], "domain": b[2], "count": n, "samples": self.samples(b, severity)}
+                for b, n in self.buckets(severity).items()
+            ]
+            for severity in (ERROR, WARNING)
+        }
+
+    def __len__(self) -> int:
+        return self.count(ERROR)